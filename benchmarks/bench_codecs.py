@@ -0,0 +1,45 @@
+import json
+import timeit
+
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.processor import LoanApplicationProcessor, LoanProcessingRules
+from src.infra.serialization.codecs import decode, get_codec, CODECS
+
+
+ITERATIONS = 50_000
+
+
+def build_application() -> LoanApplication:
+    rules = LoanProcessingRules(
+        min_amount=0,
+        max_amount=1_000_000,
+        min_term_months=1,
+        max_term_months=60,
+        approval_threshold=50_000,
+    )
+    application = LoanApplication(applicant_id="user_123", amount=75_000, term_months=24)
+    return LoanApplicationProcessor(rules).process(application)
+
+
+def legacy_round_trip(application: LoanApplication) -> LoanApplication:
+    payload = json.dumps(application.to_dict()).encode("utf-8")
+    return LoanApplication.from_dict(json.loads(payload.decode("utf-8")))
+
+
+def main() -> None:
+    application = build_application()
+
+    cases = {"legacy json (to_dict + json)": lambda: legacy_round_trip(application)}
+    for name in CODECS:
+        codec = get_codec(name)
+        cases[name] = lambda codec=codec: LoanApplication.from_dict(decode(codec.encode(application)))
+
+    print(f"{'codec':<32}{'round trips/s':>16}{'payload bytes':>16}")
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=ITERATIONS, repeat=5))
+        size = len(get_codec(name).encode(application)) if name in CODECS else len(json.dumps(application.to_dict()))
+        print(f"{name:<32}{ITERATIONS / seconds:>16,.0f}{size:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Depends
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import settings
+from src.main import app
+from src.api.dependencies import Container, create_repository, get_processing_rules
+from src.api.schemas import CreateApplicationRequest, ApplicationResponse
+from src.api.v1.applications import ApplicationController
+from src.domain.ports import Cache
+from src.domain.single_flight import SingleFlight
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.ports import LoanApplicationRepository
+from src.domain.applications.loan.cached_repository import CachedLoanApplicationRepository
+from src.domain.applications.loan.processor import LoanApplicationProcessor, LoanProcessingRules
+from src.domain.applications.loan.use_cases import (
+    SubmitApplicationUseCase,
+    GetApplicationStatusUseCase,
+    ListApplicationHistoryUseCase,
+    ExportApplicationsUseCase,
+)
+from src.infra.db.session import async_session
+from src.infra.db.loan_application.repository import PostgresLoanApplicationRepository
+from src.infra.serialization.codecs import get_codec
+from .fakes import InMemoryCache, InMemoryMessageBroker
+
+
+APPLICANT_ID = "bench_user"
+
+
+def build_legacy_app(cache: Cache, broker: InMemoryMessageBroker) -> FastAPI:
+    # The per-request dependency graph the API used before the app-scoped container
+    legacy = FastAPI()
+    single_flight = SingleFlight()
+
+    async def get_session() -> AsyncSession:
+        async with async_session() as session:
+            yield session
+
+    async def get_cache() -> Cache:
+        return cache
+
+    async def get_kafka_broker() -> InMemoryMessageBroker:
+        return broker
+
+    def get_processor(rules: LoanProcessingRules = Depends(get_processing_rules)) -> LoanApplicationProcessor:
+        return LoanApplicationProcessor(rules)
+
+    async def get_repository(
+        session: AsyncSession = Depends(get_session),
+        cache: Cache = Depends(get_cache),
+    ) -> LoanApplicationRepository:
+        return CachedLoanApplicationRepository(
+            repository=PostgresLoanApplicationRepository(session),
+            cache=cache,
+            ttl_seconds=settings.cache_ttl_seconds,
+            single_flight=single_flight,
+            early_refresh_beta=settings.cache_early_refresh_beta,
+        )
+
+    async def get_submit_use_case(
+        broker: InMemoryMessageBroker = Depends(get_kafka_broker),
+        processor: LoanApplicationProcessor = Depends(get_processor),
+    ) -> SubmitApplicationUseCase:
+        return SubmitApplicationUseCase(message_broker=broker, processor=processor, topic=settings.loan_application_topic)
+
+    async def get_status_use_case(
+        repository: LoanApplicationRepository = Depends(get_repository),
+    ) -> GetApplicationStatusUseCase:
+        return GetApplicationStatusUseCase(repository=repository)
+
+    async def get_application_controller(
+        submit_use_case: SubmitApplicationUseCase = Depends(get_submit_use_case),
+        get_status_use_case: GetApplicationStatusUseCase = Depends(get_status_use_case),
+        repository: LoanApplicationRepository = Depends(get_repository),
+    ) -> ApplicationController:
+        return ApplicationController(
+            submit_use_case=submit_use_case,
+            get_status_use_case=get_status_use_case,
+            history_use_case=ListApplicationHistoryUseCase(repository=repository),
+            export_use_case=ExportApplicationsUseCase(repository=repository),
+        )
+
+    @legacy.post("/api/v1/applications", response_model=ApplicationResponse, status_code=202)
+    async def create_application(
+        request: CreateApplicationRequest,
+        controller: ApplicationController = Depends(get_application_controller),
+    ):
+        return await controller.create(request)
+
+    @legacy.get("/api/v1/applications/{applicant_id}", response_model=ApplicationResponse)
+    async def get_application(
+        applicant_id: str,
+        controller: ApplicationController = Depends(get_application_controller),
+    ):
+        return await controller.get_by_applicant_id(applicant_id)
+
+    return legacy
+
+
+async def time_requests(target: FastAPI, method: str, requests: int) -> float:
+    transport = ASGITransport(app=target)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def send() -> None:
+            if method == "GET":
+                response = await client.get(f"/api/v1/applications/{APPLICANT_ID}")
+            else:
+                response = await client.post(
+                    "/api/v1/applications",
+                    json={"applicant_id": APPLICANT_ID, "amount": 10_000, "term_months": 12},
+                )
+            response.raise_for_status()
+
+        for _ in range(min(requests, 500)):
+            await send()
+
+        started = time.perf_counter()
+        for _ in range(requests):
+            await send()
+        return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def run(requests: int) -> None:
+    # Cache hits on GET and an in-memory broker on POST: no I/O, so the numbers are framework and wiring cost
+    cache = InMemoryCache()
+    broker = InMemoryMessageBroker(get_codec(settings.kafka_codec))
+    application = LoanApplication(applicant_id=APPLICANT_ID, amount=10_000, term_months=12)
+    await cache.set(f"loan_application:{APPLICANT_ID}", application.to_dict())
+
+    app.state.container = Container(cache=cache, broker=broker, repository=create_repository(cache))
+    legacy = build_legacy_app(cache, broker)
+
+    print(f"{'request':<10}{'per-request graph us':>22}{'app container us':>20}{'saved us':>12}")
+    for method in ("GET", "POST"):
+        before = min([await time_requests(legacy, method, requests) for _ in range(3)])
+        after = min([await time_requests(app, method, requests) for _ in range(3)])
+        print(f"{method:<10}{before:>22.1f}{after:>20.1f}{before - after:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-request overhead of the API dependency wiring")
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import random
+import timeit
+
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.processor import LoanApplicationProcessor, LoanProcessingRules
+
+
+BATCH_SIZE = 500
+REPEAT = 5
+
+
+def build_batch(rejected_share: float) -> list[LoanApplication]:
+    rng = random.Random(42)
+    applications = []
+    for index in range(BATCH_SIZE):
+        # Half of the rejections fail validation, half only exceed the approval threshold
+        roll = rng.random()
+        if roll < rejected_share / 2:
+            amount = -1.0
+        elif roll < rejected_share:
+            amount = 75_000.0
+        else:
+            amount = 10_000.0
+        applications.append(LoanApplication(applicant_id=f"user_{index}", amount=amount, term_months=12))
+    return applications
+
+
+def main() -> None:
+    processor = LoanApplicationProcessor(LoanProcessingRules(
+        min_amount=0,
+        max_amount=1_000_000,
+        min_term_months=1,
+        max_term_months=60,
+        approval_threshold=50_000,
+    ))
+
+    print(f"{'rejected':>10}{'process() items/s':>20}{'process_many() items/s':>24}")
+    for rejected_share in (0.0, 0.2, 0.5, 0.9):
+        applications = build_batch(rejected_share)
+        number = max(20_000 // BATCH_SIZE, 1)
+
+        scalar = min(timeit.repeat(
+            lambda: [processor.process(application) for application in applications],
+            number=number,
+            repeat=REPEAT,
+        ))
+        batched = min(timeit.repeat(lambda: processor.process_many(applications), number=number, repeat=REPEAT))
+
+        items = number * BATCH_SIZE
+        print(f"{rejected_share:>10.0%}{items / scalar:>20,.0f}{items / batched:>24,.0f}")
+
+
+if __name__ == "__main__":
+    main()
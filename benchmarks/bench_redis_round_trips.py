@@ -0,0 +1,178 @@
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from src.domain.ports import Cache, DedupeStore
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.cached_repository import CachedLoanApplicationRepository
+from src.domain.applications.loan.processor import LoanApplicationProcessor, LoanProcessingRules
+from src.domain.applications.loan.rules import CompiledRuleSet
+from src.domain.applications.loan.use_cases import ProcessApplicationUseCase
+from .fakes import InMemoryCache, InMemoryLoanApplicationRepository
+
+
+RULES = LoanProcessingRules(
+    min_amount=0,
+    max_amount=1_000_000,
+    min_term_months=1,
+    max_term_months=60,
+    approval_threshold=50_000,
+)
+
+# Any previous_* predicate makes the processor fetch history, i.e. one more cache read per message
+HISTORY_RULES = {
+    "rules": [{
+        "name": "recently_rejected",
+        "when": {"previous_status": {"eq": "rejected"}},
+        "then": {"status": "rejected", "reason": "Previous application was rejected"},
+    }],
+    "default": {"status": "approved"},
+}
+
+
+class CountingCache(Cache):
+
+    # Counts what RedisCache would send: every call is one round trip (set_many is one pipeline),
+    # commands are what that round trip carries
+    def __init__(self, cache: Cache, publish_invalidations: bool):
+        self._cache = cache
+        self._publish = publish_invalidations
+        self.round_trips = 0
+        self.commands = 0
+
+    def _count(self, commands: int) -> None:
+        self.round_trips += 1
+        self.commands += commands
+
+    async def get(self, key: str) -> Any | None:
+        self._count(1)
+        return await self._cache.get(key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        if keys:
+            self._count(1)
+        return await self._cache.get_many(keys)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        self._count(2 if self._publish else 1)
+        await self._cache.set(key, value, ttl_seconds)
+
+    async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        if items:
+            self._count(len(items) * (2 if self._publish else 1))
+        await self._cache.set_many(items, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self._count(2 if self._publish else 1)
+        await self._cache.delete(key)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        if keys:
+            self._count(1 + (len(keys) if self._publish else 0))
+        await self._cache.delete_many(keys)
+
+
+class CountingDedupeStore(DedupeStore):
+
+    def __init__(self, cache: CountingCache):
+        self._cache = cache
+        self._seen: set[str] = set()
+
+    # Shares the cache's counters: RedisDedupeStore talks to the same Redis
+    async def seen_many(self, keys: list[str]) -> set[str]:
+        if keys:
+            self._cache._count(1)
+        return self._seen.intersection(keys)
+
+    async def mark_many(self, keys: list[str]) -> None:
+        if keys:
+            self._cache._count(len(keys))
+        self._seen.update(keys)
+
+
+def build_batch(size: int, batch_index: int) -> list[dict]:
+    # Half of the applicants come back from the previous batch, so history lookups hit about half the time
+    return [
+        LoanApplication(
+            applicant_id=f"user_{batch_index * size // 2 + index}",
+            amount=10_000 + index,
+            term_months=12,
+        ).to_dict()
+        for index in range(size)
+    ]
+
+
+async def count_round_trips(batch_size: int, history: bool, dedupe: bool, batched: bool, batches: int) -> tuple[float, float]:
+    cache = CountingCache(InMemoryCache(), publish_invalidations=True)
+    repository = CachedLoanApplicationRepository(InMemoryLoanApplicationRepository(), cache, ttl_seconds=3600)
+    decision_rules = CompiledRuleSet.compile(HISTORY_RULES) if history else None
+    processor = LoanApplicationProcessor(RULES, decision_rules=decision_rules)
+    use_case = ProcessApplicationUseCase(repository, processor, CountingDedupeStore(cache) if dedupe else None)
+
+    for batch_index in range(batches):
+        messages = build_batch(batch_size, batch_index)
+        if batched:
+            await use_case.execute_many(messages)
+        else:
+            for message in messages:
+                await use_case.execute(message)
+
+    return cache.round_trips / batches, cache.commands / batches
+
+
+async def time_against_redis(batch_size: int, batches: int) -> None:
+    from src.infra.cache.redis import RedisCache
+    from src.infra.cache.dedupe import RedisDedupeStore
+
+    cache = RedisCache(publish_invalidations=True)
+    dedupe_store = RedisDedupeStore()
+    await cache.connect()
+    await dedupe_store.connect()
+
+    try:
+        repository = CachedLoanApplicationRepository(InMemoryLoanApplicationRepository(), cache, ttl_seconds=60)
+        processor = LoanApplicationProcessor(RULES, decision_rules=CompiledRuleSet.compile(HISTORY_RULES))
+        use_case = ProcessApplicationUseCase(repository, processor, dedupe_store)
+
+        print(f"\nAgainst {type(cache).__name__}, {batch_size} messages per batch, history + dedupe on")
+        for name, batched in (("per message", False), ("batched", True)):
+            started = time.perf_counter()
+            for batch_index in range(batches):
+                messages = build_batch(batch_size, batch_index + (batches if batched else 0))
+                if batched:
+                    await use_case.execute_many(messages)
+                else:
+                    for message in messages:
+                        await use_case.execute(message)
+            elapsed = (time.perf_counter() - started) / batches
+            print(f"{name:<14}{elapsed * 1000:>10.1f} ms/batch")
+    finally:
+        await cache.disconnect()
+        await dedupe_store.disconnect()
+
+
+async def main(batch_sizes: list[int], batches: int, redis: bool) -> None:
+    print(f"{'batch':>6}{'history':>9}{'dedupe':>8}{'per-msg RTT':>13}{'batched RTT':>13}{'saved':>8}{'per-msg cmds':>14}{'batched cmds':>14}")
+    for batch_size in batch_sizes:
+        for history, dedupe in ((False, False), (True, False), (False, True), (True, True)):
+            single_trips, single_commands = await count_round_trips(batch_size, history, dedupe, False, batches)
+            batch_trips, batch_commands = await count_round_trips(batch_size, history, dedupe, True, batches)
+            print(
+                f"{batch_size:>6}{'on' if history else 'off':>9}{'on' if dedupe else 'off':>8}"
+                f"{single_trips:>13,.0f}{batch_trips:>13,.0f}{single_trips - batch_trips:>8,.0f}"
+                f"{single_commands:>14,.0f}{batch_commands:>14,.0f}"
+            )
+
+    if redis:
+        await time_against_redis(max(batch_sizes), batches)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Redis round trips per consumer batch")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--batches", type=int, default=5)
+    parser.add_argument("--redis", action="store_true", help="Also time both paths against REDIS_URL")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.batch_sizes, args.batches, args.redis))
@@ -0,0 +1,86 @@
+import operator
+import random
+import timeit
+
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.processor import LoanApplicationProcessor, LoanProcessingRules
+from src.domain.applications.loan.rules import CompiledRuleSet
+
+
+APPLICATIONS = 5_000
+REPEAT = 5
+
+RULES = LoanProcessingRules(
+    min_amount=0,
+    max_amount=1_000_000,
+    min_term_months=1,
+    max_term_months=60,
+    approval_threshold=50_000,
+)
+
+# Decides exactly like the hand-coded approval threshold, plus two extra rules to walk past
+DEFINITION = {
+    "rules": [
+        {
+            "name": "long_term_large_amount",
+            "when": {"amount": {"gt": 900_000}, "term_months": {"gt": 59}},
+            "then": {"status": "rejected", "reason": "Amount exceeds approval threshold of 50000"},
+        },
+        {
+            "name": "tiny_amount",
+            "when": {"amount": {"lt": 0}},
+            "then": {"status": "rejected", "reason": "unreachable after validation"},
+        },
+        {
+            "name": "over_threshold",
+            "when": {"amount": {"gt": 50_000}},
+            "then": {"status": "rejected", "reason": "Amount exceeds approval threshold of 50000"},
+        },
+    ],
+    "default": {"status": "approved"},
+}
+
+OPERATORS = {"lt": operator.lt, "lte": operator.le, "gt": operator.gt, "gte": operator.ge, "eq": operator.eq}
+
+
+def interpret(definition: dict, application: LoanApplication) -> dict:
+    # What evaluating the definition per message would cost without compiling it
+    for rule in definition["rules"]:
+        if all(
+            OPERATORS[op](getattr(application, field), value)
+            for field, predicates in rule["when"].items()
+            for op, value in predicates.items()
+        ):
+            return rule["then"]
+    return definition["default"]
+
+
+def build_applications() -> list[LoanApplication]:
+    rng = random.Random(42)
+    return [
+        LoanApplication(applicant_id=f"user_{index}", amount=rng.uniform(1, 100_000), term_months=rng.randint(1, 60))
+        for index in range(APPLICATIONS)
+    ]
+
+
+def main() -> None:
+    applications = build_applications()
+    hand_coded = LoanApplicationProcessor(RULES)
+    compiled = LoanApplicationProcessor(RULES, decision_rules=CompiledRuleSet.compile(DEFINITION))
+
+    cases = {
+        "hand-coded process()": lambda: [hand_coded.process(application) for application in applications],
+        "compiled process()": lambda: [compiled.process(application) for application in applications],
+        "interpreted rules": lambda: [interpret(DEFINITION, application) for application in applications],
+        "hand-coded process_many()": lambda: hand_coded.process_many(applications),
+        "compiled process_many()": lambda: compiled.process_many(applications),
+    }
+
+    print(f"{'path':<28}{'decisions/s':>14}")
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=REPEAT))
+        print(f"{name:<28}{APPLICATIONS / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
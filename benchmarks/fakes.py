@@ -0,0 +1,164 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable
+from uuid import UUID
+
+from src.domain.ports import Cache, MessageBroker, MessageConsumer, ConsumedMessage
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.ports import LoanApplicationRepository
+from src.infra.serialization.codecs import Codec, decode
+
+
+class InMemoryMessageBroker(MessageBroker):
+
+    def __init__(self, codec: Codec):
+        self._codec = codec
+        self.topics: dict[str, list[tuple[str | None, bytes]]] = defaultdict(list)
+
+    async def publish(self, topic: str, message: Any, key: str | None = None) -> None:
+        self.topics[topic].append((key, self._codec.encode(message)))
+
+    async def publish_many(self, topic: str, messages: list[tuple[str | None, Any]]) -> None:
+        for key, message in messages:
+            await self.publish(topic, message, key)
+
+
+class InMemoryMessageConsumer(MessageConsumer):
+
+    def __init__(self, broker: InMemoryMessageBroker, topic: str):
+        self._broker = broker
+        self._topic = topic
+        self._position = 0
+        self._running = True
+        self.committed = 0
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def interrupt(self) -> None:
+        self._running = False
+
+    def set_revocation_handler(self, handler) -> None:
+        pass
+
+    async def messages(self) -> AsyncIterator[dict]:
+        async for record in self.records():
+            yield record.value
+
+    async def records(self) -> AsyncIterator[ConsumedMessage]:
+        log = self._broker.topics[self._topic]
+        while self._running and self._position < len(log):
+            key, payload = log[self._position]
+            yield ConsumedMessage(
+                topic=self._topic,
+                partition=0,
+                offset=self._position,
+                key=key,
+                value=decode(payload),
+            )
+            self._position += 1
+
+    async def batches(self, max_records: int | Callable[[], int], linger_ms: int) -> AsyncIterator[list[dict]]:
+        log = self._broker.topics[self._topic]
+        while self._running and self._position < len(log):
+            limit = max_records() if callable(max_records) else max_records
+            end = min(self._position + limit, len(log))
+            yield [decode(payload) for _, payload in log[self._position:end]]
+            self._position = end
+
+    async def commit(self, offsets: dict[tuple[str, int], int] | None = None) -> None:
+        self.committed = self._position
+
+    async def lag(self) -> dict[tuple[str, int], int]:
+        return {(self._topic, 0): len(self._broker.topics[self._topic]) - self.committed}
+
+
+class InMemoryCache(Cache):
+
+    def __init__(self):
+        self._values: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any | None:
+        return self._values.get(key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        return {key: self._values[key] for key in keys if key in self._values}
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        self._values[key] = value
+
+    async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        self._values.update(items)
+
+    async def delete(self, key: str) -> None:
+        self._values.pop(key, None)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+
+
+class InMemoryLoanApplicationRepository(LoanApplicationRepository):
+
+    def __init__(self):
+        self._by_id: dict[UUID, LoanApplication] = {}
+        self._latest: dict[str, LoanApplication] = {}
+
+    async def save(self, entity: LoanApplication) -> LoanApplication:
+        self._by_id[entity.id] = entity
+        latest = self._latest.get(entity.applicant_id)
+        if latest is None or entity.created_at >= latest.created_at:
+            self._latest[entity.applicant_id] = entity
+        return entity
+
+    async def save_many(self, entities: list[LoanApplication]) -> list[LoanApplication]:
+        return [await self.save(entity) for entity in entities]
+
+    async def get_by_id(self, entity_id: UUID) -> LoanApplication | None:
+        return self._by_id.get(entity_id)
+
+    async def get_by_applicant_id(
+        self,
+        applicant_id: str,
+        created_after: datetime | None = None,
+    ) -> LoanApplication | None:
+        latest = self._latest.get(applicant_id)
+        if latest is None or (created_after is not None and latest.created_at < created_after):
+            return None
+        return latest
+
+    async def get_many_by_applicant_ids(self, applicant_ids: list[str]) -> dict[str, LoanApplication]:
+        return {applicant_id: self._latest[applicant_id] for applicant_id in applicant_ids if applicant_id in self._latest}
+
+    async def list_by_applicant_id(
+        self,
+        applicant_id: str,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[LoanApplication]:
+        history = sorted(
+            (entity for entity in self._by_id.values() if entity.applicant_id == applicant_id),
+            key=lambda entity: (entity.created_at, entity.id),
+            reverse=True,
+        )
+        if after is not None:
+            history = [entity for entity in history if (entity.created_at, entity.id) < after]
+        return history[:limit]
+
+    async def stream(
+        self,
+        applicant_id: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[LoanApplication]:
+        for entity in list(self._by_id.values()):
+            if applicant_id is not None and entity.applicant_id != applicant_id:
+                continue
+            if created_from is not None and entity.created_at < created_from:
+                continue
+            if created_to is not None and entity.created_at >= created_to:
+                continue
+            yield entity
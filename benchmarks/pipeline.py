@@ -0,0 +1,270 @@
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable
+
+from src.core import settings
+from src.domain.ports import Cache
+from src.domain.applications.loan.cached_repository import CachedLoanApplicationRepository
+from src.domain.applications.loan.ports import LoanApplicationRepository
+from src.domain.applications.loan.processor import LoanApplicationProcessor, LoanProcessingRules
+from src.domain.applications.loan.use_cases import (
+    SubmitApplicationUseCase,
+    ProcessApplicationUseCase,
+    GetApplicationStatusUseCase,
+)
+from src.infra.serialization.codecs import get_codec
+from .fakes import InMemoryCache, InMemoryLoanApplicationRepository, InMemoryMessageBroker, InMemoryMessageConsumer
+
+
+TOPIC = "loan-applications"
+
+RepositoryScope = Callable[[], AsyncIterator[LoanApplicationRepository]]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    ops: int
+    items_per_op: int
+    ops_per_sec: float
+    items_per_sec: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    alloc_peak_bytes_per_op: float
+    retained_bytes_per_op: float
+
+
+def percentile(sorted_values: list[int], fraction: float) -> float:
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index] / 1000
+
+
+async def measure(
+    name: str,
+    op: Callable[[int], Awaitable[None]],
+    ops: int,
+    alloc_samples: int,
+    items_per_op: int = 1,
+) -> ScenarioResult:
+    latencies = []
+
+    gc.collect()
+    started = time.perf_counter()
+    for index in range(ops):
+        op_started = time.perf_counter_ns()
+        await op(index)
+        latencies.append(time.perf_counter_ns() - op_started)
+    elapsed = time.perf_counter() - started
+
+    # Allocation sampling runs as a separate pass because tracemalloc slows every allocation down
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    peaks = []
+    for index in range(ops, ops + alloc_samples):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await op(index)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    latencies.sort()
+    return ScenarioResult(
+        name=name,
+        ops=ops,
+        items_per_op=items_per_op,
+        ops_per_sec=ops / elapsed,
+        items_per_sec=ops * items_per_op / elapsed,
+        p50_us=percentile(latencies, 0.50),
+        p95_us=percentile(latencies, 0.95),
+        p99_us=percentile(latencies, 0.99),
+        alloc_peak_bytes_per_op=statistics.fmean(peaks) if peaks else 0.0,
+        retained_bytes_per_op=retained / alloc_samples if alloc_samples else 0.0,
+    )
+
+
+def build_processor() -> LoanApplicationProcessor:
+    return LoanApplicationProcessor(LoanProcessingRules(
+        min_amount=settings.loan_min_amount,
+        max_amount=settings.loan_max_amount,
+        min_term_months=settings.loan_min_term_months,
+        max_term_months=settings.loan_max_term_months,
+        approval_threshold=settings.loan_approval_threshold,
+    ))
+
+
+def memory_backend() -> tuple[Cache, RepositoryScope, Callable[[], Awaitable[None]]]:
+    cache = InMemoryCache()
+    repository = CachedLoanApplicationRepository(
+        repository=InMemoryLoanApplicationRepository(),
+        cache=cache,
+        ttl_seconds=settings.cache_ttl_seconds,
+    )
+
+    @asynccontextmanager
+    async def scope():
+        yield repository
+
+    async def close():
+        pass
+
+    return cache, scope, close
+
+
+async def local_backend() -> tuple[Cache, RepositoryScope, Callable[[], Awaitable[None]]]:
+    from src.infra.cache.redis import RedisCache
+    from src.infra.db.session import async_session, init_db, close_db
+    from src.infra.db.loan_application.repository import PostgresLoanApplicationRepository
+
+    await init_db()
+    cache = RedisCache()
+    await cache.connect()
+
+    @asynccontextmanager
+    async def scope():
+        async with async_session() as session:
+            yield CachedLoanApplicationRepository(
+                repository=PostgresLoanApplicationRepository(session),
+                cache=cache,
+                ttl_seconds=settings.cache_ttl_seconds,
+            )
+
+    async def close():
+        await cache.disconnect()
+        await close_db()
+
+    return cache, scope, close
+
+
+async def run(ops: int, alloc_samples: int, batch_size: int, backend: str) -> list[ScenarioResult]:
+    if backend == "local":
+        _, scope, close = await local_backend()
+    else:
+        _, scope, close = memory_backend()
+
+    processor = build_processor()
+    broker = InMemoryMessageBroker(get_codec(settings.kafka_codec))
+    submit = SubmitApplicationUseCase(message_broker=broker, processor=processor, topic=TOPIC)
+    applicants = max(ops // 10, 1)
+    results = []
+
+    try:
+        async def submit_op(index: int) -> None:
+            await submit.execute(
+                applicant_id=f"bench_{index % applicants}",
+                amount=1_000 + (index * 7919) % 99_000,
+                term_months=1 + index % 60,
+            )
+
+        batch_ops = max(ops // batch_size, 1)
+        batch_alloc_samples = max(alloc_samples // batch_size, 1)
+
+        # Enough messages for both consume scenarios, including their allocation passes
+        total_messages = ops + alloc_samples + (batch_ops + batch_alloc_samples) * batch_size
+        results.append(await measure("submit", submit_op, ops, alloc_samples))
+        for index in range(ops + alloc_samples, total_messages):
+            await submit_op(index)
+
+        consumer = InMemoryMessageConsumer(broker, TOPIC)
+        messages = consumer.messages()
+
+        async def consume_op(index: int) -> None:
+            message = await anext(messages)
+            async with scope() as repository:
+                await ProcessApplicationUseCase(repository, processor).execute(message)
+
+        results.append(await measure("consume", consume_op, ops, alloc_samples))
+
+        batches = consumer.batches(max_records=batch_size, linger_ms=0)
+
+        async def consume_batch_op(index: int) -> None:
+            batch = await anext(batches)
+            async with scope() as repository:
+                await ProcessApplicationUseCase(repository, processor).execute_many(batch)
+            await consumer.commit()
+
+        results.append(
+            await measure("consume_batch", consume_batch_op, batch_ops, batch_alloc_samples, batch_size)
+        )
+
+        async def query_op(index: int) -> None:
+            async with scope() as repository:
+                await GetApplicationStatusUseCase(repository).execute(f"bench_{index % applicants}")
+
+        results.append(await measure("query", query_op, ops, alloc_samples))
+    finally:
+        await close()
+
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(results: list[ScenarioResult], baseline: dict | None) -> None:
+    previous = {result["name"]: result for result in baseline["results"]} if baseline else {}
+
+    print(f"{'scenario':<16}{'items/s':>12}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}{'peak B/item':>12}{'vs base':>10}")
+    for result in results:
+        delta = ""
+        if result.name in previous:
+            change = result.items_per_sec / previous[result.name]["items_per_sec"] - 1
+            delta = f"{change:+.1%}"
+        print(
+            f"{result.name:<16}{result.items_per_sec:>12,.0f}{result.p50_us:>10.1f}{result.p95_us:>10.1f}"
+            f"{result.p99_us:>10.1f}{result.alloc_peak_bytes_per_op / result.items_per_op:>12,.0f}{delta:>10}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the submit -> consume -> query pipeline")
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--alloc-samples", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=settings.kafka_consumer_batch_size)
+    parser.add_argument("--backend", choices=["memory", "local"], default="memory")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="Previous JSON results to compare against")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.ops, args.alloc_samples, args.batch_size, args.backend))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "kafka_codec": settings.kafka_codec,
+            "results": [asdict(result) for result in results],
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
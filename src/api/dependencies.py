@@ -1,25 +1,56 @@
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
 
 from src.core import settings
-from src.infra.db.session import get_session
-from src.infra.db.loan_application.repository import PostgresLoanApplicationRepository
+from src.infra.db.session import async_session
+from src.infra.db.loan_application.repository import LazySessionLoanApplicationRepository
+from src.infra.db.outbox.broker import OutboxMessageBroker
+from src.infra.db.replicas import ReplicaRouter
+from src.infra.cache.recent_writes import RedisRecentWrites
 from src.infra.cache.redis import RedisCache
+from src.infra.cache.memory import InMemoryLRUCache
+from src.infra.cache.tiered import TieredCache
 from src.infra.messaging.kafka import KafkaMessageBroker
 from src.domain.ports import Cache
+from src.domain.single_flight import SingleFlight
 from src.domain.applications.loan.ports import LoanApplicationRepository
 from src.domain.applications.loan.cached_repository import CachedLoanApplicationRepository
 from src.domain.applications.loan.processor import LoanApplicationProcessor, LoanProcessingRules
 from src.domain.applications.loan.use_cases import (
     SubmitApplicationUseCase,
     GetApplicationStatusUseCase,
+    ListApplicationHistoryUseCase,
+    ExportApplicationsUseCase,
 )
 from src.api.v1.applications import ApplicationController
 
 
-# Singletons
-_redis_cache: RedisCache | None = None
-_kafka_broker: KafkaMessageBroker | None = None
+class Container:
+
+    # Built once per process in lifespan; everything it holds is stateless or safe to share between requests
+    def __init__(
+        self,
+        cache: RedisCache | TieredCache,
+        broker: KafkaMessageBroker | OutboxMessageBroker,
+        repository: LoanApplicationRepository,
+        replicas: ReplicaRouter | None = None,
+        recent_writes: RedisRecentWrites | None = None,
+    ):
+        self.cache = cache
+        self.broker = broker
+        self.repository = repository
+        self.replicas = replicas
+        self.recent_writes = recent_writes
+        self.processor = LoanApplicationProcessor(get_processing_rules())
+        self.controller = ApplicationController(
+            submit_use_case=SubmitApplicationUseCase(
+                message_broker=broker,
+                processor=self.processor,
+                topic=settings.loan_application_topic,
+            ),
+            get_status_use_case=GetApplicationStatusUseCase(repository=repository),
+            history_use_case=ListApplicationHistoryUseCase(repository=repository),
+            export_use_case=ExportApplicationsUseCase(repository=repository),
+        )
 
 
 def get_processing_rules() -> LoanProcessingRules:
@@ -32,72 +63,71 @@ def get_processing_rules() -> LoanProcessingRules:
     )
 
 
-async def get_cache() -> Cache:
-    global _redis_cache
-    if _redis_cache is None:
-        _redis_cache = RedisCache()
-        await _redis_cache.connect()
-    return _redis_cache
+async def create_cache() -> RedisCache | TieredCache:
+    if settings.cache_l1_enabled:
+        cache = TieredCache(l1=InMemoryLRUCache(), l2=RedisCache())
+    else:
+        cache = RedisCache()
+    await cache.connect()
+    return cache
 
 
-async def get_kafka_broker() -> KafkaMessageBroker:
-    global _kafka_broker
-    if _kafka_broker is None:
-        _kafka_broker = KafkaMessageBroker()
-        await _kafka_broker.connect()
-    return _kafka_broker
+async def create_kafka_broker() -> KafkaMessageBroker | OutboxMessageBroker:
+    # In outbox mode a submission is a local INSERT; Kafka outages only delay the relay
+    if settings.outbox_enabled:
+        broker = OutboxMessageBroker(async_session)
+    else:
+        broker = KafkaMessageBroker()
+    await broker.connect()
+    return broker
 
 
-def get_processor(rules: LoanProcessingRules = Depends(get_processing_rules)) -> LoanApplicationProcessor:
-    return LoanApplicationProcessor(rules)
+async def create_replicas() -> tuple[ReplicaRouter | None, RedisRecentWrites | None]:
+    if not settings.db_replica_urls:
+        return None, None
 
+    replicas = ReplicaRouter(settings.db_replica_urls)
+    await replicas.start()
+    recent_writes = RedisRecentWrites()
+    await recent_writes.connect()
+    return replicas, recent_writes
 
-async def get_repository(
-    session: AsyncSession = Depends(get_session),
-    cache: Cache = Depends(get_cache),
+
+def create_repository(
+    cache: Cache,
+    replicas: ReplicaRouter | None = None,
+    recent_writes: RedisRecentWrites | None = None,
 ) -> LoanApplicationRepository:
-    postgres_repo = PostgresLoanApplicationRepository(session)
     return CachedLoanApplicationRepository(
-        repository=postgres_repo,
+        repository=LazySessionLoanApplicationRepository(async_session, replicas, recent_writes),
         cache=cache,
         ttl_seconds=settings.cache_ttl_seconds,
+        single_flight=SingleFlight(),
+        early_refresh_beta=settings.cache_early_refresh_beta,
     )
 
 
-async def get_submit_use_case(
-    broker: KafkaMessageBroker = Depends(get_kafka_broker),
-    processor: LoanApplicationProcessor = Depends(get_processor),
-) -> SubmitApplicationUseCase:
-    return SubmitApplicationUseCase(
-        message_broker=broker,
-        processor=processor,
-        topic=settings.loan_application_topic,
-    )
-
-
-async def get_status_use_case(
-    repository: LoanApplicationRepository = Depends(get_repository),
-) -> GetApplicationStatusUseCase:
-    return GetApplicationStatusUseCase(repository=repository)
-
-
-async def get_application_controller(
-    submit_use_case: SubmitApplicationUseCase = Depends(get_submit_use_case),
-    get_status_use_case: GetApplicationStatusUseCase = Depends(get_status_use_case),
-) -> ApplicationController:
-    return ApplicationController(
-        submit_use_case=submit_use_case,
-        get_status_use_case=get_status_use_case,
+async def create_container() -> Container:
+    cache = await create_cache()
+    broker = await create_kafka_broker()
+    replicas, recent_writes = await create_replicas()
+    return Container(
+        cache=cache,
+        broker=broker,
+        repository=create_repository(cache, replicas, recent_writes),
+        replicas=replicas,
+        recent_writes=recent_writes,
     )
 
 
-async def cleanup():
-    global _redis_cache, _kafka_broker
+async def close_container(container: Container) -> None:
+    await container.cache.disconnect()
+    await container.broker.disconnect()
+    if container.replicas:
+        await container.replicas.dispose()
+    if container.recent_writes:
+        await container.recent_writes.disconnect()
 
-    if _redis_cache:
-        await _redis_cache.disconnect()
-        _redis_cache = None
 
-    if _kafka_broker:
-        await _kafka_broker.disconnect()
-        _kafka_broker = None
+def get_application_controller(request: Request) -> ApplicationController:
+    return request.app.state.container.controller
@@ -1,3 +1,5 @@
+from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -23,6 +25,30 @@ class ApplicationResponse(BaseModel):
         from_attributes = True
 
 
+class BatchStatusRequest(BaseModel):
+    applicant_ids: list[str] = Field(..., min_length=1, max_length=1000)
+
+
+class BatchStatusResponse(BaseModel):
+    applications: list[ApplicationResponse]
+    not_found: list[str]
+
+
+class ApplicationHistoryItem(ApplicationResponse):
+    created_at: datetime
+    processed_at: datetime | None = None
+
+
+class ApplicationHistoryResponse(BaseModel):
+    applications: list[ApplicationHistoryItem]
+    next_cursor: str | None = None
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class ErrorResponse(BaseModel):
     error: str
     message: str
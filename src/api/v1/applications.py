@@ -1,8 +1,30 @@
-from fastapi import APIRouter, HTTPException, status
+import base64
+from datetime import datetime, timezone
+from uuid import UUID
 
-from src.domain.applications.loan.use_cases import SubmitApplicationUseCase, GetApplicationStatusUseCase
+import orjson
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from src.domain.applications.loan.use_cases import (
+    SubmitApplicationUseCase,
+    GetApplicationStatusUseCase,
+    ListApplicationHistoryUseCase,
+    ExportApplicationsUseCase,
+)
 from src.domain.exceptions import ValidationError
-from src.api.schemas import CreateApplicationRequest, ApplicationResponse, ErrorResponse
+from src.domain.applications.loan.entity import LoanApplication
+from src.api.schemas import (
+    CreateApplicationRequest,
+    ApplicationResponse,
+    BatchStatusRequest,
+    BatchStatusResponse,
+    ApplicationHistoryItem,
+    ApplicationHistoryResponse,
+    ExportFormat,
+    ErrorResponse,
+)
+from .exports import ndjson_chunks, csv_chunks
 
 
 router = APIRouter(prefix="/applications", tags=["applications"])
@@ -14,9 +36,13 @@ class ApplicationController:
         self,
         submit_use_case: SubmitApplicationUseCase,
         get_status_use_case: GetApplicationStatusUseCase,
+        history_use_case: ListApplicationHistoryUseCase,
+        export_use_case: ExportApplicationsUseCase,
     ):
         self._submit_use_case = submit_use_case
         self._get_status_use_case = get_status_use_case
+        self._history_use_case = history_use_case
+        self._export_use_case = export_use_case
 
     async def create(self, request: CreateApplicationRequest) -> ApplicationResponse:
         try:
@@ -26,14 +52,7 @@ class ApplicationController:
                 term_months=request.term_months,
             )
 
-            return ApplicationResponse(
-                id=application.id,
-                applicant_id=application.applicant_id,
-                amount=application.amount,
-                term_months=application.term_months,
-                status=application.status,
-                rejection_reason=application.rejection_reason,
-            )
+            return self._to_response(application)
 
         except ValidationError as e:
             raise HTTPException(
@@ -41,8 +60,8 @@ class ApplicationController:
                 detail={"error": "validation_error", "message": e.message, "field": e.field},
             )
 
-    async def get_by_applicant_id(self, applicant_id: str) -> ApplicationResponse:
-        application = await self._get_status_use_case.execute(applicant_id)
+    async def get_by_applicant_id(self, applicant_id: str, created_after: datetime | None = None) -> ApplicationResponse:
+        application = await self._get_status_use_case.execute(applicant_id, self._to_naive_utc(created_after))
 
         if not application:
             raise HTTPException(
@@ -50,6 +69,97 @@ class ApplicationController:
                 detail={"error": "not_found", "message": f"Application for '{applicant_id}' not found"},
             )
 
+        return self._to_response(application)
+
+    async def get_statuses(self, request: BatchStatusRequest) -> BatchStatusResponse:
+        applicant_ids = list(dict.fromkeys(request.applicant_ids))
+        applications = await self._get_status_use_case.execute_many(applicant_ids)
+
+        return BatchStatusResponse(
+            applications=[
+                self._to_response(applications[applicant_id])
+                for applicant_id in applicant_ids
+                if applicant_id in applications
+            ],
+            not_found=[applicant_id for applicant_id in applicant_ids if applicant_id not in applications],
+        )
+
+    async def get_history(self, applicant_id: str, limit: int, cursor: str | None = None) -> ApplicationHistoryResponse:
+        page = await self._history_use_case.execute(applicant_id, limit, self._decode_cursor(cursor))
+
+        return ApplicationHistoryResponse(
+            applications=[self._to_history_item(application) for application in page.applications],
+            next_cursor=self._encode_cursor(page.next_after) if page.next_after else None,
+        )
+
+    async def export(
+        self,
+        format: ExportFormat = ExportFormat.NDJSON,
+        applicant_id: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> StreamingResponse:
+        # Checked up front: an error inside the stream would only truncate a response already sent as 200
+        created_from, created_to = self._to_naive_utc(created_from), self._to_naive_utc(created_to)
+        if created_from and created_to and created_from > created_to:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "invalid_range", "message": "created_from is after created_to", "field": "created_from"},
+            )
+
+        applications = self._export_use_case.execute(applicant_id, created_from, created_to)
+
+        if format == ExportFormat.CSV:
+            return StreamingResponse(
+                csv_chunks(applications),
+                media_type="text/csv",
+                headers={"Content-Disposition": 'attachment; filename="loan_applications.csv"'},
+            )
+
+        return StreamingResponse(ndjson_chunks(applications), media_type="application/x-ndjson")
+
+    @staticmethod
+    def _to_naive_utc(moment: datetime | None) -> datetime | None:
+        # created_at is stored as naive UTC; an offset from the query string would fail every comparison with it
+        if moment is None or moment.tzinfo is None:
+            return moment
+        return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def _encode_cursor(after: tuple[datetime, UUID]) -> str:
+        created_at, application_id = after
+        payload = orjson.dumps([created_at.isoformat(), str(application_id)])
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str | None) -> tuple[datetime, UUID] | None:
+        if not cursor:
+            return None
+
+        try:
+            created_at, application_id = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            return ApplicationController._to_naive_utc(datetime.fromisoformat(created_at)), UUID(application_id)
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": "invalid_cursor", "message": "Cursor is malformed", "field": "cursor"},
+            )
+
+    @staticmethod
+    def _to_history_item(application: LoanApplication) -> ApplicationHistoryItem:
+        return ApplicationHistoryItem(
+            id=application.id,
+            applicant_id=application.applicant_id,
+            amount=application.amount,
+            term_months=application.term_months,
+            status=application.status,
+            rejection_reason=application.rejection_reason,
+            created_at=application.created_at,
+            processed_at=application.processed_at,
+        )
+
+    @staticmethod
+    def _to_response(application: LoanApplication) -> ApplicationResponse:
         return ApplicationResponse(
             id=application.id,
             applicant_id=application.applicant_id,
@@ -68,6 +178,11 @@ def setup_routes(controller: ApplicationController) -> APIRouter:
         responses={400: {"model": ErrorResponse}},
     )(controller.create)
 
+    router.post(
+        "/status:batch",
+        response_model=BatchStatusResponse,
+    )(controller.get_statuses)
+
     router.get(
         "/{applicant_id}",
         response_model=ApplicationResponse,
@@ -0,0 +1,69 @@
+import csv
+import io
+from contextlib import aclosing
+from typing import AsyncIterator
+
+import orjson
+
+from src.domain.applications.loan.entity import LoanApplication
+from src.infra.metrics import EXPORT_ROWS_NDJSON, EXPORT_ROWS_CSV
+
+
+FIELDS = ("id", "applicant_id", "amount", "term_months", "status", "created_at", "processed_at", "rejection_reason")
+
+# Rows per chunk written to the socket: one send per few hundred rows instead of one per row
+CHUNK_ROWS = 500
+
+
+async def ndjson_chunks(applications: AsyncIterator[LoanApplication]) -> AsyncIterator[bytes]:
+    lines = []
+    async with aclosing(applications):
+        async for application in applications:
+            # orjson writes UUIDs, datetimes and enums itself
+            lines.append(orjson.dumps(
+                {field: getattr(application, field) for field in FIELDS},
+                option=orjson.OPT_APPEND_NEWLINE,
+            ))
+            if len(lines) >= CHUNK_ROWS:
+                yield b"".join(lines)
+                EXPORT_ROWS_NDJSON.inc(len(lines))
+                lines = []
+
+    if lines:
+        yield b"".join(lines)
+        EXPORT_ROWS_NDJSON.inc(len(lines))
+
+
+async def csv_chunks(applications: AsyncIterator[LoanApplication]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(FIELDS)
+    rows = 0
+
+    async with aclosing(applications):
+        async for application in applications:
+            writer.writerow(_csv_row(application))
+            rows += 1
+            if rows >= CHUNK_ROWS:
+                yield buffer.getvalue().encode()
+                EXPORT_ROWS_CSV.inc(rows)
+                buffer.seek(0)
+                buffer.truncate()
+                rows = 0
+
+    # Always flushed, so an empty export still carries its header
+    yield buffer.getvalue().encode()
+    EXPORT_ROWS_CSV.inc(rows)
+
+
+def _csv_row(application: LoanApplication) -> tuple:
+    return (
+        application.id,
+        application.applicant_id,
+        application.amount,
+        application.term_months,
+        application.status.value,
+        application.created_at.isoformat(),
+        application.processed_at.isoformat() if application.processed_at else "",
+        application.rejection_reason or "",
+    )
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Callable
+
+from src.domain.ports import MessageConsumer
+from src.infra.metrics import CONSUMER_PROCESSING_RATE, CONSUMER_CONCURRENCY_LIMIT, CONSUMER_BATCH_SIZE_LIMIT
+
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest latency sample; smooths out single slow batches
+LATENCY_SMOOTHING = 0.2
+
+
+class AimdLimit:
+
+    def __init__(self, minimum: int, maximum: int, step: int = 1, backoff: float = 0.5):
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self.step = step
+        self.backoff = backoff
+        # Start where a fixed configuration would have been and only back off under pressure
+        self.value = self.maximum
+
+    def __call__(self) -> int:
+        return self.value
+
+    def increase(self) -> None:
+        self.value = min(self.value + self.step, self.maximum)
+
+    def decrease(self) -> None:
+        self.value = max(int(self.value * self.backoff), self.minimum)
+
+
+class AdaptiveController:
+
+    def __init__(
+        self,
+        latency_target_seconds: float,
+        lag_threshold: int,
+        concurrency: AimdLimit | None = None,
+        batch_size: AimdLimit | None = None,
+    ):
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self._latency_target = latency_target_seconds
+        self._lag_threshold = lag_threshold
+        self._latency: float | None = None
+        self._export()
+
+    @property
+    def latency(self) -> float | None:
+        return self._latency
+
+    def record_latency(self, seconds: float) -> None:
+        if self._latency is None:
+            self._latency = seconds
+        else:
+            self._latency += LATENCY_SMOOTHING * (seconds - self._latency)
+
+    def update(self, lag: int) -> None:
+        limits = [limit for limit in (self.concurrency, self.batch_size) if limit is not None]
+
+        # Slow units of work mean the database is the bottleneck: more concurrency would only queue there
+        if self._latency is not None and self._latency > self._latency_target:
+            for limit in limits:
+                limit.decrease()
+        elif lag > self._lag_threshold:
+            for limit in limits:
+                limit.increase()
+
+        self._export()
+
+    def _export(self) -> None:
+        if self.concurrency is not None:
+            CONSUMER_CONCURRENCY_LIMIT.set(self.concurrency.value)
+        if self.batch_size is not None:
+            CONSUMER_BATCH_SIZE_LIMIT.set(self.batch_size.value)
+
+
+class LagMonitor:
+
+    def __init__(
+        self,
+        consumer: MessageConsumer,
+        processed_total: Callable[[], int],
+        interval_seconds: float,
+        controller: AdaptiveController | None = None,
+        status_file: str | None = None,
+    ):
+        self._consumer = consumer
+        self._processed_total = processed_total
+        self._interval = interval_seconds
+        self._controller = controller
+        self._status_file = status_file
+        self._last_sample = (time.monotonic(), processed_total())
+
+    async def sample(self) -> dict:
+        lag = await self._consumer.lag()
+
+        now, processed = time.monotonic(), self._processed_total()
+        last_at, last_processed = self._last_sample
+        self._last_sample = (now, processed)
+        rate = (processed - last_processed) / (now - last_at) if now > last_at else 0.0
+        CONSUMER_PROCESSING_RATE.set(rate)
+
+        total_lag = sum(lag.values())
+        if self._controller:
+            self._controller.update(total_lag)
+
+        status = {
+            "lag": total_lag,
+            "partitions": {f"{topic}:{partition}": offsets for (topic, partition), offsets in sorted(lag.items())},
+            "processing_rate": rate,
+            # Seconds until the backlog is gone at the current rate; what an autoscaler should act on
+            "drain_seconds": total_lag / rate if rate > 0 else None,
+            "updated_at": time.time(),
+        }
+        if self._controller:
+            status["latency_seconds"] = self._controller.latency
+            if self._controller.concurrency:
+                status["concurrency"] = self._controller.concurrency.value
+            if self._controller.batch_size:
+                status["batch_size"] = self._controller.batch_size.value
+
+        if self._status_file:
+            self._write_status(status)
+        return status
+
+    def _write_status(self, status: dict) -> None:
+        # Write-then-rename so a reader never sees a half-written file
+        tmp_path = f"{self._status_file}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(status, f)
+        os.replace(tmp_path, self._status_file)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.sample()
+            except Exception as e:
+                logger.warning(f"Failed to sample consumer lag: {e}")
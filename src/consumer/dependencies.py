@@ -2,14 +2,71 @@ from src.core import settings
 from src.domain.ports import MessageConsumer, Cache
 from src.domain.applications.loan.ports import LoanApplicationRepository
 from src.domain.applications.loan.processor import LoanApplicationProcessor, LoanProcessingRules
-from src.infra.messaging.kafka import KafkaMessageConsumer
+from src.domain.applications.loan.rules import CompiledRuleSet
+from src.infra.messaging.kafka import KafkaMessageBroker, KafkaMessageConsumer
 from src.infra.cache.redis import RedisCache
+from src.infra.cache.dedupe import RedisDedupeStore
+from src.infra.cache.recent_writes import RedisRecentWrites
 from src.infra.db.loan_application.repository import PostgresLoanApplicationRepository
+from src.infra.rules.loader import load_rule_set
 from src.domain.applications.loan.cached_repository import CachedLoanApplicationRepository
+from .autoscaling import AdaptiveController, AimdLimit
+from .retry import FailureRouter, retry_topic
 
 
 def create_message_consumer() -> MessageConsumer:
-    return KafkaMessageConsumer()
+    manual_commit = settings.kafka_consumer_batch_enabled or settings.kafka_consumer_workers > 0
+    return KafkaMessageConsumer(enable_auto_commit=not manual_commit)
+
+
+def create_retry_consumer(delay_seconds: float) -> MessageConsumer:
+    return KafkaMessageConsumer(
+        topic=retry_topic(settings.loan_application_topic, delay_seconds),
+        group_id=f"{settings.kafka_consumer_group}-retry-{delay_seconds:g}s",
+        enable_auto_commit=False,
+        # The tier worker sleeps until a record is due, which must not count as a stalled consumer
+        max_poll_interval_ms=int((delay_seconds + 60) * 1000),
+    )
+
+
+async def create_retry_broker() -> KafkaMessageBroker:
+    # Wait for acks: the failed record's offset is committed right after routing it
+    broker = KafkaMessageBroker(delivery_mode="wait")
+    await broker.connect()
+    return broker
+
+
+def create_failure_router(broker: KafkaMessageBroker, delays_seconds: list[float] | None = None) -> FailureRouter:
+    return FailureRouter(
+        broker=broker,
+        topic=settings.loan_application_topic,
+        delays_seconds=settings.retry_delays_seconds if delays_seconds is None else delays_seconds,
+        dead_letter_topic=settings.dead_letter_topic,
+    )
+
+
+def create_adaptive_controller() -> AdaptiveController | None:
+    if not settings.consumer_adaptive_enabled:
+        return None
+
+    # Only the knob of the active consumption mode is adapted; the configured value is the ceiling
+    concurrency = None
+    batch_size = None
+    if settings.kafka_consumer_workers > 0:
+        concurrency = AimdLimit(settings.consumer_adaptive_min_workers, settings.kafka_consumer_workers)
+    elif settings.kafka_consumer_batch_enabled:
+        batch_size = AimdLimit(
+            settings.consumer_adaptive_min_batch_size,
+            settings.kafka_consumer_batch_size,
+            step=max(settings.kafka_consumer_batch_size // 10, 1),
+        )
+
+    return AdaptiveController(
+        latency_target_seconds=settings.consumer_adaptive_latency_target_ms / 1000,
+        lag_threshold=settings.consumer_adaptive_lag_threshold,
+        concurrency=concurrency,
+        batch_size=batch_size,
+    )
 
 
 def create_processing_rules() -> LoanProcessingRules:
@@ -22,21 +79,46 @@ def create_processing_rules() -> LoanProcessingRules:
     )
 
 
+def create_decision_rules() -> CompiledRuleSet | None:
+    if not settings.loan_rules_path:
+        return None
+    return load_rule_set(settings.loan_rules_path)
+
+
 def create_processor() -> LoanApplicationProcessor:
     rules = create_processing_rules()
-    return LoanApplicationProcessor(rules)
+    return LoanApplicationProcessor(rules, decision_rules=create_decision_rules())
 
 
 async def create_cache() -> Cache:
-    cache = RedisCache()
+    # With server-side tracking Redis reports the writes itself, so skip the PUBLISH per key
+    cache = RedisCache(publish_invalidations=settings.cache_l1_invalidation == "pubsub")
     await cache.connect()
     return cache
 
 
-def create_repository(session, cache: Cache) -> LoanApplicationRepository:
-    postgres_repo = PostgresLoanApplicationRepository(session)
+async def create_dedupe_store() -> RedisDedupeStore | None:
+    if not settings.dedupe_enabled:
+        return None
+    store = RedisDedupeStore()
+    await store.connect()
+    return store
+
+
+async def create_recent_writes() -> RedisRecentWrites | None:
+    # Only worth a Redis write per save when the API reads from replicas
+    if not settings.db_replica_urls:
+        return None
+    recent_writes = RedisRecentWrites()
+    await recent_writes.connect()
+    return recent_writes
+
+
+def create_repository(session, cache: Cache, recent_writes: RedisRecentWrites | None = None) -> LoanApplicationRepository:
+    postgres_repo = PostgresLoanApplicationRepository(session, recent_writes=recent_writes)
     return CachedLoanApplicationRepository(
         repository=postgres_repo,
         cache=cache,
         ttl_seconds=settings.cache_ttl_seconds,
+        early_refresh_beta=settings.cache_early_refresh_beta,
     )
@@ -1,11 +1,37 @@
 import asyncio
 import signal
 import logging
+import time
+from typing import Callable
 
+from prometheus_client import start_http_server
+
+from src.core import settings
 from src.domain.ports import MessageConsumer
 from src.infra.db.session import async_session, init_db, close_db
 from src.domain.applications.loan.use_cases import ProcessApplicationUseCase
-from .dependencies import create_message_consumer, create_cache, create_repository, create_processor
+from src.infra.metrics import (
+    MESSAGES_PROCESSED,
+    MESSAGES_FAILED,
+    PROCESS_MESSAGE_DURATION,
+    PROCESS_BATCH_DURATION,
+)
+from src.infra.rules.loader import RuleSetReloader
+from .dependencies import (
+    create_message_consumer,
+    create_adaptive_controller,
+    create_retry_consumer,
+    create_retry_broker,
+    create_failure_router,
+    create_cache,
+    create_dedupe_store,
+    create_recent_writes,
+    create_repository,
+    create_processor,
+)
+from .autoscaling import LagMonitor
+from .retry import RetryTierWorker
+from .workers import ConcurrencyLimiter, OffsetTracker, PartitionedWorkerPool
 
 
 logging.basicConfig(
@@ -17,57 +43,242 @@ logger = logging.getLogger(__name__)
 
 class ApplicationConsumerService:
 
-    def __init__(self, consumer: MessageConsumer):
+    def __init__(
+        self,
+        consumer: MessageConsumer,
+        on_processed: Callable[[int], None] | None = None,
+        init_schema: bool = True,
+        status_file: str | None = None,
+    ):
         self._consumer = consumer
         self._processor = create_processor()
         self._cache = None
+        self._dedupe_store = None
+        self._recent_writes = None
+        self._rules_watcher: asyncio.Task | None = None
+        self._retry_broker = None
+        self._failure_router = None
+        self._retry_workers: list[asyncio.Task] = []
+        self._controller = create_adaptive_controller()
+        self._lag_monitor: asyncio.Task | None = None
+        self._processed_total = 0
+        self._status_file = status_file or settings.consumer_status_file
+        self._on_processed = on_processed
+        self._init_schema = init_schema
 
     async def start(self) -> None:
         self._cache = await create_cache()
+        self._dedupe_store = await create_dedupe_store()
+        self._recent_writes = await create_recent_writes()
+
+        if settings.loan_rules_path:
+            reloader = RuleSetReloader(settings.loan_rules_path, on_reload=self._processor.set_decision_rules)
+            self._rules_watcher = asyncio.create_task(reloader.watch())
+
+        if settings.retry_enabled:
+            self._retry_broker = await create_retry_broker()
+            self._failure_router = create_failure_router(self._retry_broker)
+            # Retries run on their own consumers, so a backing-off message never holds up the main partitions
+            self._retry_workers = [
+                asyncio.create_task(RetryTierWorker(create_retry_consumer(delay), self.process_retry).run())
+                for delay in settings.retry_delays_seconds
+            ]
+
+        if settings.consumer_lag_interval_seconds > 0:
+            monitor = LagMonitor(
+                consumer=self._consumer,
+                processed_total=lambda: self._processed_total,
+                interval_seconds=settings.consumer_lag_interval_seconds,
+                controller=self._controller,
+                status_file=self._status_file,
+            )
+            self._lag_monitor = asyncio.create_task(monitor.run())
 
     async def process_message(self, message: dict) -> None:
+        await self._process(message, attempt=0)
+
+    async def process_retry(self, envelope: dict) -> None:
+        await self._process(envelope["application"], attempt=envelope["attempt"])
+
+    async def _process(self, message: dict, attempt: int) -> None:
         logger.info(f"Processing application: {message.get('id')}")
 
         async with async_session() as session:
-            repository = create_repository(session, self._cache)
-            use_case = ProcessApplicationUseCase(repository, self._processor)
+            repository = create_repository(session, self._cache, self._recent_writes)
+            use_case = ProcessApplicationUseCase(repository, self._processor, self._dedupe_store)
 
             try:
-                application = await use_case.execute(message)
+                started = time.perf_counter()
+                with PROCESS_MESSAGE_DURATION.time():
+                    application = await use_case.execute(message)
+                self._record_latency(time.perf_counter() - started)
+                if application is None:
+                    logger.info(f"Application {message.get('id')} already processed, skipping")
+                    return
                 logger.info(f"Application {application.id} processed: {application.status.value}")
+                self._record_processed(1)
             except Exception as e:
+                MESSAGES_FAILED.inc()
                 logger.error(f"Failed to process application: {e}")
+                if self._failure_router:
+                    await self._failure_router.route(message, e, attempt)
+
+    async def process_batch(self, messages: list[dict]) -> None:
+        logger.info(f"Processing batch of {len(messages)} applications")
+
+        async with async_session() as session:
+            repository = create_repository(session, self._cache, self._recent_writes)
+            use_case = ProcessApplicationUseCase(repository, self._processor, self._dedupe_store)
+
+            try:
+                started = time.perf_counter()
+                with PROCESS_BATCH_DURATION.time():
+                    applications = await use_case.execute_many(messages)
+                self._record_latency(time.perf_counter() - started)
+                logger.info(f"Batch of {len(applications)} applications processed")
+                self._record_processed(len(applications))
+                return
+            except Exception as e:
+                logger.error(f"Failed to process batch, falling back to per-message processing: {e}")
+
+        for message in messages:
+            await self.process_message(message)
+
+    def _record_processed(self, count: int) -> None:
+        MESSAGES_PROCESSED.inc(count)
+        self._processed_total += count
+        if self._on_processed:
+            self._on_processed(count)
+
+    def _record_latency(self, seconds: float) -> None:
+        if self._controller:
+            self._controller.record_latency(seconds)
+
+    async def _consume_messages(self) -> None:
+        async for message in self._consumer.messages():
+            await self.process_message(message)
+
+    async def _consume_batches(self) -> None:
+        batch_size = self._controller.batch_size if self._controller else None
+        batches = self._consumer.batches(
+            max_records=batch_size or settings.kafka_consumer_batch_size,
+            linger_ms=settings.kafka_consumer_batch_linger_ms,
+        )
+
+        async for messages in batches:
+            await self.process_batch(messages)
+            await self._consumer.commit()
+
+    async def _consume_with_workers(self) -> None:
+        pool = PartitionedWorkerPool(
+            handler=self.process_message,
+            workers=settings.kafka_consumer_workers,
+            queue_size=settings.kafka_consumer_worker_queue_size,
+            limiter=ConcurrencyLimiter(self._controller.concurrency) if self._controller and self._controller.concurrency else None,
+        )
+        pool.start()
+        committer = asyncio.create_task(self._commit_periodically(pool.offsets))
+
+        async def on_revoked(partitions: list[tuple[str, int]]) -> None:
+            # Finish and commit what is in flight while the partitions are still ours, then forget them
+            await pool.drain()
+            await self._commit_offsets(pool.offsets)
+            pool.offsets.reset(partitions)
+
+        self._consumer.set_revocation_handler(on_revoked)
+
+        try:
+            async for message in self._consumer.records():
+                await pool.submit(message)
+        finally:
+            self._consumer.set_revocation_handler(None)
+            committer.cancel()
+            await pool.drain()
+            await pool.stop()
+            await self._commit_offsets(pool.offsets)
+
+    async def _commit_periodically(self, offsets: OffsetTracker) -> None:
+        interval = settings.kafka_consumer_commit_interval_ms / 1000
+        while True:
+            await asyncio.sleep(interval)
+            await self._commit_offsets(offsets)
+
+    async def _commit_offsets(self, offsets: OffsetTracker) -> None:
+        committable = offsets.pop_committable()
+        if not committable:
+            return
+
+        try:
+            await self._consumer.commit(committable)
+        except Exception as e:
+            offsets.restore(committable)
+            logger.warning(f"Failed to commit offsets {committable}, retrying with the next commit: {e}")
 
     async def run(self) -> None:
         logger.info("Starting consumer service...")
 
-        await init_db()
+        if self._init_schema:
+            await init_db()
         await self.start()
         await self._consumer.start()
 
         try:
-            async for message in self._consumer.messages():
-                await self.process_message(message)
+            if settings.kafka_consumer_workers > 0:
+                await self._consume_with_workers()
+            elif settings.kafka_consumer_batch_enabled:
+                await self._consume_batches()
+            else:
+                await self._consume_messages()
         finally:
             await self._consumer.stop()
+            if self._rules_watcher:
+                self._rules_watcher.cancel()
+            if self._lag_monitor:
+                self._lag_monitor.cancel()
+            for worker in self._retry_workers:
+                worker.cancel()
+            if self._retry_workers:
+                await asyncio.gather(*self._retry_workers, return_exceptions=True)
+            if self._retry_broker:
+                await self._retry_broker.disconnect()
             if self._cache:
                 await self._cache.disconnect()
+            if self._dedupe_store:
+                await self._dedupe_store.disconnect()
+            if self._recent_writes:
+                await self._recent_writes.disconnect()
             await close_db()
             logger.info("Consumer service stopped")
 
-    async def stop(self) -> None:
-        await self._consumer.stop()
+    # Only ends the fetch loop: run() drains in-flight messages and commits them before closing the consumer
+    def stop(self) -> None:
+        self._consumer.interrupt()
+
 
+async def main(
+    on_processed: Callable[[int], None] | None = None,
+    init_schema: bool = True,
+    metrics_port: int | None = None,
+    status_file: str | None = None,
+) -> None:
+    if settings.metrics_enabled:
+        port = metrics_port or settings.consumer_metrics_port
+        start_http_server(port)
+        logger.info(f"Serving Prometheus metrics on port {port}")
 
-async def main() -> None:
     consumer = create_message_consumer()
-    service = ApplicationConsumerService(consumer)
+    service = ApplicationConsumerService(
+        consumer,
+        on_processed=on_processed,
+        init_schema=init_schema,
+        status_file=status_file,
+    )
 
     loop = asyncio.get_event_loop()
 
     def shutdown():
         logger.info("Shutdown signal received")
-        asyncio.create_task(service.stop())
+        service.stop()
 
     for sig in (signal.SIGTERM, signal.SIGINT):
         loop.add_signal_handler(sig, shutdown)
@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from src.core import settings
+from src.infra.db.session import async_session, close_db
+from src.infra.messaging.kafka import KafkaMessageConsumer
+from src.domain.applications.loan.use_cases import ProcessApplicationUseCase
+from .dependencies import (
+    create_cache,
+    create_dedupe_store,
+    create_failure_router,
+    create_processor,
+    create_recent_writes,
+    create_repository,
+    create_retry_broker,
+)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def replay(rate: float, limit: int | None, idle_timeout: float, skip_failed: bool) -> int:
+    started_at = datetime.utcnow()
+    consumer = KafkaMessageConsumer(
+        topic=settings.dead_letter_topic,
+        group_id=f"{settings.kafka_consumer_group}-dlq-replay",
+        enable_auto_commit=False,
+    )
+    processor = create_processor()
+    cache = await create_cache()
+    dedupe_store = await create_dedupe_store()
+    recent_writes = await create_recent_writes()
+    broker = await create_retry_broker() if skip_failed else None
+    # No retry tiers: a record that fails again goes straight back to the DLQ
+    router = create_failure_router(broker, delays_seconds=[]) if broker else None
+
+    interval = 1 / rate
+    next_at = time.monotonic()
+    replayed = 0
+
+    await consumer.start()
+    records = consumer.records()
+
+    try:
+        while limit is None or replayed < limit:
+            try:
+                record = await asyncio.wait_for(anext(records), timeout=idle_timeout)
+            except (asyncio.TimeoutError, StopAsyncIteration):
+                break
+
+            envelope = record.value
+            # Only drain what was dead-lettered before this run, including nothing re-dead-lettered by it
+            if datetime.fromisoformat(envelope["failed_at"]) >= started_at:
+                break
+
+            wait = next_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            next_at = max(next_at, time.monotonic()) + interval
+
+            async with async_session() as session:
+                repository = create_repository(session, cache, recent_writes)
+                use_case = ProcessApplicationUseCase(repository, processor, dedupe_store)
+                try:
+                    await use_case.execute(envelope["application"])
+                except Exception as e:
+                    if not router:
+                        # Offset stays uncommitted, so the next run starts again from this record
+                        logger.error(f"Replay stopped at {record.topic}[{record.partition}]@{record.offset}: {e}")
+                        break
+                    await router.route(envelope["application"], e, attempt=envelope["attempt"])
+
+            await consumer.commit({(record.topic, record.partition): record.offset + 1})
+            replayed += 1
+    finally:
+        await consumer.stop()
+        await cache.disconnect()
+        if dedupe_store:
+            await dedupe_store.disconnect()
+        if recent_writes:
+            await recent_writes.disconnect()
+        if broker:
+            await broker.disconnect()
+        await close_db()
+
+    logger.info(f"Replayed {replayed} dead-lettered applications")
+    return replayed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay dead-lettered loan applications")
+    parser.add_argument("--rate", type=float, default=settings.dlq_replay_rate, help="Max applications per second")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many records")
+    parser.add_argument("--idle-timeout", type=float, default=10.0, help="Stop after this many seconds without records")
+    parser.add_argument("--skip-failed", action="store_true", help="Re-dead-letter failing records instead of stopping")
+    args = parser.parse_args()
+
+    asyncio.run(replay(args.rate, args.limit, args.idle_timeout, args.skip_failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from src.domain.exceptions import DomainError
+from src.domain.ports import ConsumedMessage, MessageBroker, MessageConsumer
+from src.infra.metrics import MESSAGES_RETRIED, MESSAGES_DEAD_LETTERED
+
+
+logger = logging.getLogger(__name__)
+
+# Retrying cannot fix a malformed or invalid message; everything else (DB, Redis, network) gets the retry tiers
+PERMANENT_ERRORS = (DomainError, KeyError, ValueError, TypeError)
+
+TIER_BACKOFF_SECONDS = 1.0
+TIER_MAX_BACKOFF_SECONDS = 60.0
+
+
+def retry_topic(topic: str, delay_seconds: float) -> str:
+    return f"{topic}.retry.{delay_seconds:g}s"
+
+
+def is_retryable(error: Exception) -> bool:
+    return not isinstance(error, PERMANENT_ERRORS)
+
+
+class FailureRouter:
+
+    def __init__(
+        self,
+        broker: MessageBroker,
+        topic: str,
+        delays_seconds: list[float],
+        dead_letter_topic: str,
+    ):
+        self._broker = broker
+        self._topic = topic
+        self._delays = delays_seconds
+        self._dead_letter_topic = dead_letter_topic
+
+    async def route(self, message: dict, error: Exception, attempt: int = 0) -> None:
+        envelope = {
+            "application": message,
+            "attempt": attempt + 1,
+            "error": {"type": type(error).__name__, "message": str(error)},
+            "source_topic": self._topic,
+            "failed_at": datetime.utcnow().isoformat(),
+        }
+        key = message.get("applicant_id") if isinstance(message, dict) else None
+        application_id = message.get("id") if isinstance(message, dict) else None
+
+        if is_retryable(error) and attempt < len(self._delays):
+            delay = self._delays[attempt]
+            envelope["retry_at"] = time.time() + delay
+            await self._broker.publish(retry_topic(self._topic, delay), envelope, key=key)
+            MESSAGES_RETRIED.inc()
+            return
+
+        await self._broker.publish(self._dead_letter_topic, envelope, key=key)
+        MESSAGES_DEAD_LETTERED.inc()
+        logger.warning(f"Dead-lettered application {application_id} after {attempt + 1} attempts: {error}")
+
+
+class RetryTierWorker:
+
+    # One per delay tier. Every record in a tier has the same delay, so records come due in
+    # offset order and sleeping on the head of the partition never delays a later record
+    def __init__(self, consumer: MessageConsumer, handler: Callable[[dict], Awaitable[None]]):
+        self._consumer = consumer
+        self._handler = handler
+
+    async def run(self) -> None:
+        await self._consumer.start()
+
+        try:
+            async for record in self._consumer.records():
+                wait = record.value.get("retry_at", 0) - time.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                await self._handle(record)
+        finally:
+            await self._consumer.stop()
+
+    async def _handle(self, record: ConsumedMessage) -> None:
+        # Routing a failure or committing can fail too (e.g. Kafka down). The record is retried in place,
+        # uncommitted, rather than letting the error end this tier for the rest of the process
+        backoff = TIER_BACKOFF_SECONDS
+        handled = False
+
+        while True:
+            try:
+                if not handled:
+                    await self._handler(record.value)
+                    handled = True
+                await self._consumer.commit({(record.topic, record.partition): record.offset + 1})
+                return
+            except Exception as e:
+                logger.error(
+                    f"Retry tier failed on {record.topic}[{record.partition}]@{record.offset}, "
+                    f"trying again in {backoff:g}s: {e}"
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, TIER_MAX_BACKOFF_SECONDS)
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.process import BaseProcess
+from multiprocessing.sharedctypes import Synchronized
+
+from src.core import settings
+from src.infra.db.session import init_db, close_db
+from .main import main
+
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_process_count() -> int:
+    if settings.consumer_processes > 0:
+        return settings.consumer_processes
+
+    # Respect the CPU set the container was given, not the host's core count
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_child(index: int, processed: Synchronized) -> None:
+    def on_processed(count: int) -> None:
+        processed.value += count
+
+    # Each child exposes its own registry, so give it its own port
+    metrics_port = settings.consumer_metrics_port + index
+    status_file = f"{settings.consumer_status_file}.{index}" if settings.consumer_status_file else None
+    asyncio.run(main(on_processed=on_processed, init_schema=False, metrics_port=metrics_port, status_file=status_file))
+
+
+async def prepare_schema() -> None:
+    await init_db()
+    await close_db()
+
+
+class ConsumerSupervisor:
+
+    def __init__(self, processes: int):
+        # spawn, not fork: every child builds its own engine, Redis pool and Kafka client from scratch
+        self._context = multiprocessing.get_context("spawn")
+        self._processes = processes
+        self._children: dict[int, BaseProcess] = {}
+        self._started_at: dict[int, float] = {}
+        self._counters = [self._context.Value("Q", 0, lock=False) for _ in range(processes)]
+        self._reported = [0] * processes
+        self._stopping = False
+
+    def run(self) -> None:
+        logger.info(f"Starting consumer supervisor with {self._processes} processes...")
+
+        asyncio.run(prepare_schema())
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self._request_stop)
+
+        for index in range(self._processes):
+            self._spawn(index)
+
+        last_report = time.monotonic()
+
+        try:
+            while not self._stopping:
+                time.sleep(0.5)
+                self._restart_crashed()
+
+                now = time.monotonic()
+                if now - last_report >= settings.consumer_report_interval_seconds:
+                    self._report(now - last_report)
+                    last_report = now
+        finally:
+            self._shutdown()
+
+    def _request_stop(self, signum, frame) -> None:
+        logger.info(f"Supervisor received signal {signum}, draining children")
+        self._stopping = True
+
+    def _spawn(self, index: int) -> None:
+        process = self._context.Process(
+            target=run_child,
+            args=(index, self._counters[index]),
+            name=f"consumer-{index}",
+        )
+        process.start()
+        self._children[index] = process
+        self._started_at[index] = time.monotonic()
+        logger.info(f"Started {process.name} (pid {process.pid})")
+
+    def _restart_crashed(self) -> None:
+        for index, process in self._children.items():
+            if process.is_alive() or self._stopping:
+                continue
+
+            # Avoid a tight crash loop when a child dies right after start
+            if time.monotonic() - self._started_at[index] < settings.consumer_restart_delay_seconds:
+                continue
+
+            logger.warning(f"{process.name} (pid {process.pid}) exited with code {process.exitcode}, restarting")
+            process.close()
+            self._spawn(index)
+
+    def _report(self, elapsed: float) -> None:
+        for index, process in self._children.items():
+            total = self._counters[index].value
+            rate = (total - self._reported[index]) / elapsed
+            self._reported[index] = total
+            logger.info(f"{process.name} (pid {process.pid}): {rate:.1f} msg/s, {total} total")
+
+    def _shutdown(self) -> None:
+        # SIGTERM: each child stops fetching, drains in-flight messages and commits them before leaving the group
+        for process in self._children.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + settings.consumer_shutdown_timeout_seconds
+        for process in self._children.values():
+            process.join(timeout=max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                logger.warning(f"{process.name} (pid {process.pid}) did not drain in time, killing")
+                process.kill()
+                process.join()
+
+        logger.info("Consumer supervisor stopped")
+
+
+if __name__ == "__main__":
+    ConsumerSupervisor(resolve_process_count()).run()
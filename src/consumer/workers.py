@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import zlib
+from collections import deque
+from contextlib import nullcontext
+from typing import Awaitable, Callable
+
+from src.domain.ports import ConsumedMessage
+
+
+logger = logging.getLogger(__name__)
+
+
+class OffsetTracker:
+
+    def __init__(self):
+        self._in_flight: dict[tuple[str, int], deque[int]] = {}
+        self._done: dict[tuple[str, int], set[int]] = {}
+        self._committable: dict[tuple[str, int], int] = {}
+
+    def track(self, message: ConsumedMessage) -> None:
+        partition = (message.topic, message.partition)
+        self._in_flight.setdefault(partition, deque()).append(message.offset)
+        self._done.setdefault(partition, set())
+
+    def complete(self, message: ConsumedMessage) -> None:
+        partition = (message.topic, message.partition)
+        # Reset by a revocation while the message was in flight; its offset is no longer ours to commit
+        if partition not in self._in_flight:
+            return
+        in_flight = self._in_flight[partition]
+        done = self._done[partition]
+        done.add(message.offset)
+
+        # Only advance past a contiguous prefix of finished offsets
+        while in_flight and in_flight[0] in done:
+            offset = in_flight.popleft()
+            done.discard(offset)
+            self._committable[partition] = offset + 1
+
+    def pop_committable(self) -> dict[tuple[str, int], int]:
+        committable, self._committable = self._committable, {}
+        return committable
+
+    def restore(self, committable: dict[tuple[str, int], int]) -> None:
+        # A failed commit: offered again with the next one, unless a later completion already moved past it
+        for partition, offset in committable.items():
+            if partition in self._in_flight:
+                self._committable[partition] = max(self._committable.get(partition, offset), offset)
+
+    def reset(self, partitions: list[tuple[str, int]]) -> None:
+        # After a revocation the next owner starts from the committed offset; a redelivery must not queue up behind stale ones
+        for partition in partitions:
+            self._in_flight.pop(partition, None)
+            self._done.pop(partition, None)
+            self._committable.pop(partition, None)
+
+    @property
+    def in_flight(self) -> int:
+        return sum(len(offsets) for offsets in self._in_flight.values())
+
+
+class ConcurrencyLimiter:
+
+    # Caps how many workers run the handler at once; the limit is read on every acquire, so it can move
+    def __init__(self, limit: Callable[[], int]):
+        self._limit = limit
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit())
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+
+class PartitionedWorkerPool:
+
+    def __init__(
+        self,
+        handler: Callable[[dict], Awaitable[None]],
+        workers: int,
+        queue_size: int,
+        limiter: ConcurrencyLimiter | None = None,
+    ):
+        self._handler = handler
+        self._limiter = limiter
+        self._queues: list[asyncio.Queue[ConsumedMessage]] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(workers)
+        ]
+        self._tasks: list[asyncio.Task] = []
+        self.offsets = OffsetTracker()
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._work(queue)) for queue in self._queues]
+
+    async def submit(self, message: ConsumedMessage) -> None:
+        self.offsets.track(message)
+        await self._queues[self._route(message)].put(message)
+
+    async def drain(self) -> None:
+        await asyncio.gather(*(queue.join() for queue in self._queues))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _route(self, message: ConsumedMessage) -> int:
+        # Same key always lands on the same worker, which keeps per-applicant ordering
+        routing_key = message.key if message.key is not None else f"{message.topic}:{message.partition}"
+        return zlib.crc32(routing_key.encode("utf-8")) % len(self._queues)
+
+    async def _work(self, queue: asyncio.Queue[ConsumedMessage]) -> None:
+        while True:
+            message = await queue.get()
+            try:
+                async with self._limiter or nullcontext():
+                    await self._handler(message.value)
+            except Exception as e:
+                logger.error(f"Worker failed on {message.topic}[{message.partition}]@{message.offset}: {e}")
+            finally:
+                self.offsets.complete(message)
+                queue.task_done()
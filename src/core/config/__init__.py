@@ -6,6 +6,9 @@ from .redis import RedisSettings
 from .kafka import KafkaSettings
 from .messaging import MessagingSettings
 from .loan import LoanSettings
+from .consumer import ConsumerSettings
+from .metrics import MetricsSettings
+from .ingest import IngestSettings
 
 
 class Settings(
@@ -15,6 +18,9 @@ class Settings(
     KafkaSettings,
     MessagingSettings,
     LoanSettings,
+    ConsumerSettings,
+    MetricsSettings,
+    IngestSettings,
 ):
 
     model_config = SettingsConfigDict(
@@ -6,4 +6,5 @@ class AppSettings(BaseSettings):
     app_name: str = "Loan Application Service"
     app_version: str = "1.0.0"
     debug: bool = False
-
+    api_history_default_page_size: int = 50
+    api_history_max_page_size: int = 500
@@ -0,0 +1,16 @@
+from pydantic_settings import BaseSettings
+
+
+class ConsumerSettings(BaseSettings):
+
+    consumer_processes: int = 0
+    consumer_restart_delay_seconds: float = 1.0
+    consumer_report_interval_seconds: float = 30.0
+    consumer_shutdown_timeout_seconds: float = 30.0
+    consumer_lag_interval_seconds: float = 5.0
+    consumer_status_file: str | None = None
+    consumer_adaptive_enabled: bool = False
+    consumer_adaptive_latency_target_ms: float = 250.0
+    consumer_adaptive_lag_threshold: int = 1000
+    consumer_adaptive_min_workers: int = 1
+    consumer_adaptive_min_batch_size: int = 50
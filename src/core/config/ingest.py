@@ -0,0 +1,7 @@
+from pydantic_settings import BaseSettings
+
+
+class IngestSettings(BaseSettings):
+
+    ingest_batch_size: int = 5000
+    ingest_report_interval_seconds: float = 10.0
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -5,3 +7,15 @@ class KafkaSettings(BaseSettings):
 
     kafka_bootstrap_servers: str = "localhost:9092"
     kafka_consumer_group: str = "loan-processor"
+    kafka_codec: Literal["json", "orjson", "msgpack"] = "json"
+    kafka_consumer_batch_enabled: bool = False
+    kafka_consumer_batch_size: int = 500
+    kafka_consumer_batch_linger_ms: int = 100
+    kafka_consumer_workers: int = 0
+    kafka_consumer_worker_queue_size: int = 100
+    kafka_consumer_commit_interval_ms: int = 1000
+    kafka_producer_delivery_mode: Literal["wait", "background"] = "wait"
+    kafka_producer_acks: int | Literal["all"] = 1
+    kafka_producer_linger_ms: int = 0
+    kafka_producer_max_batch_size: int = 16384
+    kafka_producer_compression_type: Literal["gzip", "snappy", "lz4", "zstd"] | None = None
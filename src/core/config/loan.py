@@ -8,4 +8,6 @@ class LoanSettings(BaseSettings):
     loan_min_term_months: int = 1
     loan_max_term_months: int = 60
     loan_approval_threshold: float = 50_000
+    loan_rules_path: str | None = None
+    loan_rules_reload_interval_seconds: float = 5.0
 
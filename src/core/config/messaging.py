@@ -4,4 +4,11 @@ from pydantic_settings import BaseSettings
 class MessagingSettings(BaseSettings):
 
     loan_application_topic: str = "loan-applications"
-
+    retry_enabled: bool = False
+    retry_delays_seconds: list[float] = [5.0, 30.0, 300.0]
+    dead_letter_topic: str = "loan-applications.dlq"
+    dlq_replay_rate: float = 50.0
+    outbox_enabled: bool = False
+    outbox_relay_batch_size: int = 1000
+    outbox_relay_poll_interval_ms: int = 200
+    outbox_retention_seconds: int = 86400
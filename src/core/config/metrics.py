@@ -0,0 +1,8 @@
+from pydantic_settings import BaseSettings
+
+
+class MetricsSettings(BaseSettings):
+
+    metrics_enabled: bool = True
+    consumer_metrics_port: int = 9100
+    relay_metrics_port: int = 9200
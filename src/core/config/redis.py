@@ -1,8 +1,27 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class RedisSettings(BaseSettings):
 
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 50
+    redis_pool_timeout_seconds: float = 5.0
+    redis_socket_timeout_seconds: float = 5.0
+    redis_socket_connect_timeout_seconds: float = 2.0
+    redis_socket_keepalive: bool = True
+    redis_health_check_interval_seconds: int = 30
     cache_ttl_seconds: int = 3600
+    cache_codec: Literal["json", "orjson", "msgpack"] = "json"
+    cache_early_refresh_beta: float = 0.0
+    cache_invalidation_channel: str = "loan_application:invalidations"
+    cache_l1_enabled: bool = False
+    cache_l1_max_entries: int = 10_000
+    cache_l1_max_bytes: int = 32 * 1024 * 1024
+    cache_l1_ttl_seconds: int = 5
+    cache_l1_invalidation: Literal["pubsub", "tracking"] = "pubsub"
+    cache_l1_tracking_prefix: str = "loan_application:"
+    dedupe_enabled: bool = False
+    dedupe_ttl_seconds: int = 24 * 3600
 
@@ -1,11 +1,14 @@
-from .exceptions import DomainError, ValidationError
-from .ports import BaseRepository, Cache, MessageBroker, MessageConsumer
+from .exceptions import DomainError, ValidationError, RuleDefinitionError
+from .ports import BaseRepository, Cache, MessageBroker, MessageConsumer, ConsumedMessage, DedupeStore
 
 __all__ = [
     "DomainError",
     "ValidationError",
+    "RuleDefinitionError",
     "BaseRepository",
     "Cache",
     "MessageBroker",
     "MessageConsumer",
+    "ConsumedMessage",
+    "DedupeStore",
 ]
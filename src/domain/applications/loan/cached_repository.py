@@ -1,26 +1,79 @@
+import math
+import random
+import time
+from datetime import datetime
+from typing import AsyncIterator
 from uuid import UUID
 
 from src.domain.ports import Cache
+from src.domain.single_flight import SingleFlight
 from .entity import LoanApplication
 from .ports import LoanApplicationRepository
 
 
+def cache_key(applicant_id: str) -> str:
+    return f"loan_application:{applicant_id}"
+
+
 class CachedLoanApplicationRepository(LoanApplicationRepository):
 
-    def __init__(self, repository: LoanApplicationRepository, cache: Cache, ttl_seconds: int):
+    def __init__(
+        self,
+        repository: LoanApplicationRepository,
+        cache: Cache,
+        ttl_seconds: int,
+        single_flight: SingleFlight[LoanApplication | None] | None = None,
+        early_refresh_beta: float = 0.0,
+    ):
         self._repository = repository
         self._cache = cache
         self._ttl = ttl_seconds
+        self._single_flight = single_flight
+        self._early_refresh_beta = early_refresh_beta
 
     def _cache_key(self, applicant_id: str) -> str:
-        return f"loan_application:{applicant_id}"
+        return cache_key(applicant_id)
+
+    def _cache_value(self, application: LoanApplication, recompute_seconds: float = 0.0) -> dict:
+        value = application.to_dict()
+
+        if self._early_refresh_beta > 0:
+            value["_expires_at"] = time.time() + self._ttl
+            value["_recompute_seconds"] = recompute_seconds
+
+        return value
+
+    def _should_refresh_early(self, cached: dict) -> bool:
+        if self._early_refresh_beta <= 0 or "_expires_at" not in cached:
+            return False
+
+        # XFetch: refresh ahead of expiry with a probability that grows as expiry nears
+        # and with how long the value takes to recompute
+        jitter = -math.log(1.0 - random.random())
+        return time.time() + cached["_recompute_seconds"] * self._early_refresh_beta * jitter >= cached["_expires_at"]
 
     async def save(self, entity: LoanApplication) -> LoanApplication:
         saved = await self._repository.save(entity)
 
         await self._cache.set(
             key=self._cache_key(saved.applicant_id),
-            value=saved.to_dict(),
+            value=self._cache_value(saved),
+            ttl_seconds=self._ttl,
+        )
+
+        return saved
+
+    async def save_many(self, entities: list[LoanApplication]) -> list[LoanApplication]:
+        saved = await self._repository.save_many(entities)
+
+        latest: dict[str, LoanApplication] = {}
+        for application in saved:
+            current = latest.get(application.applicant_id)
+            if current is None or application.created_at >= current.created_at:
+                latest[application.applicant_id] = application
+
+        await self._cache.set_many(
+            items={self._cache_key(applicant_id): self._cache_value(app) for applicant_id, app in latest.items()},
             ttl_seconds=self._ttl,
         )
 
@@ -29,19 +82,85 @@ class CachedLoanApplicationRepository(LoanApplicationRepository):
     async def get_by_id(self, entity_id: UUID) -> LoanApplication | None:
         return await self._repository.get_by_id(entity_id)
 
-    async def get_by_applicant_id(self, applicant_id: str) -> LoanApplication | None:
+    async def get_by_applicant_id(
+        self,
+        applicant_id: str,
+        created_after: datetime | None = None,
+    ) -> LoanApplication | None:
         cache_key = self._cache_key(applicant_id)
         cached = await self._cache.get(cache_key)
 
-        if cached:
-            return LoanApplication.from_dict(cached)
+        if cached and not self._should_refresh_early(cached):
+            application = LoanApplication.from_dict(cached)
+            # The cached value is the latest application; older than the hint means there is none after it
+            if created_after is not None and application.created_at < created_after:
+                return None
+            return application
+
+        # A hinted miss only says nothing is newer than the hint; callers with other hints must not share it
+        if self._single_flight is None or created_after is not None:
+            return await self._load(applicant_id, created_after)
+
+        return await self._single_flight.do(cache_key, lambda: self._load(applicant_id))
+
+    async def get_many_by_applicant_ids(self, applicant_ids: list[str]) -> dict[str, LoanApplication]:
+        keys = {self._cache_key(applicant_id): applicant_id for applicant_id in applicant_ids}
+        cached = await self._cache.get_many(list(keys))
+
+        found: dict[str, LoanApplication] = {}
+        misses = []
+        for key, applicant_id in keys.items():
+            value = cached.get(key)
+            if value and not self._should_refresh_early(value):
+                found[applicant_id] = LoanApplication.from_dict(value)
+            else:
+                misses.append(applicant_id)
+
+        if not misses:
+            return found
+
+        started = time.monotonic()
+        loaded = await self._repository.get_many_by_applicant_ids(misses)
+        recompute_seconds = time.monotonic() - started
+
+        if loaded:
+            await self._cache.set_many(
+                items={
+                    self._cache_key(applicant_id): self._cache_value(application, recompute_seconds)
+                    for applicant_id, application in loaded.items()
+                },
+                ttl_seconds=self._ttl,
+            )
+
+        found.update(loaded)
+        return found
+
+    async def list_by_applicant_id(
+        self,
+        applicant_id: str,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[LoanApplication]:
+        # Not cached: the cache only holds the latest application per applicant
+        return await self._repository.list_by_applicant_id(applicant_id, limit, after)
+
+    def stream(
+        self,
+        applicant_id: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[LoanApplication]:
+        return self._repository.stream(applicant_id, created_from, created_to)
 
-        application = await self._repository.get_by_applicant_id(applicant_id)
+    async def _load(self, applicant_id: str, created_after: datetime | None = None) -> LoanApplication | None:
+        started = time.monotonic()
+        # Whatever a hinted read finds is still the applicant's latest application, so it is cached all the same
+        application = await self._repository.get_by_applicant_id(applicant_id, created_after)
 
         if application:
             await self._cache.set(
-                key=cache_key,
-                value=application.to_dict(),
+                key=self._cache_key(applicant_id),
+                value=self._cache_value(application, recompute_seconds=time.monotonic() - started),
                 ttl_seconds=self._ttl,
             )
 
@@ -5,7 +5,7 @@ from uuid import UUID, uuid4
 from .value_objects import LoanApplicationStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class LoanApplication:
 
     applicant_id: str
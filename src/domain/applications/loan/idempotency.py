@@ -0,0 +1,18 @@
+import hashlib
+
+from .entity import LoanApplication
+
+
+def content_hash(application: LoanApplication) -> str:
+    # Only the submitted fields: processing output (status, processed_at) differs between attempts
+    payload = "|".join((
+        application.applicant_id,
+        repr(application.amount),
+        str(application.term_months),
+        application.created_at.isoformat(),
+    ))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def idempotency_key(application: LoanApplication) -> str:
+    return f"{application.id}:{content_hash(application)}"
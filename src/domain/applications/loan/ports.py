@@ -1,4 +1,7 @@
 from abc import abstractmethod
+from datetime import datetime
+from typing import AsyncIterator
+from uuid import UUID
 
 from src.domain.ports import BaseRepository
 from .entity import LoanApplication
@@ -7,5 +10,35 @@ from .entity import LoanApplication
 class LoanApplicationRepository(BaseRepository[LoanApplication]):
 
     @abstractmethod
-    async def get_by_applicant_id(self, applicant_id: str) -> LoanApplication | None:
+    async def get_by_applicant_id(
+        self,
+        applicant_id: str,
+        created_after: datetime | None = None,
+    ) -> LoanApplication | None:
+        pass
+
+    @abstractmethod
+    async def get_many_by_applicant_ids(self, applicant_ids: list[str]) -> dict[str, LoanApplication]:
+        pass
+
+    @abstractmethod
+    async def save_many(self, entities: list[LoanApplication]) -> list[LoanApplication]:
+        pass
+
+    @abstractmethod
+    async def list_by_applicant_id(
+        self,
+        applicant_id: str,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[LoanApplication]:
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        applicant_id: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[LoanApplication]:
         pass
@@ -0,0 +1,144 @@
+import math
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from src.domain.exceptions import RuleDefinitionError
+from .entity import LoanApplication
+from .value_objects import LoanApplicationStatus
+
+
+# Fields a rule may test; each one is a parameter of the generated decide() function
+NUMERIC_FIELDS = ("amount", "term_months")
+HISTORY_FIELDS = ("previous_status", "previous_amount")
+
+ORDERING_OPERATORS = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
+EQUALITY_OPERATORS = {"eq": "==", "ne": "!="}
+MEMBERSHIP_OPERATORS = {"in": "in", "not_in": "not in"}
+
+STATUS_VALUES = {status.value for status in LoanApplicationStatus}
+
+
+@dataclass(frozen=True)
+class RuleOutcome:
+    status: LoanApplicationStatus
+    reason: str | None
+    rule: str | None
+
+
+class CompiledRuleSet:
+
+    def __init__(
+        self,
+        decide: Callable[[float, int, str | None, float | None], int],
+        outcomes: list[RuleOutcome],
+        needs_history: bool,
+        source: str,
+    ):
+        self._decide = decide
+        self.outcomes = outcomes
+        self.needs_history = needs_history
+        self.source = source
+
+    def decide(self, application: LoanApplication, previous: LoanApplication | None = None) -> RuleOutcome:
+        return self.outcomes[self.decide_index(application.amount, application.term_months, previous)]
+
+    def decide_index(self, amount: float, term_months: int, previous: LoanApplication | None = None) -> int:
+        if previous is None:
+            return self._decide(amount, term_months, None, None)
+        return self._decide(amount, term_months, previous.status.value, previous.amount)
+
+    @classmethod
+    def compile(cls, definition: dict) -> "CompiledRuleSet":
+        rules = definition.get("rules")
+        if not isinstance(rules, list):
+            raise RuleDefinitionError("'rules' must be a list")
+
+        outcomes = []
+        branches = []
+        needs_history = False
+
+        for index, rule in enumerate(rules):
+            if not isinstance(rule, dict):
+                raise RuleDefinitionError(f"Rule #{index} must be a mapping")
+
+            name = str(rule.get("name") or f"rule_{index}")
+            when = rule.get("when") or {}
+            if not isinstance(when, dict):
+                raise RuleDefinitionError(f"Rule '{name}': 'when' must be a mapping of field to predicates")
+
+            conditions = []
+            for field, predicates in when.items():
+                conditions.extend(_compile_predicates(name, field, predicates))
+                needs_history = needs_history or field in HISTORY_FIELDS
+
+            outcomes.append(_compile_outcome(name, rule.get("then")))
+            branches.append(f"    if {' and '.join(conditions) or 'True'}:\n        return {index}\n")
+
+        outcomes.append(_compile_outcome("default", definition.get("default", {"status": "approved"})))
+
+        # One straight-line function per rule set: a message costs a few comparisons, not a walk over the definition
+        source = (
+            "def decide(amount, term_months, previous_status, previous_amount):\n"
+            + "".join(branches)
+            + f"    return {len(rules)}\n"
+        )
+        namespace: dict[str, Any] = {}
+        exec(compile(source, "<loan decision rules>", "exec"), {"__builtins__": {}}, namespace)
+
+        return cls(decide=namespace["decide"], outcomes=outcomes, needs_history=needs_history, source=source)
+
+
+def _compile_predicates(rule: str, field: str, predicates: Any) -> list[str]:
+    if field not in NUMERIC_FIELDS and field not in HISTORY_FIELDS:
+        raise RuleDefinitionError(f"Rule '{rule}': unknown field '{field}'")
+
+    if not isinstance(predicates, dict) or not predicates:
+        raise RuleDefinitionError(f"Rule '{rule}': '{field}' needs a mapping of operator to value")
+
+    conditions = []
+    for op, value in predicates.items():
+        if op in ORDERING_OPERATORS:
+            if field == "previous_status" or value is None:
+                raise RuleDefinitionError(f"Rule '{rule}': '{op}' needs a number and is not supported on previous_status")
+            literal = _literal(rule, field, value)
+            expression = f"{field} {ORDERING_OPERATORS[op]} {literal}"
+            # A missing history value never satisfies an ordering comparison
+            conditions.append(f"({field} is not None and {expression})" if field in HISTORY_FIELDS else expression)
+        elif op in EQUALITY_OPERATORS:
+            conditions.append(f"{field} {EQUALITY_OPERATORS[op]} {_literal(rule, field, value)}")
+        elif op in MEMBERSHIP_OPERATORS:
+            if not isinstance(value, list):
+                raise RuleDefinitionError(f"Rule '{rule}': '{op}' on '{field}' needs a list")
+            members = ", ".join(_literal(rule, field, item) for item in value)
+            conditions.append(f"{field} {MEMBERSHIP_OPERATORS[op]} ({members},)")
+        else:
+            raise RuleDefinitionError(f"Rule '{rule}': unknown operator '{op}'")
+
+    return conditions
+
+
+def _literal(rule: str, field: str, value: Any) -> str:
+    # Only plain, finite literals reach the generated source
+    if value is None and field in HISTORY_FIELDS:
+        return "None"
+
+    if field == "previous_status":
+        if value not in STATUS_VALUES:
+            raise RuleDefinitionError(f"Rule '{rule}': '{value}' is not a loan status")
+        return repr(value)
+
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise RuleDefinitionError(f"Rule '{rule}': '{field}' needs a finite number, got {value!r}")
+    return repr(value)
+
+
+def _compile_outcome(rule: str, then: Any) -> RuleOutcome:
+    if not isinstance(then, dict) or then.get("status") not in ("approved", "rejected"):
+        raise RuleDefinitionError(f"Rule '{rule}': 'then.status' must be 'approved' or 'rejected'")
+
+    status = LoanApplicationStatus(then["status"])
+    reason = then.get("reason") or None
+    if status == LoanApplicationStatus.REJECTED and not reason:
+        raise RuleDefinitionError(f"Rule '{rule}': rejections need a 'then.reason'")
+
+    return RuleOutcome(status=status, reason=reason, rule=rule)
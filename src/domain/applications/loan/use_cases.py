@@ -1,5 +1,12 @@
-from src.domain.ports import MessageBroker
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator
+from uuid import UUID
+
+from src.domain.exceptions import ValidationError
+from src.domain.ports import MessageBroker, DedupeStore
 from .entity import LoanApplication
+from .idempotency import idempotency_key
 from .ports import LoanApplicationRepository
 from .processor import LoanApplicationProcessor
 
@@ -22,7 +29,7 @@ class SubmitApplicationUseCase:
 
         await self._message_broker.publish(
             topic=self._topic,
-            message=application.to_dict(),
+            message=application,
             key=applicant_id,
         )
 
@@ -34,19 +41,127 @@ class GetApplicationStatusUseCase:
     def __init__(self, repository: LoanApplicationRepository):
         self._repository = repository
 
-    async def execute(self, applicant_id: str) -> LoanApplication | None:
-        return await self._repository.get_by_applicant_id(applicant_id)
+    async def execute(self, applicant_id: str, created_after: datetime | None = None) -> LoanApplication | None:
+        return await self._repository.get_by_applicant_id(applicant_id, created_after)
+
+    async def execute_many(self, applicant_ids: list[str]) -> dict[str, LoanApplication]:
+        return await self._repository.get_many_by_applicant_ids(applicant_ids)
+
+
+@dataclass(slots=True)
+class ApplicationHistoryPage:
+
+    applications: list[LoanApplication]
+    # (created_at, id) of the last application on the page; None on the last page
+    next_after: tuple[datetime, UUID] | None
+
+
+class ListApplicationHistoryUseCase:
+
+    def __init__(self, repository: LoanApplicationRepository):
+        self._repository = repository
+
+    async def execute(
+        self,
+        applicant_id: str,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> ApplicationHistoryPage:
+        # One extra row tells whether another page exists without a COUNT
+        applications = await self._repository.list_by_applicant_id(applicant_id, limit + 1, after)
+
+        if len(applications) <= limit:
+            return ApplicationHistoryPage(applications=applications, next_after=None)
+
+        applications = applications[:limit]
+        last = applications[-1]
+        return ApplicationHistoryPage(applications=applications, next_after=(last.created_at, last.id))
+
+
+class ExportApplicationsUseCase:
+
+    def __init__(self, repository: LoanApplicationRepository):
+        self._repository = repository
+
+    def execute(
+        self,
+        applicant_id: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[LoanApplication]:
+        return self._repository.stream(applicant_id, created_from, created_to)
 
 
 class ProcessApplicationUseCase:
 
-    def __init__(self, repository: LoanApplicationRepository, processor: LoanApplicationProcessor):
+    def __init__(
+        self,
+        repository: LoanApplicationRepository,
+        processor: LoanApplicationProcessor,
+        dedupe_store: DedupeStore | None = None,
+    ):
         self._repository = repository
         self._processor = processor
+        self._dedupe_store = dedupe_store
+
+    async def execute(self, application_data: dict) -> LoanApplication | None:
+        application = self._parse(application_data)
+
+        key = None
+        if self._dedupe_store:
+            key = idempotency_key(application)
+            if await self._dedupe_store.seen_many([key]):
+                return None
+
+        previous = None
+        if self._processor.needs_history:
+            previous = await self._repository.get_by_applicant_id(application.applicant_id)
+
+        self._processor.process(application, previous)
+
+        saved = await self._repository.save(application)
+
+        # Marked only after the commit: a crash in between means a reprocess, which the upsert turns into a no-op
+        if key:
+            await self._dedupe_store.mark_many([key])
+
+        return saved
+
+    async def execute_many(self, applications_data: list[dict]) -> list[LoanApplication]:
+        applications = [self._parse(data) for data in applications_data]
+
+        keys = []
+        if self._dedupe_store:
+            # Collapses repeats within the batch too
+            keyed: dict[str, LoanApplication] = {}
+            for application in applications:
+                keyed.setdefault(idempotency_key(application), application)
+
+            seen = await self._dedupe_store.seen_many(list(keyed))
+            keys = [key for key in keyed if key not in seen]
+            applications = [keyed[key] for key in keys]
+
+            if not applications:
+                return []
+
+        # History is the stored state before this batch; earlier messages in the same batch don't count
+        previous = None
+        if self._processor.needs_history:
+            applicant_ids = list(dict.fromkeys(application.applicant_id for application in applications))
+            previous = await self._repository.get_many_by_applicant_ids(applicant_ids)
+
+        self._processor.process_many(applications, previous)
+
+        saved = await self._repository.save_many(applications)
 
-    async def execute(self, application_data: dict) -> LoanApplication:
-        application = LoanApplication.from_dict(application_data)
+        if keys:
+            await self._dedupe_store.mark_many(keys)
 
-        self._processor.process(application)
+        return saved
 
-        return await self._repository.save(application)
+    @staticmethod
+    def _parse(application_data: dict) -> LoanApplication:
+        # created_at is part of the primary key: defaulting it would insert a second row on every redelivery
+        if not application_data.get("created_at"):
+            raise ValidationError("created_at is required", field="created_at")
+        return LoanApplication.from_dict(application_data)
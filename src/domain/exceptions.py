@@ -10,3 +10,7 @@ class ValidationError(DomainError):
     def __init__(self, message: str, field: str | None = None):
         self.field = field
         super().__init__(message)
+
+
+class RuleDefinitionError(DomainError):
+    pass
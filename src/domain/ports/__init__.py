@@ -1,6 +1,7 @@
 from .repository import BaseRepository
 from .cache import Cache
 from .message_broker import MessageBroker
-from .message_consumer import MessageConsumer
+from .message_consumer import MessageConsumer, ConsumedMessage
+from .dedupe_store import DedupeStore
 
-__all__ = ["BaseRepository", "Cache", "MessageBroker", "MessageConsumer"]
+__all__ = ["BaseRepository", "Cache", "MessageBroker", "MessageConsumer", "ConsumedMessage", "DedupeStore"]
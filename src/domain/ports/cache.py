@@ -8,11 +8,23 @@ class Cache(ABC):
     async def get(self, key: str) -> Any | None:
         pass
 
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        pass
+
     @abstractmethod
     async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
         pass
 
+    @abstractmethod
+    async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        pass
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         pass
 
+    @abstractmethod
+    async def delete_many(self, keys: list[str]) -> None:
+        pass
+
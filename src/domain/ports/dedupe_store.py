@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class DedupeStore(ABC):
+
+    @abstractmethod
+    async def seen_many(self, keys: list[str]) -> set[str]:
+        pass
+
+    @abstractmethod
+    async def mark_many(self, keys: list[str]) -> None:
+        pass
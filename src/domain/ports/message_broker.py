@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 
 class MessageBroker(ABC):
 
     @abstractmethod
-    async def publish(self, topic: str, message: dict, key: str | None = None) -> None:
+    async def publish(self, topic: str, message: Any, key: str | None = None) -> None:
+        pass
+
+    @abstractmethod
+    async def publish_many(self, topic: str, messages: list[tuple[str | None, Any]]) -> None:
         pass
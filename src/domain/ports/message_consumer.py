@@ -1,5 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable
+
+
+@dataclass(frozen=True)
+class ConsumedMessage:
+    topic: str
+    partition: int
+    offset: int
+    key: str | None
+    value: dict
 
 
 class MessageConsumer(ABC):
@@ -12,6 +22,32 @@ class MessageConsumer(ABC):
     async def stop(self) -> None:
         pass
 
+    # Ends messages(), records() and batches() after the current poll; the consumer stays open to commit
+    @abstractmethod
+    def interrupt(self) -> None:
+        pass
+
+    # Awaited before partitions move to another group member, with the (topic, partition) pairs being revoked
+    @abstractmethod
+    def set_revocation_handler(self, handler: Callable[[list[tuple[str, int]]], Awaitable[None]] | None) -> None:
+        pass
+
     @abstractmethod
     def messages(self) -> AsyncIterator[dict]:
         pass
+
+    @abstractmethod
+    def records(self) -> AsyncIterator[ConsumedMessage]:
+        pass
+
+    @abstractmethod
+    def batches(self, max_records: int | Callable[[], int], linger_ms: int) -> AsyncIterator[list[dict]]:
+        pass
+
+    @abstractmethod
+    async def commit(self, offsets: dict[tuple[str, int], int] | None = None) -> None:
+        pass
+
+    @abstractmethod
+    async def lag(self) -> dict[tuple[str, int], int]:
+        pass
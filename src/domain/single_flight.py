@@ -0,0 +1,33 @@
+import asyncio
+from typing import Awaitable, Callable
+
+
+class SingleFlight[T]:
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future[T]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is None:
+            # A task of its own rather than the first caller's coroutine: that caller being cancelled,
+            # e.g. by a client disconnect, must not fail everyone else waiting on the key
+            call = asyncio.ensure_future(fn())
+            call.add_done_callback(_consume_exception)
+            call.add_done_callback(lambda done: self._forget(key, done))
+            self._calls[key] = call
+
+        # shield: a cancelled caller must not cancel the shared call
+        return await asyncio.shield(call)
+
+    def _forget(self, key: str, call: asyncio.Future[T]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
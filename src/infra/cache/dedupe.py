@@ -0,0 +1,53 @@
+import redis.asyncio as redis
+
+from src.domain.ports import DedupeStore
+from src.core import settings
+from src.infra.metrics import DUPLICATES_SKIPPED_REDIS
+from .redis import create_client
+
+
+class RedisDedupeStore(DedupeStore):
+
+    def __init__(self, url: str | None = None, ttl_seconds: int | None = None):
+        self._url = url or settings.redis_url
+        self._ttl = ttl_seconds or settings.dedupe_ttl_seconds
+        self._client: redis.Redis | None = None
+
+    def _key(self, key: str) -> str:
+        # Outside the loan_application: prefix, like the recent-write markers: with CACHE_L1_INVALIDATION=tracking
+        # every dedupe SET would otherwise be broadcast to every API process
+        return f"processed:loan_application:{key}"
+
+    async def connect(self) -> None:
+        if self._client is None:
+            self._client = create_client(self._url)
+
+    async def disconnect(self) -> None:
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    async def seen_many(self, keys: list[str]) -> set[str]:
+        if not keys:
+            return set()
+
+        if not self._client:
+            await self.connect()
+
+        values = await self._client.mget([self._key(key) for key in keys])
+        seen = {key for key, value in zip(keys, values) if value is not None}
+        DUPLICATES_SKIPPED_REDIS.inc(len(seen))
+        return seen
+
+    async def mark_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+
+        if not self._client:
+            await self.connect()
+
+        # One key per application so each entry expires on its own; a Redis SET can only expire as a whole
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(self._key(key), 1, ex=self._ttl)
+            await pipe.execute()
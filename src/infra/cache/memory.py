@@ -0,0 +1,88 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+from src.domain.ports import Cache
+from src.core import settings
+
+
+class InMemoryLRUCache(Cache):
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: int | None = None,
+    ):
+        self._max_entries = max_entries or settings.cache_l1_max_entries
+        self._max_bytes = max_bytes or settings.cache_l1_max_bytes
+        self._ttl = ttl_seconds or settings.cache_l1_ttl_seconds
+        # key -> (expires_at, size, value), ordered from least to most recently used
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self._evict(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        found = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        size = len(orjson.dumps(value, default=str))
+        if size > self._max_bytes:
+            return
+
+        self._evict(key)
+
+        ttl = min(ttl_seconds, self._ttl) if ttl_seconds else self._ttl
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self._bytes += size
+
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._evict(oldest)
+
+    async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        for key, value in items.items():
+            await self.set(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self._evict(key)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        for key in keys:
+            self._evict(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def _evict(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
@@ -0,0 +1,48 @@
+import redis.asyncio as redis
+
+from src.core import settings
+from .redis import create_client
+
+
+class RedisRecentWrites:
+
+    # Applicants written in the last few seconds; their reads go to the primary until replicas have caught up
+    def __init__(self, url: str | None = None, ttl_seconds: int | None = None):
+        self._url = url or settings.redis_url
+        self._ttl = ttl_seconds or settings.db_read_your_writes_ttl_seconds
+        self._client: redis.Redis | None = None
+
+    def _key(self, applicant_id: str) -> str:
+        # Outside the loan_application: prefix so markers don't trigger L1 tracking invalidations
+        return f"recent_write:loan_application:{applicant_id}"
+
+    async def connect(self) -> None:
+        if self._client is None:
+            self._client = create_client(self._url)
+
+    async def disconnect(self) -> None:
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    async def mark_many(self, applicant_ids: list[str]) -> None:
+        if not applicant_ids:
+            return
+
+        if not self._client:
+            await self.connect()
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for applicant_id in applicant_ids:
+                pipe.set(self._key(applicant_id), 1, ex=self._ttl)
+            await pipe.execute()
+
+    async def recent_many(self, applicant_ids: list[str]) -> set[str]:
+        if not applicant_ids:
+            return set()
+
+        if not self._client:
+            await self.connect()
+
+        values = await self._client.mget([self._key(applicant_id) for applicant_id in applicant_ids])
+        return {applicant_id for applicant_id, value in zip(applicant_ids, values) if value is not None}
@@ -1,21 +1,56 @@
-import json
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import redis.asyncio as redis
 
 from src.domain.ports import Cache
 from src.core import settings
+from src.infra.serialization.codecs import Codec, get_codec, decode
+from src.infra.metrics import (
+    CACHE_GET_DURATION,
+    CACHE_GET_MANY_DURATION,
+    CACHE_SET_DURATION,
+    CACHE_SET_MANY_DURATION,
+    CACHE_DELETE_DURATION,
+    CACHE_DELETE_MANY_DURATION,
+    CACHE_REDIS_HITS,
+    CACHE_REDIS_MISSES,
+)
+
+
+def create_client(url: str | None = None) -> redis.Redis:
+    # Blocking pool: at max_connections callers queue for a connection instead of failing
+    pool = redis.BlockingConnectionPool.from_url(
+        url or settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout_seconds,
+        socket_timeout=settings.redis_socket_timeout_seconds,
+        socket_connect_timeout=settings.redis_socket_connect_timeout_seconds,
+        socket_keepalive=settings.redis_socket_keepalive,
+        health_check_interval=settings.redis_health_check_interval_seconds,
+    )
+    return redis.Redis.from_pool(pool)
+
+
+TRACKING_CHANNEL = "__redis__:invalidate"
 
 
 class RedisCache(Cache):
 
-    def __init__(self, url: str | None = None):
+    def __init__(
+        self,
+        url: str | None = None,
+        publish_invalidations: bool = False,
+        codec: Codec | None = None,
+    ):
         self._url = url or settings.redis_url
+        self._codec = codec or get_codec(settings.cache_codec)
+        self._publish_invalidations = publish_invalidations
+        self._channel = settings.cache_invalidation_channel
         self._client: redis.Redis | None = None
 
     async def connect(self) -> None:
         if self._client is None:
-            self._client = redis.from_url(self._url, decode_responses=True)
+            self._client = create_client(self._url)
 
     async def disconnect(self) -> None:
         if self._client:
@@ -26,25 +61,150 @@ class RedisCache(Cache):
         if not self._client:
             await self.connect()
 
-        value = await self._client.get(key)
+        with CACHE_GET_DURATION.time():
+            value = await self._client.get(key)
 
         if value:
-            return json.loads(value)
+            CACHE_REDIS_HITS.inc()
+            return decode(value)
 
+        CACHE_REDIS_MISSES.inc()
         return None
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        if not keys:
+            return {}
+
+        if not self._client:
+            await self.connect()
+
+        with CACHE_GET_MANY_DURATION.time():
+            values = await self._client.mget(keys)
+
+        found = {key: decode(value) for key, value in zip(keys, values) if value}
+        CACHE_REDIS_HITS.inc(len(found))
+        CACHE_REDIS_MISSES.inc(len(keys) - len(found))
+        return found
+
     async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
         if not self._client:
             await self.connect()
 
-        serialized = json.dumps(value)
+        serialized = self._codec.encode(value)
+        ttl = ttl_seconds or settings.cache_ttl_seconds
+
+        with CACHE_SET_DURATION.time():
+            if not self._publish_invalidations:
+                await self._client.setex(key, ttl, serialized)
+                return
+
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.setex(key, ttl, serialized)
+                pipe.publish(self._channel, key)
+                await pipe.execute()
+
+    async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        if not items:
+            return
+
+        if not self._client:
+            await self.connect()
+
         ttl = ttl_seconds or settings.cache_ttl_seconds
 
-        await self._client.setex(key, ttl, serialized)
+        with CACHE_SET_MANY_DURATION.time():
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, self._codec.encode(value))
+                    if self._publish_invalidations:
+                        pipe.publish(self._channel, key)
+                await pipe.execute()
 
     async def delete(self, key: str) -> None:
         if not self._client:
             await self.connect()
 
-        await self._client.delete(key)
+        with CACHE_DELETE_DURATION.time():
+            await self._client.delete(key)
+
+            if self._publish_invalidations:
+                await self._client.publish(self._channel, key)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+
+        if not self._client:
+            await self.connect()
+
+        with CACHE_DELETE_MANY_DURATION.time():
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                if self._publish_invalidations:
+                    for key in keys:
+                        pipe.publish(self._channel, key)
+                await pipe.execute()
+
+    async def listen_invalidations(self, handler: Callable[[str], Awaitable[None]]) -> None:
+        if not self._client:
+            await self.connect()
+
+        async with self._client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(self._channel)
+            async for message in pubsub.listen():
+                await handler(message["data"].decode("utf-8"))
+
+    async def listen_tracking_invalidations(
+        self,
+        prefix: str,
+        handler: Callable[[str], Awaitable[None]],
+        on_flush: Callable[[], None],
+    ) -> None:
+        if not self._client:
+            await self.connect()
 
+        pool = self._client.connection_pool
+        listener = await pool.get_connection("SUBSCRIBE")
+        tracker = await pool.get_connection("CLIENT")
+
+        try:
+            await listener.send_command("CLIENT", "ID")
+            listener_id = await listener.read_response()
+            await listener.send_command("SUBSCRIBE", TRACKING_CHANNEL)
+            await listener.read_response()
+
+            # Server-assisted client-side caching: Redis itself reports every write, delete,
+            # expiry and eviction under the prefix, whichever client caused it. Broadcast mode
+            # needs no per-key bookkeeping, and REDIRECT lets the RESP2 pub/sub connection
+            # receive what RESP3 would push inline. Tracking lives as long as this connection
+            await tracker.send_command("CLIENT", "TRACKING", "ON", "REDIRECT", listener_id, "BCAST", "PREFIX", prefix)
+            await tracker.read_response()
+
+            idle_seconds = settings.redis_health_check_interval_seconds or 30
+            while True:
+                message = await listener.read_response(timeout=idle_seconds)
+
+                if message is None:
+                    # Idle: make sure neither connection was silently dropped. A dead tracker would
+                    # stop invalidations without an error, so it is checked through a round trip
+                    await listener.send_packed_command(listener.pack_command("PING"), check_health=False)
+                    await tracker.send_command("PING")
+                    await tracker.read_response()
+                    continue
+
+                if message[0] != b"message":
+                    continue
+
+                keys = message[2]
+                if keys is None:
+                    # FLUSHALL/FLUSHDB, or the server lost track: nothing in L1 can be trusted
+                    on_flush()
+                    continue
+
+                for key in keys:
+                    await handler(key.decode("utf-8"))
+        finally:
+            await listener.disconnect()
+            await tracker.disconnect()
+            await pool.release(listener)
+            await pool.release(tracker)
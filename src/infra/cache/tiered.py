@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from typing import Any
+
+from src.core import settings
+from src.domain.ports import Cache
+from src.infra.metrics import CACHE_L1_HITS, CACHE_L1_MISSES
+from .memory import InMemoryLRUCache
+from .redis import RedisCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class TieredCache(Cache):
+
+    def __init__(self, l1: InMemoryLRUCache, l2: RedisCache, invalidation: str | None = None):
+        self._l1 = l1
+        self._l2 = l2
+        self._invalidation = invalidation or settings.cache_l1_invalidation
+        self._listener: asyncio.Task | None = None
+        self.stats = {
+            "l1": {"hits": 0, "misses": 0},
+            "l2": {"hits": 0, "misses": 0},
+        }
+
+    async def connect(self) -> None:
+        await self._l2.connect()
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen_invalidations())
+
+    async def disconnect(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        self._l1.clear()
+        await self._l2.disconnect()
+
+    async def get(self, key: str) -> Any | None:
+        value = await self._l1.get(key)
+        if value is not None:
+            self.stats["l1"]["hits"] += 1
+            CACHE_L1_HITS.inc()
+            return value
+        self.stats["l1"]["misses"] += 1
+        CACHE_L1_MISSES.inc()
+
+        value = await self._l2.get(key)
+        if value is None:
+            self.stats["l2"]["misses"] += 1
+            return None
+        self.stats["l2"]["hits"] += 1
+
+        await self._l1.set(key, value)
+        return value
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        found = await self._l1.get_many(keys)
+        self.stats["l1"]["hits"] += len(found)
+        self.stats["l1"]["misses"] += len(keys) - len(found)
+        CACHE_L1_HITS.inc(len(found))
+        CACHE_L1_MISSES.inc(len(keys) - len(found))
+
+        missing = [key for key in keys if key not in found]
+        if not missing:
+            return found
+
+        from_l2 = await self._l2.get_many(missing)
+        self.stats["l2"]["hits"] += len(from_l2)
+        self.stats["l2"]["misses"] += len(missing) - len(from_l2)
+
+        await self._l1.set_many(from_l2)
+        found.update(from_l2)
+        return found
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        await self._l2.set(key, value, ttl_seconds)
+        await self._l1.set(key, value, ttl_seconds)
+
+    async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        await self._l2.set_many(items, ttl_seconds)
+        await self._l1.set_many(items, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        await self._l1.delete(key)
+        await self._l2.delete(key)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        await self._l1.delete_many(keys)
+        await self._l2.delete_many(keys)
+
+    async def _listen_invalidations(self) -> None:
+        while True:
+            try:
+                if self._invalidation == "tracking":
+                    await self._l2.listen_tracking_invalidations(
+                        settings.cache_l1_tracking_prefix,
+                        self._l1.delete,
+                        self._l1.clear,
+                    )
+                else:
+                    await self._l2.listen_invalidations(self._l1.delete)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Invalidations may have been missed while disconnected
+                logger.warning(f"Cache invalidation listener failed, flushing L1: {e}")
+                self._l1.clear()
+                await asyncio.sleep(1)
@@ -0,0 +1,110 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.idempotency import content_hash
+
+
+STAGING_TABLE = "loan_applications_staging"
+
+COLUMNS = (
+    "id",
+    "applicant_id",
+    "amount",
+    "term_months",
+    "status",
+    "created_at",
+    "processed_at",
+    "rejection_reason",
+    "content_hash",
+)
+
+# Per connection and emptied by every commit, so each batch starts from an empty table
+CREATE_STAGING = text(
+    f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} "
+    "(LIKE loan_applications INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+)
+
+# Same rules as PostgresLoanApplicationRepository._upsert: a row with the same content hash is left alone, and
+# only rows actually written feed the projection. A rerun of a committed batch may reach a different decision
+# (its own rows are now history); neither table may take it, or the two would disagree
+MERGE = text(f"""
+    WITH written AS (
+        INSERT INTO loan_applications ({", ".join(COLUMNS)})
+        SELECT {", ".join(COLUMNS)} FROM {STAGING_TABLE}
+        ON CONFLICT (id, created_at) DO UPDATE SET
+            applicant_id = EXCLUDED.applicant_id,
+            amount = EXCLUDED.amount,
+            term_months = EXCLUDED.term_months,
+            status = EXCLUDED.status,
+            processed_at = EXCLUDED.processed_at,
+            rejection_reason = EXCLUDED.rejection_reason,
+            content_hash = EXCLUDED.content_hash
+        WHERE loan_applications.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+        RETURNING id, applicant_id, amount, term_months, status, created_at, processed_at, rejection_reason
+    ),
+    -- DISTINCT ON keeps each applicant's newest written row, in applicant order so concurrent writers lock alike
+    latest AS (
+        INSERT INTO latest_loan_application (
+            applicant_id, application_id, amount, term_months, status, created_at, processed_at, rejection_reason
+        )
+        SELECT DISTINCT ON (applicant_id)
+            applicant_id, id, amount, term_months, status, created_at, processed_at, rejection_reason
+        FROM written
+        ORDER BY applicant_id, created_at DESC
+        ON CONFLICT (applicant_id) DO UPDATE SET
+            application_id = EXCLUDED.application_id,
+            amount = EXCLUDED.amount,
+            term_months = EXCLUDED.term_months,
+            status = EXCLUDED.status,
+            created_at = EXCLUDED.created_at,
+            processed_at = EXCLUDED.processed_at,
+            rejection_reason = EXCLUDED.rejection_reason
+        WHERE latest_loan_application.created_at <= EXCLUDED.created_at
+    )
+    SELECT count(*) FROM written
+""")
+
+
+class PostgresBulkLoader:
+
+    # COPY into a temp staging table, then one INSERT ... SELECT merge: no bind parameter cap, no per-row
+    # statement, and the upsert semantics of the repository are kept
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def load(self, applications: list[LoanApplication]) -> int:
+        if not applications:
+            return 0
+
+        # ON CONFLICT cannot touch the same row twice in one statement; keep the last write per id
+        unique = list({application.id: application for application in applications}.values())
+
+        conn = await self._session.connection()
+        await conn.execute(CREATE_STAGING)
+
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            STAGING_TABLE,
+            records=[self._to_record(application) for application in unique],
+            columns=COLUMNS,
+        )
+
+        written = (await conn.execute(MERGE)).scalar_one()
+        await self._session.commit()
+
+        return written
+
+    @staticmethod
+    def _to_record(application: LoanApplication) -> tuple:
+        return (
+            application.id,
+            application.applicant_id,
+            application.amount,
+            application.term_months,
+            application.status.value,
+            application.created_at,
+            application.processed_at,
+            application.rejection_reason,
+            content_hash(application),
+        )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import String, Float, Integer, DateTime, Text
+from sqlalchemy import String, Float, Integer, DateTime, Text, Index, desc
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,15 +13,24 @@ from src.domain.applications.loan.value_objects import LoanApplicationStatus
 class LoanApplicationModel(Base):
 
     __tablename__ = "loan_applications"
+    # Serves WHERE applicant_id = ? ORDER BY created_at DESC LIMIT 1 and the (created_at, id) history keyset without a sort
+    __table_args__ = (
+        Index("ix_loan_applications_applicant_id_created_at_id", "applicant_id", desc("created_at"), desc("id")),
+        # Monthly range partitions, created ahead by init_db() and the partition maintenance command
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    applicant_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    applicant_id: Mapped[str] = mapped_column(String(255), nullable=False)
     amount: Mapped[float] = mapped_column(Float, nullable=False)
     term_months: Mapped[int] = mapped_column(Integer, nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    # Part of the primary key because a partitioned table's unique constraints must include the partition key
+    created_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True, default=datetime.utcnow)
     processed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     rejection_reason: Mapped[str] = mapped_column(Text, nullable=True)
+    # Hash of the submitted fields; an upsert carrying the same hash is a redelivery and leaves the row alone
+    content_hash: Mapped[str] = mapped_column(String(32), nullable=True)
 
     def to_entity(self) -> LoanApplication:
         return LoanApplication(
@@ -48,3 +57,29 @@ class LoanApplicationModel(Base):
             rejection_reason=entity.rejection_reason,
         )
 
+
+class LatestLoanApplicationModel(Base):
+
+    # One row per applicant, upserted alongside loan_applications so status reads are a primary-key lookup
+    __tablename__ = "latest_loan_application"
+
+    applicant_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    application_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    amount: Mapped[float] = mapped_column(Float, nullable=False)
+    term_months: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    processed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    rejection_reason: Mapped[str] = mapped_column(Text, nullable=True)
+
+    def to_entity(self) -> LoanApplication:
+        return LoanApplication(
+            id=self.application_id,
+            applicant_id=self.applicant_id,
+            amount=self.amount,
+            term_months=self.term_months,
+            status=LoanApplicationStatus(self.status),
+            created_at=self.created_at,
+            processed_at=self.processed_at,
+            rejection_reason=self.rejection_reason,
+        )
@@ -1,52 +1,419 @@
+import logging
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select, desc
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, desc, tuple_
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.core import settings
 from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.idempotency import content_hash
 from src.domain.applications.loan.ports import LoanApplicationRepository
-from .model import LoanApplicationModel
+from src.infra.metrics import (
+    REPOSITORY_SAVE_MANY,
+    REPOSITORY_GET_BY_ID,
+    REPOSITORY_GET_BY_APPLICANT_ID,
+    REPOSITORY_GET_MANY_BY_APPLICANT_IDS,
+    REPOSITORY_LIST_BY_APPLICANT_ID,
+    DUPLICATES_SKIPPED_DATABASE,
+    DB_READS_PRIMARY,
+    DB_READS_REPLICA,
+)
+from src.infra.cache.recent_writes import RedisRecentWrites
+from src.infra.db.replicas import Replica, ReplicaRouter
+from .model import LoanApplicationModel, LatestLoanApplicationModel
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# asyncpg caps a statement at 32767 bind parameters
+MAX_ROWS_PER_STATEMENT = 4000
 
 
 class PostgresLoanApplicationRepository(LoanApplicationRepository):
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        read_latest_projection: bool | None = None,
+        recent_writes: RedisRecentWrites | None = None,
+    ):
         self._session = session
+        self._read_latest_projection = (
+            settings.db_latest_projection_enabled if read_latest_projection is None else read_latest_projection
+        )
+        self._recent_writes = recent_writes
+        self._lookback = timedelta(days=settings.db_latest_lookback_days)
+
+    def _created_after(self, created_after: datetime | None) -> datetime | None:
+        # Bounding created_at lets PostgreSQL prune partitions older than the hint instead of probing each one
+        if created_after is None and self._lookback:
+            return datetime.utcnow() - self._lookback
+        return created_after
 
     async def save(self, entity: LoanApplication) -> LoanApplication:
-        existing = await self._session.get(LoanApplicationModel, entity.id)
-
-        if existing:
-            existing.applicant_id = entity.applicant_id
-            existing.amount = entity.amount
-            existing.term_months = entity.term_months
-            existing.status = entity.status.value
-            existing.processed_at = entity.processed_at
-            existing.rejection_reason = entity.rejection_reason
-            model = existing
-        else:
-            model = LoanApplicationModel.from_entity(entity)
-            self._session.add(model)
+        saved = await self.save_many([entity])
+        if saved:
+            return saved[0]
+
+        # A redelivery the upsert skipped: report what is stored, not this attempt's result
+        return await self.get_by_id(entity.id)
 
+    async def save_many(self, entities: list[LoanApplication]) -> list[LoanApplication]:
+        if not entities:
+            return []
+
+        with REPOSITORY_SAVE_MANY.time():
+            return await self._upsert(entities)
+
+    async def _upsert(self, entities: list[LoanApplication]) -> list[LoanApplication]:
+        # ON CONFLICT cannot touch the same row twice in one statement; keep the last write per id
+        unique = list({entity.id: entity for entity in entities}.values())
+        rows = [self._to_row(entity) for entity in unique]
+        written_ids: set[UUID] = set()
+        table = LoanApplicationModel.__table__
+
+        for start in range(0, len(rows), MAX_ROWS_PER_STATEMENT):
+            stmt = insert(table).values(rows[start:start + MAX_ROWS_PER_STATEMENT])
+            stmt = stmt.on_conflict_do_update(
+                # The primary key of the partitioned table; a redelivery carries the created_at it was submitted with
+                index_elements=[table.c.id, table.c.created_at],
+                set_={
+                    "applicant_id": stmt.excluded.applicant_id,
+                    "amount": stmt.excluded.amount,
+                    "term_months": stmt.excluded.term_months,
+                    "status": stmt.excluded.status,
+                    "processed_at": stmt.excluded.processed_at,
+                    "rejection_reason": stmt.excluded.rejection_reason,
+                    "content_hash": stmt.excluded.content_hash,
+                },
+                # Source of truth for idempotency: a redelivery with the same content updates nothing
+                where=table.c.content_hash.is_distinct_from(stmt.excluded.content_hash),
+            ).returning(table.c.id)
+
+            # Core statement: plain values back, no ORM instances or identity map entries
+            result = await self._session.execute(stmt)
+            written_ids.update(result.scalars().all())
+
+        written = []
+        written_rows = []
+        for entity, row in zip(unique, rows):
+            if entity.id in written_ids:
+                written.append(entity)
+                written_rows.append(row)
+
+        DUPLICATES_SKIPPED_DATABASE.inc(len(unique) - len(written))
+
+        # The projection is written in the same transaction even when reads don't use it yet,
+        # so it is already complete when the read flag is switched on
+        if written_rows:
+            await self._upsert_latest(written_rows)
         await self._session.commit()
-        await self._session.refresh(model)
 
-        return model.to_entity()
+        if self._recent_writes and written:
+            await self._mark_recent_writes(written)
+
+        return written
+
+    async def _mark_recent_writes(self, written: list[LoanApplication]) -> None:
+        try:
+            await self._recent_writes.mark_many(list({entity.applicant_id for entity in written}))
+        except Exception as e:
+            # Already committed; the worst case is one stale read from a lagging replica
+            logger.warning(f"Failed to mark recent writes for read-your-writes: {e}")
+
+    async def _upsert_latest(self, rows: list[dict]) -> None:
+        latest: dict[str, dict] = {}
+        for row in rows:
+            current = latest.get(row["applicant_id"])
+            if current is None or row["created_at"] >= current["created_at"]:
+                latest[row["applicant_id"]] = row
+
+        # Sorted so concurrent writers lock projection rows in the same order
+        projection_rows = [self._to_latest_row(latest[applicant_id]) for applicant_id in sorted(latest)]
+
+        for start in range(0, len(projection_rows), MAX_ROWS_PER_STATEMENT):
+            stmt = insert(LatestLoanApplicationModel).values(projection_rows[start:start + MAX_ROWS_PER_STATEMENT])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[LatestLoanApplicationModel.applicant_id],
+                set_={
+                    "application_id": stmt.excluded.application_id,
+                    "amount": stmt.excluded.amount,
+                    "term_months": stmt.excluded.term_months,
+                    "status": stmt.excluded.status,
+                    "created_at": stmt.excluded.created_at,
+                    "processed_at": stmt.excluded.processed_at,
+                    "rejection_reason": stmt.excluded.rejection_reason,
+                },
+                # A replayed or late older application must not replace a newer one
+                where=LatestLoanApplicationModel.created_at <= stmt.excluded.created_at,
+            )
+            await self._session.execute(stmt)
 
     async def get_by_id(self, entity_id: UUID) -> LoanApplication | None:
-        model = await self._session.get(LoanApplicationModel, entity_id)
+        # No created_at to prune on: one primary key index probe per partition
+        query = select(LoanApplicationModel).where(LoanApplicationModel.id == entity_id).limit(1)
+
+        with REPOSITORY_GET_BY_ID.time():
+            result = await self._session.scalars(query)
+            model = result.first()
         return model.to_entity() if model else None
 
-    async def get_by_applicant_id(self, applicant_id: str) -> LoanApplication | None:
+    async def get_by_applicant_id(
+        self,
+        applicant_id: str,
+        created_after: datetime | None = None,
+    ) -> LoanApplication | None:
+        created_after = self._created_after(created_after)
+
+        if self._read_latest_projection:
+            with REPOSITORY_GET_BY_APPLICANT_ID.time():
+                latest = await self._session.get(LatestLoanApplicationModel, applicant_id)
+            if latest is None or (created_after is not None and latest.created_at < created_after):
+                return None
+            return latest.to_entity()
+
         query = (
             select(LoanApplicationModel)
             .where(LoanApplicationModel.applicant_id == applicant_id)
             .order_by(desc(LoanApplicationModel.created_at))
             .limit(1)
         )
+        if created_after is not None:
+            query = query.where(LoanApplicationModel.created_at >= created_after)
 
-        result = await self._session.execute(query)
-        model = result.scalar_one_or_none()
+        with REPOSITORY_GET_BY_APPLICANT_ID.time():
+            result = await self._session.execute(query)
+            model = result.scalar_one_or_none()
 
         return model.to_entity() if model else None
 
+    async def get_many_by_applicant_ids(self, applicant_ids: list[str]) -> dict[str, LoanApplication]:
+        if not applicant_ids:
+            return {}
+
+        created_after = self._created_after(None)
+
+        if self._read_latest_projection:
+            query = select(LatestLoanApplicationModel).where(LatestLoanApplicationModel.applicant_id.in_(applicant_ids))
+            if created_after is not None:
+                query = query.where(LatestLoanApplicationModel.created_at >= created_after)
+
+            with REPOSITORY_GET_MANY_BY_APPLICANT_IDS.time():
+                result = await self._session.scalars(query)
+                projections = result.all()
+
+            return {projection.applicant_id: projection.to_entity() for projection in projections}
+
+        # One round trip: DISTINCT ON keeps the first row per applicant in ORDER BY order
+        query = (
+            select(LoanApplicationModel)
+            .where(LoanApplicationModel.applicant_id.in_(applicant_ids))
+            .distinct(LoanApplicationModel.applicant_id)
+            .order_by(LoanApplicationModel.applicant_id, desc(LoanApplicationModel.created_at))
+        )
+        if created_after is not None:
+            query = query.where(LoanApplicationModel.created_at >= created_after)
+
+        with REPOSITORY_GET_MANY_BY_APPLICANT_IDS.time():
+            result = await self._session.scalars(query)
+            models = result.all()
+
+        return {model.applicant_id: model.to_entity() for model in models}
+
+    async def list_by_applicant_id(
+        self,
+        applicant_id: str,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[LoanApplication]:
+        model = LoanApplicationModel
+        query = (
+            select(model)
+            .where(model.applicant_id == applicant_id)
+            .order_by(desc(model.created_at), desc(model.id))
+            .limit(limit)
+        )
+        # Keyset, not OFFSET: the index seeks straight to the cursor however deep the page is
+        if after is not None:
+            query = query.where(tuple_(model.created_at, model.id) < tuple_(*after))
+
+        with REPOSITORY_LIST_BY_APPLICANT_ID.time():
+            result = await self._session.scalars(query)
+            models = result.all()
+
+        return [model.to_entity() for model in models]
+
+    async def stream(
+        self,
+        applicant_id: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[LoanApplication]:
+        model = LoanApplicationModel
+        query = select(model)
+        if applicant_id is not None:
+            query = query.where(model.applicant_id == applicant_id).order_by(model.created_at, model.id)
+        if created_from is not None:
+            query = query.where(model.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(model.created_at < created_to)
+
+        # Server-side cursor: rows arrive yield_per at a time, so memory stays flat however large the export
+        result = await self._session.stream_scalars(query.execution_options(yield_per=settings.db_stream_yield_per))
+        async for row in result:
+            yield row.to_entity()
+
+    @staticmethod
+    def _to_row(entity: LoanApplication) -> dict:
+        return {
+            "id": entity.id,
+            "applicant_id": entity.applicant_id,
+            "amount": entity.amount,
+            "term_months": entity.term_months,
+            "status": entity.status.value,
+            "created_at": entity.created_at,
+            "processed_at": entity.processed_at,
+            "rejection_reason": entity.rejection_reason,
+            "content_hash": content_hash(entity),
+        }
+
+    @staticmethod
+    def _to_latest_row(row: dict) -> dict:
+        return {
+            "applicant_id": row["applicant_id"],
+            "application_id": row["id"],
+            "amount": row["amount"],
+            "term_months": row["term_months"],
+            "status": row["status"],
+            "created_at": row["created_at"],
+            "processed_at": row["processed_at"],
+            "rejection_reason": row["rejection_reason"],
+        }
+
+
+class LazySessionLoanApplicationRepository(LoanApplicationRepository):
+
+    # Safe to share across requests: a session is opened per call, so only calls that reach PostgreSQL pay for one
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        replicas: ReplicaRouter | None = None,
+        recent_writes: RedisRecentWrites | None = None,
+    ):
+        self._session_factory = session_factory
+        self._replicas = replicas
+        self._recent_writes = recent_writes
+
+    async def save(self, entity: LoanApplication) -> LoanApplication:
+        async with self._session_factory() as session:
+            return await self._repository(session).save(entity)
+
+    async def save_many(self, entities: list[LoanApplication]) -> list[LoanApplication]:
+        async with self._session_factory() as session:
+            return await self._repository(session).save_many(entities)
+
+    async def get_by_id(self, entity_id: UUID) -> LoanApplication | None:
+        # Not routed: an id carries no applicant to check for a recent write
+        async with self._session_factory() as session:
+            return await self._repository(session).get_by_id(entity_id)
+
+    async def get_by_applicant_id(
+        self,
+        applicant_id: str,
+        created_after: datetime | None = None,
+    ) -> LoanApplication | None:
+        return await self._read(
+            [applicant_id],
+            lambda repository: repository.get_by_applicant_id(applicant_id, created_after),
+        )
+
+    async def get_many_by_applicant_ids(self, applicant_ids: list[str]) -> dict[str, LoanApplication]:
+        return await self._read(applicant_ids, lambda repository: repository.get_many_by_applicant_ids(applicant_ids))
+
+    async def list_by_applicant_id(
+        self,
+        applicant_id: str,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[LoanApplication]:
+        return await self._read([applicant_id], lambda repository: repository.list_by_applicant_id(applicant_id, limit, after))
+
+    async def stream(
+        self,
+        applicant_id: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[LoanApplication]:
+        replica = await self._pick_replica([applicant_id] if applicant_id is not None else [])
+
+        if replica is not None:
+            yielded = False
+            try:
+                async with replica.session_factory() as session:
+                    async for application in PostgresLoanApplicationRepository(session).stream(
+                        applicant_id, created_from, created_to
+                    ):
+                        yielded = True
+                        yield application
+                DB_READS_REPLICA.inc()
+                return
+            except (DBAPIError, OSError) as e:
+                if not ReplicaRouter.is_connection_failure(e):
+                    raise
+                self._replicas.mark_unhealthy(replica, e)
+                # Rows already sent cannot be taken back; only an export that failed before its first row moves over
+                if yielded:
+                    raise
+
+        async with self._session_factory() as session:
+            async for application in self._repository(session).stream(applicant_id, created_from, created_to):
+                yield application
+        DB_READS_PRIMARY.inc()
+
+    def _repository(self, session: AsyncSession) -> PostgresLoanApplicationRepository:
+        return PostgresLoanApplicationRepository(session, recent_writes=self._recent_writes)
+
+    async def _read(
+        self,
+        applicant_ids: list[str],
+        read: Callable[[PostgresLoanApplicationRepository], Awaitable[T]],
+    ) -> T:
+        replica = await self._pick_replica(applicant_ids)
+
+        if replica is not None:
+            try:
+                async with replica.session_factory() as session:
+                    result = await read(PostgresLoanApplicationRepository(session))
+                DB_READS_REPLICA.inc()
+                return result
+            except (DBAPIError, OSError) as e:
+                if not ReplicaRouter.is_connection_failure(e):
+                    raise
+                self._replicas.mark_unhealthy(replica, e)
+
+        async with self._session_factory() as session:
+            result = await read(self._repository(session))
+        DB_READS_PRIMARY.inc()
+        return result
+
+    async def _pick_replica(self, applicant_ids: list[str]) -> Replica | None:
+        if self._replicas is None:
+            return None
+
+        if self._recent_writes:
+            try:
+                # One recently written applicant sends the whole batch to the primary
+                if await self._recent_writes.recent_many(applicant_ids):
+                    return None
+            except Exception as e:
+                logger.warning(f"Read-your-writes check failed, reading from the primary: {e}")
+                return None
+
+        return self._replicas.pick()
@@ -9,6 +9,7 @@ from alembic import context
 from src.core import settings
 from src.infra.db.session import Base
 from src.infra.db.loan_application.model import LoanApplicationModel  # noqa: F401
+from src.infra.db.outbox.model import OutboxMessageModel  # noqa: F401
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.database_url)
@@ -0,0 +1,27 @@
+"""loan application content hash
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable with no default: a metadata-only change, no table rewrite. Existing rows get their hash on the next write
+    op.execute("ALTER TABLE loan_applications ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32)")
+
+
+def downgrade() -> None:
+    op.drop_column("loan_applications", "content_hash")
@@ -0,0 +1,41 @@
+"""loan application outbox
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases bootstrapped by init_db() may already have the table; offline (--sql) mode cannot inspect
+    if op.get_context().as_sql or not sa.inspect(op.get_bind()).has_table("loan_application_outbox"):
+        op.create_table(
+            "loan_application_outbox",
+            sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+            sa.Column("topic", sa.String(length=255), nullable=False),
+            sa.Column("key", sa.String(length=255), nullable=True),
+            sa.Column("payload", sa.LargeBinary(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("sent_at", sa.DateTime(), nullable=True),
+        )
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_loan_application_outbox_unsent "
+        "ON loan_application_outbox (id) WHERE sent_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("loan_application_outbox")
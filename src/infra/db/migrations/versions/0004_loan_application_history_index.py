@@ -0,0 +1,62 @@
+"""loan application history index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept local like in 0001, independent of src.infra.db.partitions
+IS_PARTITIONED = sa.text(
+    "SELECT coalesce(bool_or(relkind = 'p'), false) FROM pg_class WHERE oid = to_regclass('loan_applications')"
+)
+
+
+def upgrade() -> None:
+    # A table init_db() created partitioned already has its final index, and partitioned tables
+    # cannot be indexed CONCURRENTLY
+    if op.get_context().as_sql or not op.get_bind().scalar(IS_PARTITIONED):
+        # id breaks created_at ties, so keyset pages read the index in order with no sort step
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_loan_applications_applicant_id_created_at_id",
+                "loan_applications",
+                ["applicant_id", sa.text("created_at DESC"), sa.text("id DESC")],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            # Every lookup the old index served is a prefix of the new one
+            op.drop_index(
+                "ix_loan_applications_applicant_id_created_at",
+                table_name="loan_applications",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_loan_applications_applicant_id_created_at",
+            "loan_applications",
+            ["applicant_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_loan_applications_applicant_id_created_at_id",
+            table_name="loan_applications",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
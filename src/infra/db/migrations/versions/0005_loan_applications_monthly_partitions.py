@@ -0,0 +1,108 @@
+"""loan applications monthly partitions
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.core import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Local copies of the src.infra.db.partitions helpers this migration was written against
+IS_PARTITIONED = sa.text(
+    "SELECT coalesce(bool_or(relkind = 'p'), false) FROM pg_class WHERE oid = to_regclass('loan_applications')"
+)
+
+
+def month_start(moment: datetime) -> datetime:
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(moment: datetime, months: int) -> datetime:
+    index = moment.year * 12 + moment.month - 1 + months
+    return moment.replace(year=index // 12, month=index % 12 + 1)
+
+
+def upgrade() -> None:
+    # Databases bootstrapped by init_db() already have the partitioned table; offline (--sql) mode cannot inspect
+    if not op.get_context().as_sql and op.get_bind().scalar(IS_PARTITIONED):
+        return
+
+    # Built up front without blocking writes; ATTACH adopts it for the new (id, created_at) primary key
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "loan_applications_legacy_id_created_at_key",
+            "loan_applications",
+            ["id", "created_at"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    # The existing table becomes the first partition instead of being copied: it covers everything
+    # up to the month after its newest row, and monthly partitions take over from there
+    newest = datetime.utcnow()
+    if not op.get_context().as_sql:
+        stored = op.get_bind().execute(sa.text("SELECT max(created_at) FROM loan_applications")).scalar()
+        newest = max(newest, stored or newest)
+    boundary = add_months(month_start(newest), 1)
+
+    op.execute("ALTER TABLE loan_applications RENAME TO loan_applications_legacy")
+    op.execute("ALTER TABLE loan_applications_legacy RENAME CONSTRAINT loan_applications_pkey TO loan_applications_legacy_pkey")
+    op.execute(
+        "ALTER INDEX ix_loan_applications_applicant_id_created_at_id "
+        "RENAME TO ix_loan_applications_legacy_applicant_id_created_at_id"
+    )
+
+    op.execute("CREATE TABLE loan_applications (LIKE loan_applications_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+    op.execute("ALTER TABLE loan_applications ADD CONSTRAINT loan_applications_pkey PRIMARY KEY (id, created_at)")
+    op.execute(
+        "CREATE INDEX ix_loan_applications_applicant_id_created_at_id "
+        "ON loan_applications (applicant_id, created_at DESC, id DESC)"
+    )
+    # Validates the bound with one scan of the old table; both indexes already exist on it and are attached as-is
+    op.execute(
+        "ALTER TABLE loan_applications ATTACH PARTITION loan_applications_legacy "
+        f"FOR VALUES FROM (MINVALUE) TO ('{boundary.isoformat()}')"
+    )
+
+    for offset in range(settings.db_partition_premake_months + 1):
+        lower, upper = add_months(boundary, offset), add_months(boundary, offset + 1)
+        op.execute(
+            f"CREATE TABLE loan_applications_p{lower:%Y_%m} PARTITION OF loan_applications "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+
+
+def downgrade() -> None:
+    # Rows of partitions detached by retention are not brought back
+    op.execute("ALTER TABLE loan_applications RENAME TO loan_applications_partitioned")
+    op.execute(
+        "ALTER TABLE loan_applications_partitioned "
+        "RENAME CONSTRAINT loan_applications_pkey TO loan_applications_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER INDEX ix_loan_applications_applicant_id_created_at_id "
+        "RENAME TO ix_loan_applications_partitioned_applicant_id_created_at_id"
+    )
+
+    op.execute("CREATE TABLE loan_applications (LIKE loan_applications_partitioned INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO loan_applications SELECT * FROM loan_applications_partitioned")
+    op.execute("ALTER TABLE loan_applications ADD CONSTRAINT loan_applications_pkey PRIMARY KEY (id)")
+    op.execute(
+        "CREATE INDEX ix_loan_applications_applicant_id_created_at_id "
+        "ON loan_applications (applicant_id, created_at DESC, id DESC)"
+    )
+    op.execute("DROP TABLE loan_applications_partitioned")
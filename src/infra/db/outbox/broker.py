@@ -0,0 +1,32 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import settings
+from src.domain.ports import MessageBroker
+from src.infra.serialization.codecs import Codec, get_codec
+from .repository import PostgresOutboxRepository
+
+
+class OutboxMessageBroker(MessageBroker):
+
+    # Publishing is an INSERT + COMMIT; src.relay.main forwards the rows to Kafka
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], codec: Codec | None = None):
+        self._session_factory = session_factory
+        self._codec = codec or get_codec(settings.kafka_codec)
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def publish(self, topic: str, message: Any, key: str | None = None) -> None:
+        await self.publish_many(topic, [(key, message)])
+
+    async def publish_many(self, topic: str, messages: list[tuple[str | None, Any]]) -> None:
+        encoded = [(key, self._codec.encode(message)) for key, message in messages]
+
+        async with self._session_factory() as session:
+            await PostgresOutboxRepository(session).add_many(topic, encoded)
+            await session.commit()
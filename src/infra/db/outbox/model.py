@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, String, LargeBinary, DateTime, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infra.db.session import Base
+
+
+class OutboxMessageModel(Base):
+
+    __tablename__ = "loan_application_outbox"
+    # The relay only ever scans unsent rows in id order; sent rows drop out of the index
+    __table_args__ = (
+        Index("ix_loan_application_outbox_unsent", "id", postgresql_where=text("sent_at IS NULL")),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    topic: Mapped[str] = mapped_column(String(255), nullable=False)
+    key: Mapped[str] = mapped_column(String(255), nullable=True)
+    # Already encoded with KAFKA_CODEC, relayed to Kafka byte for byte
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    sent_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
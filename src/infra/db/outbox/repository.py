@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import select, update, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .model import OutboxMessageModel
+
+
+@dataclass(slots=True)
+class OutboxMessage:
+    id: int
+    topic: str
+    key: str | None
+    payload: bytes
+
+
+class PostgresOutboxRepository:
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add_many(self, topic: str, messages: list[tuple[str | None, bytes]]) -> None:
+        if not messages:
+            return
+
+        now = datetime.utcnow()
+        await self._session.execute(
+            insert(OutboxMessageModel.__table__),
+            [{"topic": topic, "key": key, "payload": payload, "created_at": now} for key, payload in messages],
+        )
+
+    async def claim_unsent(self, limit: int) -> list[OutboxMessage]:
+        # SKIP LOCKED lets several relays drain the table without waiting on each other's batches
+        result = await self._session.execute(
+            select(
+                OutboxMessageModel.id,
+                OutboxMessageModel.topic,
+                OutboxMessageModel.key,
+                OutboxMessageModel.payload,
+            )
+            .where(OutboxMessageModel.sent_at.is_(None))
+            .order_by(OutboxMessageModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return [OutboxMessage(id=row.id, topic=row.topic, key=row.key, payload=row.payload) for row in result]
+
+    async def mark_sent(self, ids: list[int]) -> None:
+        if not ids:
+            return
+
+        await self._session.execute(
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id.in_(ids))
+            .values(sent_at=datetime.utcnow())
+        )
+
+    async def purge_sent(self, before: datetime) -> int:
+        result = await self._session.execute(
+            delete(OutboxMessageModel).where(OutboxMessageModel.sent_at < before)
+        )
+        return result.rowcount
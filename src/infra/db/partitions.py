@@ -0,0 +1,152 @@
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "loan_applications"
+
+IS_PARTITIONED = text(
+    "SELECT coalesce(bool_or(relkind = 'p'), false) FROM pg_class WHERE oid = to_regclass(:table)"
+).bindparams(table=PARENT_TABLE)
+
+BOUND_PATTERN = re.compile(r"FROM \((?:'([^']+)'|MINVALUE)\) TO \((?:'([^']+)'|MAXVALUE)\)")
+
+
+@dataclass(slots=True)
+class Partition:
+    name: str
+    # None for MINVALUE / MAXVALUE
+    lower: datetime | None
+    upper: datetime | None
+
+
+def month_start(moment: datetime) -> datetime:
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(moment: datetime, months: int) -> datetime:
+    index = moment.year * 12 + moment.month - 1 + months
+    return moment.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def parse_bounds(name: str, expression: str) -> Partition:
+    match = BOUND_PATTERN.search(expression)
+    if not match:
+        raise ValueError(f"Unexpected bound for partition {name}: {expression}")
+
+    lower, upper = match.groups()
+    return Partition(
+        name=name,
+        lower=datetime.fromisoformat(lower) if lower else None,
+        upper=datetime.fromisoformat(upper) if upper else None,
+    )
+
+
+def plan_missing(existing: list[Partition], now: datetime, months_ahead: int) -> list[Partition]:
+    planned = []
+    start = month_start(now)
+
+    for offset in range(months_ahead + 1):
+        lower, upper = add_months(start, offset), add_months(start, offset + 1)
+        # Months already covered, e.g. by the pre-partitioning table attached up to a later bound, are skipped
+        overlaps = any(
+            (partition.lower is None or partition.lower < upper) and (partition.upper is None or partition.upper > lower)
+            for partition in existing
+        )
+        if not overlaps:
+            planned.append(Partition(name=partition_name(lower), lower=lower, upper=upper))
+
+    return planned
+
+
+def plan_expired(existing: list[Partition], now: datetime, retention_months: int) -> list[Partition]:
+    if retention_months <= 0:
+        return []
+
+    # Whole months only: a partition goes once its newest possible row is past retention
+    cutoff = add_months(month_start(now), -retention_months)
+    return [partition for partition in existing if partition.upper is not None and partition.upper <= cutoff]
+
+
+async def is_partitioned(conn: AsyncConnection) -> bool:
+    return await conn.scalar(IS_PARTITIONED)
+
+
+async def list_partitions(conn: AsyncConnection) -> list[Partition]:
+    result = await conn.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table)"
+        ),
+        {"table": PARENT_TABLE},
+    )
+    # A DEFAULT partition has no range to plan around
+    return sorted(
+        (parse_bounds(name, expression) for name, expression in result.tuples() if expression != "DEFAULT"),
+        key=lambda partition: partition.lower or datetime.min,
+    )
+
+
+async def create_partitions(conn: AsyncConnection, partitions: list[Partition]) -> None:
+    for partition in partitions:
+        await conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{partition.lower.isoformat()}') TO ('{partition.upper.isoformat()}')"
+        ))
+        logger.info(f"Created partition {partition.name} [{partition.lower:%Y-%m-%d}, {partition.upper:%Y-%m-%d})")
+
+
+async def ensure_partitions(
+    conn: AsyncConnection,
+    months_ahead: int,
+    now: datetime | None = None,
+    dry_run: bool = False,
+) -> list[Partition]:
+    if not await is_partitioned(conn):
+        return []
+
+    missing = plan_missing(await list_partitions(conn), now or datetime.utcnow(), months_ahead)
+    if not dry_run:
+        await create_partitions(conn, missing)
+    return missing
+
+
+async def expire_partitions(
+    engine: AsyncEngine,
+    retention_months: int,
+    archive_schema: str | None = None,
+    now: datetime | None = None,
+    dry_run: bool = False,
+) -> list[Partition]:
+    async with engine.connect() as conn:
+        if not await is_partitioned(conn):
+            return []
+        expired = plan_expired(await list_partitions(conn), now or datetime.utcnow(), retention_months)
+
+    if dry_run or not expired:
+        return expired
+
+    # DETACH ... CONCURRENTLY cannot run in a transaction block, and avoids blocking writers on the parent
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        if archive_schema:
+            await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+
+        for partition in expired:
+            await conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name} CONCURRENTLY"))
+            if archive_schema:
+                await conn.execute(text(f"ALTER TABLE {partition.name} SET SCHEMA {archive_schema}"))
+            logger.info(f"Detached partition {partition.name}" + (f" into schema {archive_schema}" if archive_schema else ""))
+
+    return expired
@@ -0,0 +1,95 @@
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, InterfaceError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Replica:
+    url: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    healthy: bool = True
+
+
+class ReplicaRouter:
+
+    def __init__(self, urls: list[str], health_check_interval_seconds: float | None = None):
+        self._replicas = [self._create_replica(url) for url in urls]
+        self._counter = itertools.count()
+        self._interval = health_check_interval_seconds or settings.db_replica_health_check_interval_seconds
+        self._health_checks: asyncio.Task | None = None
+
+    @staticmethod
+    def _create_replica(url: str) -> Replica:
+        engine = create_async_engine(
+            url,
+            pool_size=settings.db_replica_pool_size,
+            max_overflow=settings.db_replica_max_overflow,
+            pool_pre_ping=True,
+            echo=settings.debug,
+        )
+        return Replica(
+            url=engine.url.render_as_string(hide_password=True),
+            engine=engine,
+            session_factory=async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False),
+        )
+
+    @staticmethod
+    def is_connection_failure(error: Exception) -> bool:
+        # Bad input, statement timeouts and recovery conflicts say nothing about the replica's health
+        # and would fail the same way on the primary
+        if isinstance(error, DBAPIError):
+            return error.connection_invalidated or isinstance(error, InterfaceError) or isinstance(error.orig, OSError)
+        return isinstance(error, OSError)
+
+    def pick(self) -> Replica | None:
+        healthy = [replica for replica in self._replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def mark_unhealthy(self, replica: Replica, error: Exception) -> None:
+        # Taken out of rotation until the next health check succeeds
+        if replica.healthy:
+            logger.warning(f"Read replica {replica.url} marked unhealthy: {error}")
+        replica.healthy = False
+
+    async def check_health(self) -> None:
+        for replica in self._replicas:
+            try:
+                async with replica.engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            except Exception as e:
+                self.mark_unhealthy(replica, e)
+                continue
+
+            if not replica.healthy:
+                logger.info(f"Read replica {replica.url} is healthy again")
+            replica.healthy = True
+
+    async def start(self) -> None:
+        if self._health_checks is None:
+            self._health_checks = asyncio.create_task(self._check_periodically())
+
+    async def _check_periodically(self) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(self._interval)
+
+    async def dispose(self) -> None:
+        if self._health_checks:
+            self._health_checks.cancel()
+            await asyncio.gather(self._health_checks, return_exceptions=True)
+            self._health_checks = None
+        for replica in self._replicas:
+            await replica.engine.dispose()
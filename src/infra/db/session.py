@@ -1,20 +1,35 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.core import settings
+from src.infra.metrics import DB_POOL_CHECKOUT_DURATION, DB_POOL_CONNECTIONS
+from .partitions import ensure_partitions
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+
+    def _do_get(self):
+        with DB_POOL_CHECKOUT_DURATION.time():
+            return super()._do_get()
+
+
 engine = create_async_engine(
     settings.database_url,
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     echo=settings.debug,
+    poolclass=InstrumentedQueuePool,
 )
 
+DB_POOL_CONNECTIONS.labels("checked_out").set_function(lambda: engine.pool.checkedout())
+DB_POOL_CONNECTIONS.labels("idle").set_function(lambda: engine.pool.checkedin())
+DB_POOL_CONNECTIONS.labels("overflow").set_function(lambda: max(engine.pool.overflow(), 0))
+
 async_session = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -30,6 +45,8 @@ async def get_session() -> AsyncSession:
 async def init_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # A freshly created parent has no partitions yet, and inserts into it would fail
+        await ensure_partitions(conn, settings.db_partition_premake_months)
 
 
 async def close_db() -> None:
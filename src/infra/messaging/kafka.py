@@ -1,37 +1,108 @@
-import json
-from typing import AsyncIterator
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable
 
-from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
+from aiokafka import AIOKafkaProducer, AIOKafkaConsumer, ConsumerRebalanceListener, ConsumerRecord, TopicPartition
+from aiokafka.errors import ConsumerStoppedError
+from prometheus_client import Gauge
 
-from src.domain.ports import MessageBroker, MessageConsumer
+from src.domain.ports import MessageBroker, MessageConsumer, ConsumedMessage
 from src.core import settings
+from src.infra.serialization.codecs import Codec, get_codec, decode
+from src.infra.metrics import (
+    KAFKA_PUBLISH_ONE_DURATION,
+    KAFKA_PUBLISH_MANY_DURATION,
+    KAFKA_CONSUMER_LAG,
+    KAFKA_CONSUMER_COMMITTED_LAG,
+)
+
+
+logger = logging.getLogger(__name__)
+
+POLL_TIMEOUT_MS = 500
 
 
 class KafkaMessageBroker(MessageBroker):
 
-    def __init__(self, bootstrap_servers: str | None = None):
+    def __init__(
+        self,
+        bootstrap_servers: str | None = None,
+        delivery_mode: str | None = None,
+        codec: Codec | None = None,
+    ):
         self._bootstrap_servers = bootstrap_servers or settings.kafka_bootstrap_servers
+        self._codec = codec or get_codec(settings.kafka_codec)
+        self._delivery_mode = delivery_mode or settings.kafka_producer_delivery_mode
         self._producer: AIOKafkaProducer | None = None
+        self._pending: set[asyncio.Future] = set()
 
     async def connect(self) -> None:
         if self._producer is None:
             self._producer = AIOKafkaProducer(
                 bootstrap_servers=self._bootstrap_servers,
                 key_serializer=lambda k: k.encode("utf-8") if k else None,
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
+                value_serializer=self._codec.encode,
+                acks=settings.kafka_producer_acks,
+                linger_ms=settings.kafka_producer_linger_ms,
+                max_batch_size=settings.kafka_producer_max_batch_size,
+                compression_type=settings.kafka_producer_compression_type,
             )
             await self._producer.start()
 
     async def disconnect(self) -> None:
         if self._producer:
+            await self._producer.flush()
+            if self._pending:
+                await asyncio.gather(*self._pending, return_exceptions=True)
             await self._producer.stop()
             self._producer = None
 
-    async def publish(self, topic: str, message: dict, key: str | None = None) -> None:
+    async def publish(self, topic: str, message: Any, key: str | None = None) -> None:
         if not self._producer:
             await self.connect()
 
-        await self._producer.send_and_wait(topic, value=message, key=key)
+        with KAFKA_PUBLISH_ONE_DURATION.time():
+            if self._delivery_mode == "wait":
+                await self._producer.send_and_wait(topic, value=message, key=key)
+                return
+
+            future = await self._producer.send(topic, value=message, key=key)
+            self._track(future)
+
+    async def publish_many(self, topic: str, messages: list[tuple[str | None, Any]]) -> None:
+        if not self._producer:
+            await self.connect()
+
+        with KAFKA_PUBLISH_MANY_DURATION.time():
+            futures = [await self._producer.send(topic, value=message, key=key) for key, message in messages]
+
+            if self._delivery_mode == "wait":
+                await asyncio.gather(*futures)
+                return
+
+            for future in futures:
+                self._track(future)
+
+    def _track(self, future: asyncio.Future) -> None:
+        self._pending.add(future)
+        future.add_done_callback(self._on_delivered)
+
+    def _on_delivered(self, future: asyncio.Future) -> None:
+        self._pending.discard(future)
+        if not future.cancelled() and future.exception():
+            logger.error(f"Background delivery failed: {future.exception()}")
+
+
+class RevocationListener(ConsumerRebalanceListener):
+
+    def __init__(self, on_revoked: Callable[[set[TopicPartition]], Awaitable[None]]):
+        self._on_revoked = on_revoked
+
+    async def on_partitions_revoked(self, revoked: set[TopicPartition]) -> None:
+        await self._on_revoked(revoked)
+
+    async def on_partitions_assigned(self, assigned: set[TopicPartition]) -> None:
+        pass
 
 
 class KafkaMessageConsumer(MessageConsumer):
@@ -41,35 +112,154 @@ class KafkaMessageConsumer(MessageConsumer):
         topic: str | None = None,
         bootstrap_servers: str | None = None,
         group_id: str | None = None,
+        enable_auto_commit: bool = True,
+        max_poll_interval_ms: int = 300_000,
     ):
         self._topic = topic or settings.loan_application_topic
         self._bootstrap_servers = bootstrap_servers or settings.kafka_bootstrap_servers
         self._group_id = group_id or settings.kafka_consumer_group
+        self._enable_auto_commit = enable_auto_commit
+        self._max_poll_interval_ms = max_poll_interval_ms
         self._consumer: AIOKafkaConsumer | None = None
+        self._revocation_handler: Callable[[list[tuple[str, int]]], Awaitable[None]] | None = None
+        self._lag_gauges: dict[TopicPartition, Gauge] = {}
         self._running = False
 
     async def start(self) -> None:
         self._consumer = AIOKafkaConsumer(
-            self._topic,
             bootstrap_servers=self._bootstrap_servers,
             group_id=self._group_id,
-            value_deserializer=lambda v: json.loads(v.decode("utf-8")),
+            value_deserializer=decode,
             auto_offset_reset="earliest",
+            enable_auto_commit=self._enable_auto_commit,
+            max_poll_interval_ms=self._max_poll_interval_ms,
         )
+        self._consumer.subscribe([self._topic], listener=RevocationListener(self._on_revoked))
         await self._consumer.start()
         self._running = True
 
+    def set_revocation_handler(self, handler: Callable[[list[tuple[str, int]]], Awaitable[None]] | None) -> None:
+        self._revocation_handler = handler
+
+    async def _on_revoked(self, revoked: set[TopicPartition]) -> None:
+        # Looked up on every rebalance: the handler is usually set after start()
+        if self._revocation_handler and revoked:
+            await self._revocation_handler(sorted((tp.topic, tp.partition) for tp in revoked))
+
     async def stop(self) -> None:
         self._running = False
         if self._consumer:
             await self._consumer.stop()
             self._consumer = None
 
+    def interrupt(self) -> None:
+        self._running = False
+
     async def messages(self) -> AsyncIterator[dict]:
+        async for message in self._poll():
+            yield message.value
+
+    async def records(self) -> AsyncIterator[ConsumedMessage]:
+        async for message in self._poll():
+            yield ConsumedMessage(
+                topic=message.topic,
+                partition=message.partition,
+                offset=message.offset,
+                key=message.key.decode("utf-8") if message.key else None,
+                value=message.value,
+            )
+
+    async def _poll(self) -> AsyncIterator[ConsumerRecord]:
         if not self._consumer:
             raise RuntimeError("Consumer not started")
 
-        async for message in self._consumer:
-            if not self._running:
+        # Auto-commit commits the fetch position, not what was processed: one record per poll keeps it at most
+        # one record ahead, as iterating the client did. The prefetched buffer still saves the round trips
+        max_records = 1 if self._enable_auto_commit else None
+
+        # Polls with a timeout rather than iterating the client, which blocks until the next record
+        # arrives: interrupt() has to end the loop on an idle topic too
+        while self._running:
+            try:
+                records = await self._consumer.getmany(timeout_ms=POLL_TIMEOUT_MS, max_records=max_records)
+            except ConsumerStoppedError:
                 break
-            yield message.value
+
+            self._record_lag(records)
+            fetched = [message for partition_records in records.values() for message in partition_records]
+            for index, message in enumerate(fetched):
+                if not self._running:
+                    self._rewind(fetched[index:])
+                    return
+                yield message
+
+    def _rewind(self, unyielded: list[ConsumerRecord]) -> None:
+        # getmany() already moved the position past these; seek back so no commit covers them
+        first_offsets: dict[TopicPartition, int] = {}
+        for message in unyielded:
+            first_offsets.setdefault(TopicPartition(message.topic, message.partition), message.offset)
+        for tp, offset in first_offsets.items():
+            self._consumer.seek(tp, offset)
+
+    async def batches(self, max_records: int | Callable[[], int], linger_ms: int) -> AsyncIterator[list[dict]]:
+        if not self._consumer:
+            raise RuntimeError("Consumer not started")
+
+        while self._running:
+            # A callable lets the adaptive controller resize batches between polls
+            limit = max_records() if callable(max_records) else max_records
+            try:
+                records = await self._consumer.getmany(timeout_ms=linger_ms, max_records=limit)
+            except ConsumerStoppedError:
+                break
+
+            self._record_lag(records)
+            batch = [record.value for partition_records in records.values() for record in partition_records]
+
+            if batch and self._running:
+                yield batch
+
+    def _record_lag(self, records: dict[TopicPartition, list[ConsumerRecord]]) -> None:
+        # Once per fetch from each partition's last record; children are cached so polls skip labels()
+        for tp, partition_records in records.items():
+            highwater = self._consumer.highwater(tp)
+            if highwater is None:
+                continue
+            gauge = self._lag_gauges.get(tp)
+            if gauge is None:
+                gauge = self._lag_gauges[tp] = KAFKA_CONSUMER_LAG.labels(tp.topic, tp.partition)
+            gauge.set(highwater - partition_records[-1].offset - 1)
+
+    async def commit(self, offsets: dict[tuple[str, int], int] | None = None) -> None:
+        if not self._consumer:
+            return
+
+        if offsets is None:
+            await self._consumer.commit()
+        else:
+            await self._consumer.commit({
+                TopicPartition(topic, partition): offset for (topic, partition), offset in offsets.items()
+            })
+
+    async def lag(self) -> dict[tuple[str, int], int]:
+        if not self._consumer:
+            return {}
+
+        partitions = list(self._consumer.assignment())
+        if not partitions:
+            return {}
+
+        end_offsets = await self._consumer.end_offsets(partitions)
+        committed = {partition: await self._consumer.committed(partition) for partition in partitions}
+
+        # Nothing committed yet: the group would start from the beginning of the partition
+        uncommitted = [partition for partition, offset in committed.items() if offset is None]
+        if uncommitted:
+            committed.update(await self._consumer.beginning_offsets(uncommitted))
+
+        # Committed, not fetched: records buffered or in flight here are not done yet
+        lag = {}
+        for partition in partitions:
+            lag[(partition.topic, partition.partition)] = max(end_offsets[partition] - committed[partition], 0)
+            KAFKA_CONSUMER_COMMITTED_LAG.labels(partition.topic, partition.partition).set(lag[(partition.topic, partition.partition)])
+        return lag
@@ -0,0 +1,135 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# Bound label children up front so hot paths skip the labels() lookup and its lock
+
+MESSAGES_CONSUMED = Counter(
+    "loan_messages_consumed_total",
+    "Loan application messages handled by the consumer",
+    ["outcome"],
+)
+MESSAGES_PROCESSED = MESSAGES_CONSUMED.labels("processed")
+MESSAGES_FAILED = MESSAGES_CONSUMED.labels("failed")
+MESSAGES_RETRIED = MESSAGES_CONSUMED.labels("retried")
+MESSAGES_DEAD_LETTERED = MESSAGES_CONSUMED.labels("dead_lettered")
+
+DUPLICATES_SKIPPED = Counter(
+    "loan_duplicates_skipped_total",
+    "Redelivered applications skipped, by the layer that caught them",
+    ["layer"],
+)
+DUPLICATES_SKIPPED_REDIS = DUPLICATES_SKIPPED.labels("redis")
+DUPLICATES_SKIPPED_DATABASE = DUPLICATES_SKIPPED.labels("database")
+
+PROCESS_DURATION = Histogram(
+    "loan_process_duration_seconds",
+    "ProcessApplicationUseCase latency, per message or per batch",
+    ["mode"],
+)
+PROCESS_MESSAGE_DURATION = PROCESS_DURATION.labels("message")
+PROCESS_BATCH_DURATION = PROCESS_DURATION.labels("batch")
+
+REPOSITORY_DURATION = Histogram(
+    "loan_repository_duration_seconds",
+    "PostgreSQL repository call latency",
+    ["operation"],
+)
+REPOSITORY_SAVE_MANY = REPOSITORY_DURATION.labels("save_many")
+REPOSITORY_GET_BY_ID = REPOSITORY_DURATION.labels("get_by_id")
+REPOSITORY_GET_BY_APPLICANT_ID = REPOSITORY_DURATION.labels("get_by_applicant_id")
+REPOSITORY_GET_MANY_BY_APPLICANT_IDS = REPOSITORY_DURATION.labels("get_many_by_applicant_ids")
+REPOSITORY_LIST_BY_APPLICANT_ID = REPOSITORY_DURATION.labels("list_by_applicant_id")
+
+EXPORT_ROWS = Counter(
+    "loan_export_rows_total",
+    "Applications streamed by the export endpoint",
+    ["format"],
+)
+EXPORT_ROWS_NDJSON = EXPORT_ROWS.labels("ndjson")
+EXPORT_ROWS_CSV = EXPORT_ROWS.labels("csv")
+
+CACHE_DURATION = Histogram(
+    "loan_cache_duration_seconds",
+    "Redis cache operation latency",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+CACHE_GET_DURATION = CACHE_DURATION.labels("get")
+CACHE_GET_MANY_DURATION = CACHE_DURATION.labels("get_many")
+CACHE_SET_DURATION = CACHE_DURATION.labels("set")
+CACHE_SET_MANY_DURATION = CACHE_DURATION.labels("set_many")
+CACHE_DELETE_DURATION = CACHE_DURATION.labels("delete")
+CACHE_DELETE_MANY_DURATION = CACHE_DURATION.labels("delete_many")
+
+CACHE_REQUESTS = Counter(
+    "loan_cache_requests_total",
+    "Cache lookups by tier and result",
+    ["tier", "result"],
+)
+CACHE_L1_HITS = CACHE_REQUESTS.labels("l1", "hit")
+CACHE_L1_MISSES = CACHE_REQUESTS.labels("l1", "miss")
+CACHE_REDIS_HITS = CACHE_REQUESTS.labels("redis", "hit")
+CACHE_REDIS_MISSES = CACHE_REQUESTS.labels("redis", "miss")
+
+KAFKA_PUBLISH_DURATION = Histogram(
+    "loan_kafka_publish_duration_seconds",
+    "KafkaMessageBroker publish latency (enqueue only in background mode)",
+    ["method"],
+)
+KAFKA_PUBLISH_ONE_DURATION = KAFKA_PUBLISH_DURATION.labels("publish")
+KAFKA_PUBLISH_MANY_DURATION = KAFKA_PUBLISH_DURATION.labels("publish_many")
+
+KAFKA_CONSUMER_LAG = Gauge(
+    "loan_kafka_consumer_lag",
+    "Partition high watermark minus the next offset to consume",
+    ["topic", "partition"],
+)
+
+KAFKA_CONSUMER_COMMITTED_LAG = Gauge(
+    "loan_kafka_consumer_committed_lag",
+    "Partition end offset minus the group's committed offset",
+    ["topic", "partition"],
+)
+
+OUTBOX_MESSAGES_RELAYED = Counter(
+    "loan_outbox_relayed_total",
+    "Outbox rows published to Kafka and marked sent",
+)
+
+OUTBOX_RELAY_BATCH_DURATION = Histogram(
+    "loan_outbox_relay_batch_duration_seconds",
+    "Claim, publish and mark-sent latency per relayed outbox batch",
+)
+
+CONSUMER_PROCESSING_RATE = Gauge(
+    "loan_consumer_processing_rate",
+    "Applications processed per second over the last lag sample",
+)
+
+CONSUMER_ADAPTIVE_LIMIT = Gauge(
+    "loan_consumer_adaptive_limit",
+    "Current AIMD limits of the adaptive consumer controller",
+    ["limit"],
+)
+CONSUMER_CONCURRENCY_LIMIT = CONSUMER_ADAPTIVE_LIMIT.labels("concurrency")
+CONSUMER_BATCH_SIZE_LIMIT = CONSUMER_ADAPTIVE_LIMIT.labels("batch_size")
+
+DB_READS = Counter(
+    "loan_db_reads_total",
+    "Status reads by the database they were routed to",
+    ["target"],
+)
+DB_READS_PRIMARY = DB_READS.labels("primary")
+DB_READS_REPLICA = DB_READS.labels("replica")
+
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    "loan_db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the SQLAlchemy pool",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+DB_POOL_CONNECTIONS = Gauge(
+    "loan_db_pool_connections",
+    "SQLAlchemy pool connections by state",
+    ["state"],
+)
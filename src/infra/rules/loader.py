@@ -0,0 +1,69 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Callable
+
+import yaml
+
+from src.core import settings
+from src.domain.exceptions import RuleDefinitionError
+from src.domain.applications.loan.rules import CompiledRuleSet
+
+
+logger = logging.getLogger(__name__)
+
+
+def load_rule_set(path: str) -> CompiledRuleSet:
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            definition = yaml.safe_load(f)
+        else:
+            definition = json.load(f)
+
+    if not isinstance(definition, dict):
+        raise RuleDefinitionError(f"{path}: expected a mapping with a 'rules' list")
+
+    return CompiledRuleSet.compile(definition)
+
+
+class RuleSetReloader:
+
+    def __init__(
+        self,
+        path: str,
+        on_reload: Callable[[CompiledRuleSet], None],
+        interval_seconds: float | None = None,
+    ):
+        self._path = path
+        self._on_reload = on_reload
+        self._interval = interval_seconds or settings.loan_rules_reload_interval_seconds
+        self._mtime = self._current_mtime()
+
+    def _current_mtime(self) -> int | None:
+        try:
+            return os.stat(self._path).st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+        mtime = self._current_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+
+        self._mtime = mtime
+        try:
+            rule_set = load_rule_set(self._path)
+        except Exception as e:
+            # Keep deciding with the last good rule set until the file is fixed
+            logger.error(f"Failed to reload loan rules from {self._path}: {e}")
+            return False
+
+        self._on_reload(rule_set)
+        logger.info(f"Reloaded {len(rule_set.outcomes) - 1} loan rules from {self._path}")
+        return True
+
+    async def watch(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            self.reload_if_changed()
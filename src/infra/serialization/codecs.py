@@ -0,0 +1,169 @@
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import msgpack
+import orjson
+
+from src.domain.applications.loan.entity import LoanApplication
+
+
+# Every encoded payload starts with one of these header bytes. Legacy payloads have no
+# header and are plain JSON objects, so a leading "{" is decoded as JSON as well.
+HEADER_JSON = 0x01
+HEADER_MSGPACK = 0x02
+LEGACY_JSON = ord("{")
+
+_EXT_UUID = 1
+_EXT_DATETIME = 2
+_EXT_LOAN_APPLICATION = 3
+
+
+class Codec(ABC):
+
+    name: str
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        pass
+
+    def decode(self, payload: bytes) -> Any:
+        return decode(payload)
+
+
+class JsonCodec(Codec):
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        # Headerless so that consumers still running the legacy json.loads path can read it
+        return _JSON_ENCODER.encode(value).encode("utf-8")
+
+
+class OrjsonCodec(Codec):
+
+    name = "orjson"
+
+    def encode(self, value: Any) -> bytes:
+        # orjson serializes dataclasses, UUIDs, datetimes and enums natively, so a
+        # LoanApplication is written straight from its fields
+        return bytes((HEADER_JSON,)) + orjson.dumps(value)
+
+
+class MsgpackCodec(Codec):
+
+    name = "msgpack"
+
+    def encode(self, value: Any) -> bytes:
+        return bytes((HEADER_MSGPACK,)) + _MSGPACK_PACKER.pack(value)
+
+
+class RawCodec(Codec):
+
+    # Not selectable via settings: passes payloads that were encoded earlier (outbox rows) through untouched
+    name = "raw"
+
+    def encode(self, value: bytes) -> bytes:
+        return value
+
+
+CODECS: dict[str, type[Codec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def get_codec(name: str) -> Codec:
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown codec '{name}', expected one of {sorted(CODECS)}")
+
+
+def decode(payload: bytes | str) -> Any:
+    if not payload:
+        raise ValueError("Empty payload")
+    if isinstance(payload, str):
+        return orjson.loads(payload)
+
+    header = payload[0]
+
+    if header == LEGACY_JSON:
+        return orjson.loads(payload)
+    if header == HEADER_JSON:
+        return orjson.loads(payload[1:])
+    if header == HEADER_MSGPACK:
+        return msgpack.unpackb(payload[1:], ext_hook=_msgpack_ext_hook, raw=False)
+
+    raise ValueError(f"Unknown payload header 0x{header:02x}")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, LoanApplication):
+        return value.to_dict()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _fromisoformat(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, LoanApplication):
+        fields = (
+            value.id.bytes,
+            value.applicant_id,
+            value.amount,
+            value.term_months,
+            value.status.value,
+            _isoformat(value.created_at),
+            _isoformat(value.processed_at),
+            value.rejection_reason,
+        )
+        return msgpack.ExtType(_EXT_LOAN_APPLICATION, _MSGPACK_FIELDS_PACKER.pack(fields))
+    if isinstance(value, UUID):
+        return msgpack.ExtType(_EXT_UUID, value.bytes)
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode("ascii"))
+    raise TypeError(f"Object of type {type(value).__name__} is not msgpack serializable")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_LOAN_APPLICATION:
+        id_bytes, applicant_id, amount, term_months, status, created_at, processed_at, rejection_reason = (
+            msgpack.unpackb(data, raw=False)
+        )
+        # Same shape as LoanApplication.to_dict, but with native UUID/datetime values
+        # that from_dict accepts without re-parsing
+        return {
+            "id": UUID(bytes=id_bytes),
+            "applicant_id": applicant_id,
+            "amount": amount,
+            "term_months": term_months,
+            "status": status,
+            "created_at": _fromisoformat(created_at),
+            "processed_at": _fromisoformat(processed_at),
+            "rejection_reason": rejection_reason,
+        }
+    if code == _EXT_UUID:
+        return UUID(bytes=data)
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode("ascii"))
+    return msgpack.ExtType(code, data)
+
+
+_JSON_ENCODER = json.JSONEncoder(default=_json_default)
+_MSGPACK_PACKER = msgpack.Packer(default=_msgpack_default, use_bin_type=True)
+# Separate packer for entity fields: _msgpack_default runs while _MSGPACK_PACKER is mid-pack
+_MSGPACK_FIELDS_PACKER = msgpack.Packer(use_bin_type=True)
@@ -0,0 +1,269 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import time
+from contextlib import aclosing
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import settings
+from src.domain.ports import Cache
+from src.consumer.dependencies import create_cache, create_processor
+from src.domain.applications.loan.cached_repository import cache_key
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.processor import LoanApplicationProcessor
+from src.domain.applications.loan.value_objects import LoanApplicationStatus
+from src.infra.db.session import async_session, close_db
+from src.infra.db.loan_application.bulk import PostgresBulkLoader
+from src.infra.db.loan_application.repository import PostgresLoanApplicationRepository
+from .sources import CsvSource, IngestSource, KafkaRangeSource, NdjsonSource
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Checkpoint:
+    source: dict
+    # Also the created_at of records that have none, so a resumed run gives them the same one
+    started_at: str
+    position: dict | None = None
+    records: int = 0
+    written: int = 0
+    skipped: int = 0
+    finished: bool = False
+    updated_at: float = field(default_factory=time.time)
+
+
+def load_checkpoint(path: str) -> Checkpoint | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return Checkpoint(**json.load(f))
+
+
+def save_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    checkpoint.updated_at = time.time()
+    # Write-then-rename so a crash never leaves a half-written checkpoint
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(checkpoint), f)
+    os.replace(tmp_path, path)
+
+
+def to_naive_utc(moment: datetime | None) -> datetime | None:
+    if moment is None or moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class BulkIngestJob:
+
+    def __init__(
+        self,
+        source: IngestSource,
+        processor: LoanApplicationProcessor,
+        checkpoint: Checkpoint,
+        checkpoint_path: str,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+        batch_size: int | None = None,
+        keep_decided: bool = False,
+        report_interval_seconds: float | None = None,
+        cache: Cache | None = None,
+    ):
+        self._source = source
+        self._processor = processor
+        self._checkpoint = checkpoint
+        self._checkpoint_path = checkpoint_path
+        self._session_factory = session_factory
+        self._batch_size = batch_size or settings.ingest_batch_size
+        self._keep_decided = keep_decided
+        self._report_interval = report_interval_seconds or settings.ingest_report_interval_seconds
+        self._cache = cache
+        self._running = False
+
+    async def run(self) -> Checkpoint:
+        self._running = True
+        checkpoint = self._checkpoint
+        started = last_report = time.monotonic()
+        records_this_run = 0
+
+        # Closed on stop too, so the Kafka source's consumer shuts down before the database
+        async with aclosing(self._source.batches(self._batch_size, checkpoint.position)) as batches:
+            async for batch in batches:
+                applications, skipped = self._parse(batch.records)
+
+                async with self._session_factory() as session:
+                    await self._process(session, applications)
+                    written = await PostgresBulkLoader(session).load(applications)
+
+                # Before the checkpoint: if Redis fails, the rerun merges nothing new but still invalidates
+                if self._cache and applications:
+                    applicant_ids = dict.fromkeys(application.applicant_id for application in applications)
+                    await self._cache.delete_many([cache_key(applicant_id) for applicant_id in applicant_ids])
+
+                # Saved only after the commit: a crash in between re-reads the batch, which the upsert turns into a no-op
+                checkpoint.position = batch.position
+                checkpoint.records += len(batch.records)
+                checkpoint.written += written
+                checkpoint.skipped += skipped
+                save_checkpoint(self._checkpoint_path, checkpoint)
+                records_this_run += len(batch.records)
+
+                if time.monotonic() - last_report >= self._report_interval:
+                    last_report = time.monotonic()
+                    self._report(records_this_run, last_report - started)
+
+                if not self._running:
+                    logger.info("Stopped; run again with the same arguments to resume from the checkpoint")
+                    break
+            else:
+                checkpoint.finished = True
+                save_checkpoint(self._checkpoint_path, checkpoint)
+
+        self._report(records_this_run, time.monotonic() - started)
+        return checkpoint
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _parse(self, records: list[dict]) -> tuple[list[LoanApplication], int]:
+        applications = []
+        skipped = 0
+
+        for record in records:
+            try:
+                record["amount"] = float(record["amount"])
+                record["term_months"] = int(record["term_months"])
+                # Part of the primary key (file sources fill it in); see ProcessApplicationUseCase
+                if not record.get("created_at"):
+                    raise KeyError("created_at")
+                application = LoanApplication.from_dict(record)
+            except (KeyError, TypeError, ValueError) as e:
+                skipped += 1
+                logger.warning(f"Skipping malformed record {record.get('id')}: {e!r}")
+                continue
+
+            # The columns are naive UTC; COPY would reject an offset only after the batch is built, on every rerun
+            application.created_at = to_naive_utc(application.created_at)
+            application.processed_at = to_naive_utc(application.processed_at)
+            applications.append(application)
+
+        return applications, skipped
+
+    async def _process(self, session: AsyncSession, applications: list[LoanApplication]) -> None:
+        if self._keep_decided:
+            # Historical loans keep the decision they were made with; only undecided ones go through the rules
+            applications = [
+                application for application in applications if application.status == LoanApplicationStatus.PENDING
+            ]
+        if not applications:
+            return
+
+        previous = None
+        if self._processor.needs_history:
+            applicant_ids = list(dict.fromkeys(application.applicant_id for application in applications))
+            previous = await PostgresLoanApplicationRepository(session).get_many_by_applicant_ids(applicant_ids)
+
+        self._processor.process_many(applications, previous)
+
+    def _report(self, records_this_run: int, elapsed: float) -> None:
+        checkpoint = self._checkpoint
+        rate = records_this_run / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"{checkpoint.records:,} records ingested ({checkpoint.written:,} written, "
+            f"{checkpoint.skipped:,} skipped), {rate:,.0f} records/s this run"
+        )
+
+
+def build_source(args: argparse.Namespace, started_at: datetime) -> IngestSource:
+    if args.source == "ndjson":
+        return NdjsonSource(args.path, default_created_at=started_at)
+    if args.source == "csv":
+        return CsvSource(args.path, default_created_at=started_at)
+    return KafkaRangeSource(
+        topic=args.topic,
+        partitions=args.partitions,
+        start_offset=args.start_offset,
+        end_offset=args.end_offset,
+    )
+
+
+def default_checkpoint_path(args: argparse.Namespace) -> str:
+    if args.source == "kafka":
+        return f"ingest-{args.topic}.checkpoint.json"
+    return f"{args.path}.checkpoint.json"
+
+
+async def ingest(args: argparse.Namespace) -> Checkpoint:
+    checkpoint_path = args.checkpoint or default_checkpoint_path(args)
+    checkpoint = None if args.restart else load_checkpoint(checkpoint_path)
+
+    if checkpoint and checkpoint.finished:
+        logger.info(f"{checkpoint_path} records a finished run; pass --restart to ingest again")
+        return checkpoint
+
+    started_at = datetime.fromisoformat(checkpoint.started_at) if checkpoint else datetime.utcnow()
+    source = build_source(args, started_at)
+
+    if checkpoint is None:
+        checkpoint = Checkpoint(source=source.describe(), started_at=started_at.isoformat())
+    elif checkpoint.source != source.describe():
+        raise SystemExit(f"{checkpoint_path} belongs to {checkpoint.source}; pass --checkpoint or --restart")
+    else:
+        logger.info(f"Resuming from {checkpoint_path} after {checkpoint.records:,} records")
+
+    cache = await create_cache()
+    job = BulkIngestJob(
+        source=source,
+        processor=create_processor(),
+        checkpoint=checkpoint,
+        checkpoint_path=checkpoint_path,
+        batch_size=args.batch_size,
+        keep_decided=args.keep_decided,
+        cache=cache,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, job.stop)
+
+    try:
+        return await job.run()
+    finally:
+        await cache.disconnect()
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load loan applications through the processor with COPY")
+    parser.add_argument("--batch-size", type=int, default=settings.ingest_batch_size)
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: next to the input, or per topic)")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument("--keep-decided", action="store_true", help="Store non-pending records with their decision as-is")
+
+    sources = parser.add_subparsers(dest="source", required=True)
+    for name in ("ndjson", "csv"):
+        file_source = sources.add_parser(name, help=f"Read a {name.upper()} file")
+        file_source.add_argument("path")
+
+    kafka = sources.add_parser("kafka", help="Read an offset range of a topic")
+    kafka.add_argument("--topic", default=settings.loan_application_topic)
+    kafka.add_argument("--partitions", type=int, nargs="+", help="Default: every partition")
+    kafka.add_argument("--start-offset", type=int, help="Default: the earliest retained offset")
+    kafka.add_argument("--end-offset", type=int, help="Exclusive. Default: the high watermark at the first start")
+
+    asyncio.run(ingest(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,29 @@
 from contextlib import asynccontextmanager
+from datetime import datetime
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Query, Response
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 from src.core import settings
 from src.infra.db.session import init_db, close_db
-from src.api.dependencies import get_application_controller, cleanup
+from src.api.dependencies import get_application_controller, create_container, close_container
 from src.api.v1.applications import ApplicationController, router as applications_router
-from src.api.schemas import CreateApplicationRequest, ApplicationResponse
+from src.api.schemas import (
+    CreateApplicationRequest,
+    ApplicationResponse,
+    BatchStatusRequest,
+    BatchStatusResponse,
+    ApplicationHistoryResponse,
+    ExportFormat,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    app.state.container = await create_container()
     yield
-    await cleanup()
+    await close_container(app.state.container)
     await close_db()
 
 
@@ -32,10 +42,46 @@ async def create_application(
     return await controller.create(request)
 
 
+@app.post("/api/v1/applications/status:batch", response_model=BatchStatusResponse)
+async def get_application_statuses(
+    request: BatchStatusRequest,
+    controller: ApplicationController = Depends(get_application_controller),
+):
+    return await controller.get_statuses(request)
+
+
+@app.get("/api/v1/applications:export")
+async def export_applications(
+    format: ExportFormat = ExportFormat.NDJSON,
+    applicant_id: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    controller: ApplicationController = Depends(get_application_controller),
+):
+    return await controller.export(format, applicant_id, created_from, created_to)
+
+
+@app.get("/api/v1/applicants/{applicant_id}/applications", response_model=ApplicationHistoryResponse)
+async def get_application_history(
+    applicant_id: str,
+    limit: int = Query(settings.api_history_default_page_size, ge=1, le=settings.api_history_max_page_size),
+    cursor: str | None = None,
+    controller: ApplicationController = Depends(get_application_controller),
+):
+    return await controller.get_history(applicant_id, limit, cursor)
+
+
 @app.get("/api/v1/applications/{applicant_id}", response_model=ApplicationResponse)
 async def get_application(
     applicant_id: str,
+    created_after: datetime | None = None,
     controller: ApplicationController = Depends(get_application_controller),
 ):
-    return await controller.get_by_applicant_id(applicant_id)
+    return await controller.get_by_applicant_id(applicant_id, created_after)
+
+
+if settings.metrics_enabled:
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,51 @@
+import argparse
+import asyncio
+import logging
+
+from src.core import settings
+from src.infra.db.session import engine, close_db
+from src.infra.db.partitions import ensure_partitions, expire_partitions
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def maintain(months_ahead: int, retention_months: int, archive_schema: str | None, dry_run: bool) -> None:
+    try:
+        async with engine.begin() as conn:
+            created = await ensure_partitions(conn, months_ahead, dry_run=dry_run)
+        expired = await expire_partitions(engine, retention_months, archive_schema, dry_run=dry_run)
+    finally:
+        await close_db()
+
+    prefix = "Would have " if dry_run else ""
+    logger.info(f"{prefix}created {len(created)} partitions: {', '.join(p.name for p in created) or '-'}")
+    logger.info(f"{prefix}detached {len(expired)} partitions: {', '.join(p.name for p in expired) or '-'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-create and expire monthly loan_applications partitions")
+    parser.add_argument("--months-ahead", type=int, default=settings.db_partition_premake_months)
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=settings.db_partition_retention_months,
+        help="Detach partitions entirely older than this many months (0 = keep everything)",
+    )
+    parser.add_argument(
+        "--archive-schema",
+        default=settings.db_partition_archive_schema,
+        help="Move detached partitions into this schema",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    args = parser.parse_args()
+
+    asyncio.run(maintain(args.months_ahead, args.retention_months, args.archive_schema, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
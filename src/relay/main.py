@@ -0,0 +1,138 @@
+import asyncio
+import signal
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from prometheus_client import start_http_server
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import settings
+from src.domain.ports import MessageBroker
+from src.infra.db.session import async_session, init_db, close_db
+from src.infra.db.outbox.repository import PostgresOutboxRepository
+from src.infra.messaging.kafka import KafkaMessageBroker
+from src.infra.serialization.codecs import RawCodec
+from src.infra.metrics import OUTBOX_MESSAGES_RELAYED, OUTBOX_RELAY_BATCH_DURATION
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = 60
+
+
+class OutboxRelay:
+
+    def __init__(
+        self,
+        broker: MessageBroker,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+        batch_size: int | None = None,
+        poll_interval_ms: int | None = None,
+        retention_seconds: int | None = None,
+    ):
+        self._broker = broker
+        self._session_factory = session_factory
+        self._batch_size = batch_size or settings.outbox_relay_batch_size
+        self._poll_interval = (poll_interval_ms or settings.outbox_relay_poll_interval_ms) / 1000
+        self._retention = timedelta(seconds=retention_seconds or settings.outbox_retention_seconds)
+        self._last_purge = 0.0
+        self._running = False
+
+    async def relay_once(self) -> int:
+        async with self._session_factory() as session:
+            repository = PostgresOutboxRepository(session)
+
+            with OUTBOX_RELAY_BATCH_DURATION.time():
+                messages = await repository.claim_unsent(self._batch_size)
+                if not messages:
+                    return 0
+
+                by_topic: dict[str, list[tuple[str | None, bytes]]] = defaultdict(list)
+                for message in messages:
+                    by_topic[message.topic].append((message.key, message.payload))
+
+                # Rows stay locked until Kafka acked the whole batch; a failure rolls back and
+                # the batch is published again, so delivery is at least once
+                for topic, batch in by_topic.items():
+                    await self._broker.publish_many(topic, batch)
+
+                await repository.mark_sent([message.id for message in messages])
+                await session.commit()
+
+        OUTBOX_MESSAGES_RELAYED.inc(len(messages))
+        return len(messages)
+
+    async def purge_sent(self) -> int:
+        async with self._session_factory() as session:
+            purged = await PostgresOutboxRepository(session).purge_sent(datetime.utcnow() - self._retention)
+            await session.commit()
+        return purged
+
+    async def run(self) -> None:
+        self._running = True
+
+        while self._running:
+            try:
+                relayed = await self.relay_once()
+            except Exception as e:
+                logger.error(f"Failed to relay outbox batch: {e}")
+                relayed = 0
+
+            # A full batch means a backlog: go straight on to the next one
+            if relayed >= self._batch_size:
+                continue
+
+            if time.monotonic() - self._last_purge >= PURGE_INTERVAL_SECONDS:
+                self._last_purge = time.monotonic()
+                try:
+                    purged = await self.purge_sent()
+                    if purged:
+                        logger.info(f"Purged {purged} sent outbox rows")
+                except Exception as e:
+                    logger.warning(f"Failed to purge sent outbox rows: {e}")
+
+            await asyncio.sleep(self._poll_interval)
+
+    def stop(self) -> None:
+        self._running = False
+
+
+async def main(init_schema: bool = True) -> None:
+    if settings.metrics_enabled:
+        start_http_server(settings.relay_metrics_port)
+        logger.info(f"Serving Prometheus metrics on port {settings.relay_metrics_port}")
+
+    if init_schema:
+        await init_db()
+
+    # Payloads were encoded by the API; wait for acks so a row is only marked sent once Kafka has it
+    broker = KafkaMessageBroker(delivery_mode="wait", codec=RawCodec())
+    await broker.connect()
+    relay = OutboxRelay(broker)
+
+    loop = asyncio.get_event_loop()
+
+    def shutdown():
+        logger.info("Shutdown signal received")
+        relay.stop()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, shutdown)
+
+    logger.info("Starting outbox relay...")
+    try:
+        await relay.run()
+    finally:
+        await broker.disconnect()
+        await close_db()
+        logger.info("Outbox relay stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,26 +1,32 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from datetime import datetime
+from unittest.mock import AsyncMock
 from httpx import AsyncClient, ASGITransport
 
 from src.main import app
+from src.api.dependencies import Container
+from src.domain.applications.loan.ports import LoanApplicationRepository
 from src.domain.applications.loan.entity import LoanApplication
 from src.domain.applications.loan.value_objects import LoanApplicationStatus
 
 
 @pytest.fixture
 def mock_dependencies():
-    with patch("src.api.dependencies.get_kafka_broker") as mock_broker, \
-         patch("src.api.dependencies.get_cache") as mock_cache, \
-         patch("src.api.dependencies.get_session"):
+    broker = AsyncMock()
+    cache = AsyncMock()
+    cache.get.return_value = None
+    repository = AsyncMock(spec=LoanApplicationRepository)
 
-        mock_broker.return_value = AsyncMock()
-        mock_cache.return_value = AsyncMock()
-        mock_cache.return_value.get.return_value = None
+    # ASGITransport skips lifespan, so install the container it would have built
+    app.state.container = Container(cache=cache, broker=broker, repository=repository)
 
-        yield {
-            "broker": mock_broker.return_value,
-            "cache": mock_cache.return_value,
-        }
+    yield {
+        "broker": broker,
+        "cache": cache,
+        "repository": repository,
+    }
+
+    del app.state.container
 
 
 @pytest.mark.asyncio
@@ -66,13 +72,73 @@ class TestApplicationAPI:
         assert response.status_code == 422
 
     async def test_get_application_not_found(self, mock_dependencies):
-        with patch("src.api.dependencies.get_repository") as mock_repo:
-            mock_repo.return_value = AsyncMock()
-            mock_repo.return_value.get_by_applicant_id.return_value = None
+        mock_dependencies["repository"].get_by_applicant_id.return_value = None
 
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-                response = await client.get("/api/v1/applications/nonexistent")
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/applications/nonexistent")
 
         assert response.status_code == 404
 
+    async def test_get_application_created_after_is_naive_utc(self, mock_dependencies):
+        mock_dependencies["repository"].get_by_applicant_id.return_value = None
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/api/v1/applications/user_123", params={"created_after": "2026-01-01T02:00:00+02:00"})
+
+        created_after = mock_dependencies["repository"].get_by_applicant_id.call_args.args[1]
+        assert created_after == datetime(2026, 1, 1)
+        assert created_after.tzinfo is None
+
+    async def test_get_application_history(self, mock_dependencies):
+        history = [
+            LoanApplication(applicant_id="user_123", amount=1000 + index, term_months=12)
+            for index in range(3)
+        ]
+        mock_dependencies["repository"].list_by_applicant_id.return_value = history
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/applicants/user_123/applications", params={"limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["applications"]) == 2
+        assert data["next_cursor"]
+        mock_dependencies["repository"].list_by_applicant_id.assert_called_once_with("user_123", 3, None)
+
+    async def test_export_applications_ndjson(self, mock_dependencies):
+        async def stream(*args):
+            yield LoanApplication(applicant_id="user_123", amount=1000, term_months=12)
+
+        mock_dependencies["repository"].stream.side_effect = stream
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/applications:export", params={"applicant_id": "user_123"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text.count("\n") == 1
+
+    async def test_export_bounds_are_checked_before_streaming(self, mock_dependencies):
+        async def stream(*args):
+            yield LoanApplication(applicant_id="user_123", amount=1000, term_months=12)
+
+        mock_dependencies["repository"].stream.side_effect = stream
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/api/v1/applications:export",
+                params={"created_from": "2026-02-01T00:00:00Z", "created_to": "2026-01-01T00:00:00Z"},
+            )
+            assert response.status_code == 400
+
+            response = await client.get("/api/v1/applications:export", params={"created_from": "2026-01-01T01:00:00+01:00"})
+
+        assert response.status_code == 200
+        created_from = mock_dependencies["repository"].stream.call_args.args[1]
+        assert created_from == datetime(2026, 1, 1)
+        assert created_from.tzinfo is None
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from src.consumer.autoscaling import AdaptiveController, AimdLimit, LagMonitor
+from src.consumer.workers import ConcurrencyLimiter
+from src.domain.ports import MessageConsumer
+
+
+class TestAdaptiveController:
+
+    @pytest.fixture
+    def controller(self) -> AdaptiveController:
+        return AdaptiveController(
+            latency_target_seconds=0.25,
+            lag_threshold=1000,
+            concurrency=AimdLimit(minimum=1, maximum=8),
+            batch_size=AimdLimit(minimum=50, maximum=500, step=50),
+        )
+
+    def test_slow_processing_backs_off_multiplicatively(self, controller):
+        controller.record_latency(1.0)
+        controller.update(lag=50_000)
+        controller.update(lag=50_000)
+        controller.update(lag=50_000)
+
+        assert controller.concurrency.value == 1
+        assert controller.batch_size.value == 62
+
+    def test_lag_grows_limits_additively(self, controller):
+        controller.concurrency.decrease()
+        controller.batch_size.decrease()
+        controller.record_latency(0.05)
+
+        controller.update(lag=50_000)
+
+        assert controller.concurrency.value == 5
+        assert controller.batch_size.value == 300
+
+    def test_no_lag_holds_limits(self, controller):
+        controller.record_latency(0.01)
+        controller.update(lag=10)
+
+        assert controller.concurrency.value == 8
+        assert controller.batch_size.value == 500
+
+
+class TestLagMonitor:
+
+    @pytest.mark.asyncio
+    async def test_sample_exports_status_file(self, tmp_path):
+        consumer = AsyncMock(spec=MessageConsumer)
+        consumer.lag.return_value = {("loan-applications", 0): 120, ("loan-applications", 1): 30}
+        processed = [0]
+        status_file = tmp_path / "status.json"
+        monitor = LagMonitor(consumer, lambda: processed[0], interval_seconds=1, status_file=str(status_file))
+
+        processed[0] = 100
+        status = await monitor.sample()
+
+        assert status["lag"] == 150
+        assert status["processing_rate"] > 0
+        assert json.loads(status_file.read_text())["partitions"] == {
+            "loan-applications:0": 120,
+            "loan-applications:1": 30,
+        }
+
+
+class TestConcurrencyLimiter:
+
+    @pytest.mark.asyncio
+    async def test_limit_is_read_on_every_acquire(self):
+        limit = AimdLimit(minimum=1, maximum=2)
+        limiter = ConcurrencyLimiter(limit)
+        in_flight = []
+        peak = []
+
+        async def work():
+            async with limiter:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.pop()
+
+        limit.decrease()
+        await asyncio.gather(*(work() for _ in range(4)))
+
+        assert max(peak) == 1
@@ -0,0 +1,186 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core import settings
+from src.infra.cache.dedupe import RedisDedupeStore
+from src.infra.cache.memory import InMemoryLRUCache
+from src.infra.cache.recent_writes import RedisRecentWrites
+from src.infra.cache.redis import RedisCache
+from src.infra.cache.tiered import TieredCache
+
+
+class TestInMemoryLRUCache:
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        cache = InMemoryLRUCache(max_entries=2, max_bytes=1024, ttl_seconds=60)
+
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 2})
+        await cache.get("a")
+        await cache.set("c", {"v": 3})
+
+        assert await cache.get("a") == {"v": 1}
+        assert await cache.get("b") is None
+        assert await cache.get("c") == {"v": 3}
+
+    @pytest.mark.asyncio
+    async def test_bounded_by_bytes(self):
+        cache = InMemoryLRUCache(max_entries=100, max_bytes=40, ttl_seconds=60)
+
+        await cache.set("a", {"value": "x" * 10})
+        await cache.set("b", {"value": "y" * 10})
+
+        assert len(cache) == 1
+        assert cache.size_bytes <= 40
+        assert await cache.get("b") is not None
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        cache = InMemoryLRUCache(max_entries=10, max_bytes=1024, ttl_seconds=5)
+
+        with patch("src.infra.cache.memory.time.monotonic", return_value=100.0):
+            await cache.set("a", {"v": 1})
+
+        with patch("src.infra.cache.memory.time.monotonic", return_value=106.0):
+            assert await cache.get("a") is None
+
+        assert len(cache) == 0
+
+
+class TestTieredCache:
+
+    @pytest.fixture
+    def l2(self) -> AsyncMock:
+        l2 = AsyncMock(spec=RedisCache)
+        l2.get.return_value = None
+        return l2
+
+    @pytest.fixture
+    def cache(self, l2) -> TieredCache:
+        return TieredCache(l1=InMemoryLRUCache(max_entries=10, max_bytes=1024, ttl_seconds=60), l2=l2)
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_populates_l1(self, cache, l2):
+        l2.get.return_value = {"v": 1}
+
+        assert await cache.get("a") == {"v": 1}
+        assert await cache.get("a") == {"v": 1}
+
+        l2.get.assert_called_once_with("a")
+        assert cache.stats == {
+            "l1": {"hits": 1, "misses": 1},
+            "l2": {"hits": 1, "misses": 0},
+        }
+
+    @pytest.mark.asyncio
+    async def test_miss_in_both_tiers(self, cache, l2):
+        assert await cache.get("a") is None
+        assert cache.stats["l2"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_reads_l2_for_l1_misses(self, cache, l2):
+        await cache.set("a", {"v": 1})
+        l2.get_many.return_value = {"b": {"v": 2}}
+
+        assert await cache.get_many(["a", "b", "c"]) == {"a": {"v": 1}, "b": {"v": 2}}
+
+        l2.get_many.assert_called_once_with(["b", "c"])
+        assert await cache.get("b") == {"v": 2}
+        l2.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_writes_through(self, cache, l2):
+        await cache.set("a", {"v": 1}, ttl_seconds=30)
+
+        l2.set.assert_called_once_with("a", {"v": 1}, 30)
+        assert await cache.get("a") == {"v": 1}
+        l2.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_many_clears_both_tiers(self, cache, l2):
+        await cache.set_many({"a": {"v": 1}, "b": {"v": 2}})
+
+        await cache.delete_many(["a", "b"])
+        l2.get_many.return_value = {}
+
+        l2.delete_many.assert_called_once_with(["a", "b"])
+        assert await cache.get_many(["a", "b"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidation_drops_l1_entry(self, cache, l2):
+        async def listen(handler):
+            await handler("a")
+            raise asyncio.CancelledError
+
+        await cache.set("a", {"v": 1})
+        l2.listen_invalidations.side_effect = listen
+
+        with pytest.raises(asyncio.CancelledError):
+            await cache._listen_invalidations()
+
+        l2.get.return_value = {"v": 2}
+        assert await cache.get("a") == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_tracking_invalidation_flushes_l1(self, l2):
+        cache = TieredCache(
+            l1=InMemoryLRUCache(max_entries=10, max_bytes=1024, ttl_seconds=60),
+            l2=l2,
+            invalidation="tracking",
+        )
+
+        async def listen(prefix, handler, on_flush):
+            await handler("a")
+            on_flush()
+            raise asyncio.CancelledError
+
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 1})
+        l2.listen_tracking_invalidations.side_effect = listen
+
+        with pytest.raises(asyncio.CancelledError):
+            await cache._listen_invalidations()
+
+        l2.get_many.return_value = {}
+        assert await cache.get_many(["a", "b"]) == {}
+        l2.listen_invalidations.assert_not_called()
+
+
+class TestRedisTracking:
+
+    @pytest.mark.asyncio
+    async def test_invalidations_come_from_server_tracking(self):
+        listener = AsyncMock()
+        listener.read_response.side_effect = [
+            17,
+            [b"subscribe", b"__redis__:invalidate", 1],
+            None,
+            [b"message", b"__redis__:invalidate", [b"loan_application:a"]],
+            [b"message", b"__redis__:invalidate", None],
+            asyncio.CancelledError(),
+        ]
+        listener.pack_command = MagicMock()
+        tracker = AsyncMock()
+        cache = RedisCache()
+        cache._client = AsyncMock()
+        cache._client.connection_pool.get_connection.side_effect = [listener, tracker]
+        handler = AsyncMock()
+        flushed = []
+
+        with pytest.raises(asyncio.CancelledError):
+            await cache.listen_tracking_invalidations("loan_application:", handler, lambda: flushed.append(True))
+
+        tracker.send_command.assert_any_call(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", 17, "BCAST", "PREFIX", "loan_application:"
+        )
+        tracker.send_command.assert_any_call("PING")
+        handler.assert_awaited_once_with("loan_application:a")
+        assert flushed == [True]
+        cache._client.connection_pool.release.assert_any_await(tracker)
+
+    def test_auxiliary_keys_are_outside_the_tracked_prefix(self):
+        # Anything under the prefix is broadcast to every API process on each write
+        assert not RedisDedupeStore()._key("id:hash").startswith(settings.cache_l1_tracking_prefix)
+        assert not RedisRecentWrites()._key("user_1").startswith(settings.cache_l1_tracking_prefix)
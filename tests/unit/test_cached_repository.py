@@ -1,9 +1,13 @@
+import asyncio
+import time
 import pytest
-from unittest.mock import AsyncMock
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 from src.domain.applications.loan.entity import LoanApplication
 from src.domain.applications.loan.value_objects import LoanApplicationStatus
 from src.domain.applications.loan.cached_repository import CachedLoanApplicationRepository
+from src.domain.single_flight import SingleFlight
 
 
 class TestCachedLoanApplicationRepository:
@@ -32,6 +36,18 @@ class TestCachedLoanApplicationRepository:
         assert result.applicant_id == "user_123"
         mock_repository.get_by_applicant_id.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_cached_latest_older_than_hint(self, cached_repo, mock_repository, mock_cache, sample_application):
+        mock_cache.get.return_value = sample_application.to_dict()
+
+        result = await cached_repo.get_by_applicant_id(
+            sample_application.applicant_id,
+            created_after=sample_application.created_at + timedelta(days=1),
+        )
+
+        assert result is None
+        mock_repository.get_by_applicant_id.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_from_db_on_cache_miss(self, cached_repo, mock_repository, mock_cache, sample_application):
         mock_cache.get.return_value = None
@@ -62,3 +78,105 @@ class TestCachedLoanApplicationRepository:
         assert result is None
         mock_cache.set.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_save_many_updates_cache(self, cached_repo, mock_repository, mock_cache, sample_application):
+        mock_repository.save_many.return_value = [sample_application]
+
+        result = await cached_repo.save_many([sample_application])
+
+        assert result == [sample_application]
+        mock_repository.save_many.assert_called_once()
+        mock_cache.set_many.assert_called_once()
+        mock_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_many_caches_latest_per_applicant(self, cached_repo, mock_repository, mock_cache):
+        older = LoanApplication(applicant_id="user_123", amount=1000, term_months=12, created_at=datetime(2024, 1, 1))
+        newer = LoanApplication(applicant_id="user_123", amount=2000, term_months=12, created_at=datetime(2024, 1, 2))
+        mock_repository.save_many.return_value = [newer, older]
+
+        await cached_repo.save_many([older, newer])
+
+        items = mock_cache.set_many.call_args.kwargs["items"]
+        assert items == {"loan_application:user_123": newer.to_dict()}
+
+    @pytest.mark.asyncio
+    async def test_get_many_loads_only_misses(self, cached_repo, mock_repository, mock_cache, sample_application):
+        hit = LoanApplication(applicant_id="user_1", amount=1000, term_months=12)
+        mock_cache.get_many.return_value = {"loan_application:user_1": hit.to_dict()}
+        mock_repository.get_many_by_applicant_ids.return_value = {"test_user_123": sample_application}
+
+        result = await cached_repo.get_many_by_applicant_ids(["user_1", "test_user_123", "missing"])
+
+        assert result == {"user_1": hit, "test_user_123": sample_application}
+        mock_repository.get_many_by_applicant_ids.assert_called_once_with(["test_user_123", "missing"])
+        items = mock_cache.set_many.call_args.kwargs["items"]
+        assert items == {"loan_application:test_user_123": sample_application.to_dict()}
+
+    @pytest.mark.asyncio
+    async def test_get_many_all_cached(self, cached_repo, mock_repository, mock_cache, sample_application):
+        mock_cache.get_many.return_value = {"loan_application:test_user_123": sample_application.to_dict()}
+
+        result = await cached_repo.get_many_by_applicant_ids(["test_user_123"])
+
+        assert result == {"test_user_123": sample_application}
+        mock_repository.get_many_by_applicant_ids.assert_not_called()
+        mock_cache.set_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self, mock_repository, mock_cache, sample_application):
+        cached_repo = CachedLoanApplicationRepository(
+            repository=mock_repository,
+            cache=mock_cache,
+            ttl_seconds=3600,
+            single_flight=SingleFlight(),
+        )
+
+        async def slow_load(applicant_id, created_after=None):
+            await asyncio.sleep(0.01)
+            return sample_application
+
+        mock_repository.get_by_applicant_id.side_effect = slow_load
+
+        results = await asyncio.gather(*(cached_repo.get_by_applicant_id("test_user_123") for _ in range(10)))
+
+        assert all(result is sample_application for result in results)
+        mock_repository.get_by_applicant_id.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_early_refresh_near_expiry(self, mock_repository, mock_cache, sample_application):
+        cached_repo = CachedLoanApplicationRepository(
+            repository=mock_repository,
+            cache=mock_cache,
+            ttl_seconds=3600,
+            early_refresh_beta=1.0,
+        )
+        cached = sample_application.to_dict()
+        cached["_expires_at"] = time.time() + 0.001
+        cached["_recompute_seconds"] = 10.0
+        mock_cache.get.return_value = cached
+        mock_repository.get_by_applicant_id.return_value = sample_application
+
+        with patch("src.domain.applications.loan.cached_repository.random.random", return_value=0.5):
+            await cached_repo.get_by_applicant_id("test_user_123")
+
+        mock_repository.get_by_applicant_id.assert_called_once()
+        assert "_expires_at" in mock_cache.set.call_args.kwargs["value"]
+
+    @pytest.mark.asyncio
+    async def test_no_early_refresh_far_from_expiry(self, mock_repository, mock_cache, sample_application):
+        cached_repo = CachedLoanApplicationRepository(
+            repository=mock_repository,
+            cache=mock_cache,
+            ttl_seconds=3600,
+            early_refresh_beta=1.0,
+        )
+        cached = sample_application.to_dict()
+        cached["_expires_at"] = time.time() + 3600
+        cached["_recompute_seconds"] = 0.01
+        mock_cache.get.return_value = cached
+
+        result = await cached_repo.get_by_applicant_id("test_user_123")
+
+        assert result.id == sample_application.id
+        mock_repository.get_by_applicant_id.assert_not_called()
@@ -0,0 +1,69 @@
+import json
+import pytest
+from datetime import datetime
+
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.value_objects import LoanApplicationStatus
+from src.infra.serialization.codecs import decode, get_codec
+
+
+CODEC_NAMES = ["json", "orjson", "msgpack"]
+
+
+@pytest.fixture
+def application() -> LoanApplication:
+    return LoanApplication(
+        applicant_id="user_123",
+        amount=10000.5,
+        term_months=12,
+        status=LoanApplicationStatus.REJECTED,
+        created_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+        processed_at=datetime(2024, 1, 2, 3, 4, 6),
+        rejection_reason="Amount exceeds approval threshold of 50000",
+    )
+
+
+class TestCodecs:
+
+    @pytest.mark.parametrize("name", CODEC_NAMES)
+    def test_round_trip_dict(self, name):
+        value = {"applicant_id": "user_123", "amount": 1.5, "nested": [1, "two", None]}
+
+        assert decode(get_codec(name).encode(value)) == value
+
+    @pytest.mark.parametrize("name", CODEC_NAMES)
+    def test_round_trip_entity(self, name, application):
+        decoded = decode(get_codec(name).encode(application))
+
+        assert LoanApplication.from_dict(decoded) == application
+
+    @pytest.mark.parametrize("name", CODEC_NAMES)
+    def test_entity_matches_dict_encoding(self, name, application):
+        codec = get_codec(name)
+
+        from_entity = LoanApplication.from_dict(decode(codec.encode(application)))
+        from_dict = LoanApplication.from_dict(decode(codec.encode(application.to_dict())))
+
+        assert from_entity == from_dict
+
+    def test_decodes_legacy_json(self, application):
+        legacy = json.dumps(application.to_dict()).encode("utf-8")
+
+        assert LoanApplication.from_dict(decode(legacy)) == application
+
+    def test_json_codec_stays_readable_by_legacy_consumers(self, application):
+        payload = get_codec("json").encode(application)
+
+        assert json.loads(payload.decode("utf-8")) == application.to_dict()
+
+    def test_unknown_header(self):
+        with pytest.raises(ValueError):
+            decode(b"\x7fpayload")
+
+    def test_empty_payload(self):
+        with pytest.raises(ValueError, match="Empty payload"):
+            decode(b"")
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            get_codec("pickle")
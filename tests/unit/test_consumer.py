@@ -0,0 +1,359 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.consumer.main import ApplicationConsumerService
+from src.consumer.supervisor import ConsumerSupervisor, resolve_process_count, run_child
+from src.consumer.workers import OffsetTracker, PartitionedWorkerPool
+from src.domain.ports import ConsumedMessage, MessageConsumer
+from src.infra.metrics import MESSAGES_PROCESSED, MESSAGES_FAILED
+
+
+@asynccontextmanager
+async def fake_session():
+    yield MagicMock()
+
+
+class TestApplicationConsumerService:
+
+    @pytest.fixture
+    def mock_consumer(self) -> AsyncMock:
+        return AsyncMock(spec=MessageConsumer)
+
+    @pytest.fixture
+    def service(self, mock_consumer, mock_cache):
+        service = ApplicationConsumerService(mock_consumer)
+        service._cache = mock_cache
+        return service
+
+    @pytest.mark.asyncio
+    async def test_process_batch_saves_once(self, service, mock_repository):
+        messages = [
+            {"applicant_id": "user_1", "amount": 10000, "term_months": 12, "created_at": "2026-10-18T00:00:00"},
+            {"applicant_id": "user_2", "amount": 20000, "term_months": 24, "created_at": "2026-10-18T00:00:00"},
+        ]
+        mock_repository.save_many.side_effect = lambda applications: applications
+
+        with patch("src.consumer.main.async_session", fake_session), \
+             patch("src.consumer.main.create_repository", return_value=mock_repository):
+            await service.process_batch(messages)
+
+        mock_repository.save_many.assert_called_once()
+        mock_repository.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_batch_falls_back_to_single_messages(self, service, mock_repository):
+        messages = [
+            {"applicant_id": "user_1", "amount": 10000, "term_months": 12, "created_at": "2026-10-18T00:00:00"},
+            {"applicant_id": "user_2", "amount": 20000, "term_months": 24, "created_at": "2026-10-18T00:00:00"},
+        ]
+        mock_repository.save_many.side_effect = RuntimeError("db unavailable")
+        mock_repository.save.side_effect = lambda application: application
+
+        with patch("src.consumer.main.async_session", fake_session), \
+             patch("src.consumer.main.create_repository", return_value=mock_repository):
+            await service.process_batch(messages)
+
+        assert mock_repository.save.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_outcomes_are_counted(self, service, mock_repository):
+        processed = MESSAGES_PROCESSED._value.get()
+        failed = MESSAGES_FAILED._value.get()
+        outcomes = iter([RuntimeError("db unavailable"), None])
+
+        async def save(application):
+            if error := next(outcomes):
+                raise error
+            return application
+
+        mock_repository.save.side_effect = save
+
+        with patch("src.consumer.main.async_session", fake_session), \
+             patch("src.consumer.main.create_repository", return_value=mock_repository):
+            await service.process_message({"applicant_id": "user_1", "amount": 10000, "term_months": 12, "created_at": "2026-10-18T00:00:00"})
+            await service.process_message({"applicant_id": "user_2", "amount": 20000, "term_months": 24, "created_at": "2026-10-18T00:00:00"})
+
+        assert MESSAGES_FAILED._value.get() == failed + 1
+        assert MESSAGES_PROCESSED._value.get() == processed + 1
+
+    @pytest.mark.asyncio
+    async def test_batch_committed_after_processing(self, service, mock_consumer):
+        calls = []
+
+        async def batches(max_records, linger_ms):
+            yield [{"applicant_id": "user_1", "amount": 10000, "term_months": 12, "created_at": "2026-10-18T00:00:00"}]
+
+        mock_consumer.batches = batches
+        mock_consumer.commit.side_effect = lambda: calls.append("commit")
+
+        async def process_batch(messages):
+            calls.append("process")
+
+        service.process_batch = process_batch
+
+        await service._consume_batches()
+
+        assert calls == ["process", "commit"]
+
+    @pytest.mark.asyncio
+    async def test_stop_commits_drained_offsets_before_closing(self, service, mock_consumer):
+        calls = []
+        interrupted = asyncio.Event()
+        mock_consumer.interrupt = MagicMock(side_effect=interrupted.set)
+        mock_consumer.commit.side_effect = lambda offsets: calls.append(("commit", offsets))
+        mock_consumer.stop.side_effect = lambda: calls.append(("stop",))
+
+        async def records():
+            for offset in range(3):
+                yield make_message(offset)
+            service.stop()
+            await interrupted.wait()
+
+        async def process_message(message):
+            await asyncio.sleep(0.01)
+
+        mock_consumer.records = records
+        service.process_message = process_message
+        service.start = AsyncMock()
+        service._init_schema = False
+        service._cache = None
+
+        with patch("src.consumer.main.settings") as mock_settings, patch("src.consumer.main.close_db"):
+            mock_settings.kafka_consumer_workers = 2
+            mock_settings.kafka_consumer_worker_queue_size = 10
+            mock_settings.kafka_consumer_commit_interval_ms = 60_000
+            await service.run()
+
+        assert calls == [("commit", {("loan-applications", 0): 3}), ("stop",)]
+
+    @pytest.mark.asyncio
+    async def test_revocation_commits_in_flight_then_resets(self, service, mock_consumer):
+        handlers = []
+        mock_consumer.set_revocation_handler = MagicMock(side_effect=handlers.append)
+
+        async def records():
+            yield make_message(0)
+            yield make_message(1)
+            await handlers[0]([("loan-applications", 0)])
+            yield make_message(0)
+
+        async def process_message(message):
+            await asyncio.sleep(0.01)
+
+        mock_consumer.records = records
+        service.process_message = process_message
+
+        with patch("src.consumer.main.settings") as mock_settings:
+            mock_settings.kafka_consumer_workers = 2
+            mock_settings.kafka_consumer_worker_queue_size = 10
+            mock_settings.kafka_consumer_commit_interval_ms = 60_000
+            await service._consume_with_workers()
+
+        # Committed before the revocation; the redelivered offset 0 then starts afresh
+        assert [call.args[0] for call in mock_consumer.commit.await_args_list] == [
+            {("loan-applications", 0): 2},
+            {("loan-applications", 0): 1},
+        ]
+        assert handlers[-1] is None
+
+
+def make_message(offset: int, key: str = "user_1", partition: int = 0) -> ConsumedMessage:
+    return ConsumedMessage(
+        topic="loan-applications",
+        partition=partition,
+        offset=offset,
+        key=key,
+        value={"applicant_id": key, "offset": offset},
+    )
+
+
+class ScriptedConsumer(MessageConsumer):
+
+    # Runs inside a supervised child process and reports back through a queue
+    def __init__(self, events):
+        self._events = events
+        self._running = True
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        self._events.put(("stop",))
+
+    def interrupt(self) -> None:
+        self._running = False
+
+    def set_revocation_handler(self, handler) -> None:
+        pass
+
+    def messages(self):
+        raise NotImplementedError
+
+    async def records(self):
+        for offset in range(3):
+            yield make_message(offset)
+        self._events.put(("fetched",))
+        while self._running:
+            await asyncio.sleep(0.01)
+
+    def batches(self, max_records, linger_ms):
+        raise NotImplementedError
+
+    async def commit(self, offsets=None) -> None:
+        self._events.put(("commit", offsets))
+
+    async def lag(self) -> dict:
+        return {}
+
+
+def run_scripted_child(index, processed, events) -> None:
+    async def process_message(self, message):
+        await asyncio.sleep(0.2)
+
+    with patch("src.consumer.main.create_message_consumer", return_value=ScriptedConsumer(events)), \
+         patch.object(ApplicationConsumerService, "start", AsyncMock()), \
+         patch.object(ApplicationConsumerService, "process_message", process_message), \
+         patch("src.consumer.main.close_db", AsyncMock()), \
+         patch("src.consumer.main.settings") as mock_settings:
+        mock_settings.metrics_enabled = False
+        mock_settings.kafka_consumer_workers = 2
+        mock_settings.kafka_consumer_worker_queue_size = 10
+        mock_settings.kafka_consumer_commit_interval_ms = 60_000
+        run_child(index, processed)
+
+
+class TestOffsetTracker:
+
+    def test_commits_only_contiguous_prefix(self):
+        tracker = OffsetTracker()
+        messages = [make_message(offset) for offset in range(3)]
+        for message in messages:
+            tracker.track(message)
+
+        tracker.complete(messages[1])
+        assert tracker.pop_committable() == {}
+
+        tracker.complete(messages[0])
+        assert tracker.pop_committable() == {("loan-applications", 0): 2}
+
+        tracker.complete(messages[2])
+        assert tracker.pop_committable() == {("loan-applications", 0): 3}
+        assert tracker.in_flight == 0
+
+    def test_failed_commit_is_restored(self):
+        tracker = OffsetTracker()
+        messages = [make_message(offset) for offset in range(3)]
+        for message in messages:
+            tracker.track(message)
+
+        tracker.complete(messages[0])
+        failed = tracker.pop_committable()
+        tracker.restore(failed)
+        assert tracker.pop_committable() == {("loan-applications", 0): 1}
+
+        tracker.complete(messages[1])
+        failed = tracker.pop_committable()
+        tracker.complete(messages[2])
+        tracker.restore(failed)
+        assert tracker.pop_committable() == {("loan-applications", 0): 3}
+
+    def test_reset_forgets_revoked_partition(self):
+        tracker = OffsetTracker()
+        stale = [make_message(offset) for offset in (10, 11)]
+        for message in stale:
+            tracker.track(message)
+        tracker.complete(stale[0])
+
+        tracker.reset([("loan-applications", 0)])
+        tracker.restore({("loan-applications", 0): 11})
+        assert tracker.pop_committable() == {}
+
+        # Redelivered from the committed offset after the rebalance; the stale completion is ignored
+        redelivered = make_message(5)
+        tracker.track(redelivered)
+        tracker.complete(stale[1])
+        tracker.complete(redelivered)
+        assert tracker.pop_committable() == {("loan-applications", 0): 6}
+        assert tracker.in_flight == 0
+
+    def test_partitions_tracked_independently(self):
+        tracker = OffsetTracker()
+        first = make_message(10, partition=0)
+        second = make_message(5, partition=1)
+        tracker.track(first)
+        tracker.track(second)
+
+        tracker.complete(second)
+
+        assert tracker.pop_committable() == {("loan-applications", 1): 6}
+
+
+class TestPartitionedWorkerPool:
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_per_key(self):
+        handled = []
+
+        async def handler(value):
+            await asyncio.sleep(0)
+            handled.append((value["applicant_id"], value["offset"]))
+
+        pool = PartitionedWorkerPool(handler, workers=4, queue_size=2)
+        pool.start()
+
+        for offset in range(20):
+            await pool.submit(make_message(offset, key=f"user_{offset % 3}"))
+
+        await pool.drain()
+        await pool.stop()
+
+        for key in ("user_0", "user_1", "user_2"):
+            offsets = [offset for applicant, offset in handled if applicant == key]
+            assert offsets == sorted(offsets)
+        assert pool.offsets.pop_committable() == {("loan-applications", 0): 20}
+
+    @pytest.mark.asyncio
+    async def test_failed_message_still_completes(self):
+        async def handler(value):
+            raise RuntimeError("boom")
+
+        pool = PartitionedWorkerPool(handler, workers=1, queue_size=1)
+        pool.start()
+
+        await pool.submit(make_message(0))
+        await pool.drain()
+        await pool.stop()
+
+        assert pool.offsets.pop_committable() == {("loan-applications", 0): 1}
+
+
+class TestConsumerSupervisor:
+
+    def test_terminated_child_commits_drained_offsets(self):
+        supervisor = ConsumerSupervisor(1)
+        events = supervisor._context.Queue()
+        process = supervisor._context.Process(target=run_scripted_child, args=(0, supervisor._counters[0], events))
+        process.start()
+        supervisor._children[0] = process
+
+        # All three records are fetched but still being processed when SIGTERM arrives
+        assert events.get(timeout=30) == ("fetched",)
+        supervisor._shutdown()
+
+        assert process.exitcode == 0
+        assert [events.get(timeout=5) for _ in range(2)] == [("commit", {("loan-applications", 0): 3}), ("stop",)]
+
+
+class TestResolveProcessCount:
+
+    def test_uses_configured_count(self):
+        with patch("src.consumer.supervisor.settings") as mock_settings:
+            mock_settings.consumer_processes = 3
+            assert resolve_process_count() == 3
+
+    def test_defaults_to_available_cpus(self):
+        with patch("src.consumer.supervisor.settings") as mock_settings:
+            mock_settings.consumer_processes = 0
+            assert resolve_process_count() >= 1
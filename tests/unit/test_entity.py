@@ -51,3 +51,11 @@ class TestLoanApplication:
         assert app.amount == 10000
         assert app.status == LoanApplicationStatus.APPROVED
 
+    def test_is_slotted(self):
+        app = LoanApplication(
+            applicant_id="user_123",
+            amount=10000,
+            term_months=12,
+        )
+
+        assert not hasattr(app, "__dict__")
@@ -0,0 +1,123 @@
+import csv
+import io
+import orjson
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+
+from src.api.v1 import exports
+from src.api.v1.applications import ApplicationController
+from src.api.v1.exports import ndjson_chunks, csv_chunks
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.ports import LoanApplicationRepository
+from src.domain.applications.loan.use_cases import ListApplicationHistoryUseCase
+
+
+def build_history(count: int, applicant_id: str = "user_1") -> list[LoanApplication]:
+    started = datetime(2026, 1, 1)
+    # Pairs share a created_at so the id tie-break is exercised
+    return [
+        LoanApplication(applicant_id=applicant_id, amount=1000 + index, term_months=12, created_at=started + timedelta(seconds=index // 2))
+        for index in range(count)
+    ]
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestListApplicationHistory:
+
+    @pytest.fixture
+    def repository(self) -> AsyncMock:
+        stored = build_history(7) + build_history(3, applicant_id="user_2")
+
+        # Same contract as the keyset query: newest first, strictly after the cursor
+        async def list_by_applicant_id(applicant_id, limit, after=None):
+            history = sorted(
+                (application for application in stored if application.applicant_id == applicant_id),
+                key=lambda application: (application.created_at, application.id),
+                reverse=True,
+            )
+            if after is not None:
+                history = [application for application in history if (application.created_at, application.id) < after]
+            return history[:limit]
+
+        repository = AsyncMock(spec=LoanApplicationRepository)
+        repository.list_by_applicant_id.side_effect = list_by_applicant_id
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_history_once_newest_first(self, repository):
+        use_case = ListApplicationHistoryUseCase(repository)
+
+        seen = []
+        after = None
+        while True:
+            page = await use_case.execute("user_1", limit=3, after=after)
+            seen.extend(page.applications)
+            after = page.next_after
+            if after is None:
+                break
+
+        assert len(seen) == 7
+        assert len({application.id for application in seen}) == 7
+        keys = [(application.created_at, application.id) for application in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_exact_fit_has_no_next_page(self, repository):
+        page = await ListApplicationHistoryUseCase(repository).execute("user_2", limit=3)
+
+        assert len(page.applications) == 3
+        assert page.next_after is None
+
+    def test_cursor_round_trip(self):
+        after = (datetime(2026, 1, 1, 12, 30, 15, 123456), build_history(1)[0].id)
+
+        assert ApplicationController._decode_cursor(ApplicationController._encode_cursor(after)) == after
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "bnVsbA", "WyJ4IiwgInkiXQ"])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        with pytest.raises(HTTPException) as error:
+            ApplicationController._decode_cursor(cursor)
+
+        assert error.value.status_code == 400
+
+
+class TestExport:
+
+    @pytest.fixture
+    def applications(self) -> list[LoanApplication]:
+        return build_history(5)
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self):
+        with patch.object(exports, "CHUNK_ROWS", 2):
+            yield
+
+    async def stream(self, applications):
+        for application in applications:
+            yield application
+
+    @pytest.mark.asyncio
+    async def test_ndjson_one_object_per_line(self, applications):
+        chunks = [chunk async for chunk in ndjson_chunks(self.stream(applications))]
+
+        assert len(chunks) == 3
+        lines = b"".join(chunks).splitlines()
+        assert [orjson.loads(line)["id"] for line in lines] == [str(application.id) for application in applications]
+
+    @pytest.mark.asyncio
+    async def test_csv_has_header_and_rows(self, applications):
+        rows = list(csv.reader(io.StringIO((await collect(csv_chunks(self.stream(applications)))).decode())))
+
+        assert tuple(rows[0]) == exports.FIELDS
+        assert [row[0] for row in rows[1:]] == [str(application.id) for application in applications]
+        assert rows[1][6] == ""
+
+    @pytest.mark.asyncio
+    async def test_empty_csv_keeps_header(self):
+        assert (await collect(csv_chunks(self.stream([])))).decode().strip() == ",".join(exports.FIELDS)
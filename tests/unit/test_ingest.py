@@ -0,0 +1,216 @@
+import json
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.domain.applications.loan.value_objects import LoanApplicationStatus
+from src.domain.ports import Cache
+from src.infra.db.loan_application.bulk import PostgresBulkLoader
+from src.domain.applications.loan.entity import LoanApplication
+from src.ingest.main import BulkIngestJob, Checkpoint, load_checkpoint
+from src.ingest.sources import CsvSource, KafkaRangeSource, NdjsonSource
+
+
+STARTED_AT = datetime(2026, 10, 18)
+
+
+async def collect(source, batch_size, position=None):
+    return [batch async for batch in source.batches(batch_size, position)]
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    path = tmp_path / "applications.ndjson"
+    lines = [json.dumps({"applicant_id": f"user_{index}", "amount": 1000 + index, "term_months": 12}) for index in range(5)]
+    path.write_text("\n".join(lines[:3]) + "\n\n" + "\n".join(lines[3:]) + "\n")
+    return str(path)
+
+
+class TestFileSources:
+
+    @pytest.mark.asyncio
+    async def test_ndjson_batches_and_positions(self, ndjson_file):
+        batches = await collect(NdjsonSource(ndjson_file, STARTED_AT), batch_size=2)
+
+        assert [len(batch.records) for batch in batches] == [2, 2, 1]
+        assert [batch.position for batch in batches] == [{"records": 2}, {"records": 4}, {"records": 5}]
+        assert batches[0].records[0]["created_at"] == STARTED_AT.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_and_keeps_generated_ids(self, ndjson_file):
+        first = await collect(NdjsonSource(ndjson_file, STARTED_AT), batch_size=2)
+        resumed = await collect(NdjsonSource(ndjson_file, STARTED_AT), batch_size=2, position={"records": 2})
+
+        assert [record["id"] for batch in resumed for record in batch.records] == [
+            record["id"] for batch in first[1:] for record in batch.records
+        ]
+
+    @pytest.mark.asyncio
+    async def test_csv_empty_cells_are_missing(self, tmp_path):
+        path = tmp_path / "applications.csv"
+        path.write_text("applicant_id,amount,term_months,status,rejection_reason\nuser_1,1000,12,,\n")
+
+        [batch] = await collect(CsvSource(str(path), STARTED_AT), batch_size=10)
+
+        assert "status" not in batch.records[0]
+        assert batch.records[0]["amount"] == "1000"
+
+
+class TestKafkaRangeSource:
+
+    def test_describe_covers_the_range(self):
+        source = KafkaRangeSource("loan-applications", partitions=[1, 0], end_offset=500, bootstrap_servers="kafka:9092")
+
+        assert source.describe() == KafkaRangeSource("loan-applications", partitions=[0, 1], end_offset=500).describe()
+        assert source.describe() != KafkaRangeSource("loan-applications", partitions=[0, 1], end_offset=900).describe()
+        assert source.describe() != KafkaRangeSource("loan-applications", end_offset=500).describe()
+
+
+class TestBulkIngestJob:
+
+    @pytest.fixture
+    def source(self):
+        source = MagicMock()
+
+        async def batches(batch_size, position=None):
+            yield MagicMock(records=[
+                {
+                    "id": "550e8400-e29b-41d4-a716-446655440000",
+                    "applicant_id": "user_1",
+                    "amount": "1000",
+                    "term_months": "12",
+                    "created_at": "2026-10-18T00:00:00",
+                },
+                {"applicant_id": "user_2", "term_months": 12, "created_at": "2026-10-18T00:00:00"},
+                {"applicant_id": "user_4", "amount": 1000, "term_months": 12},
+            ], position={"records": 2})
+            yield MagicMock(records=[
+                {
+                    "applicant_id": "user_3",
+                    "amount": 60000,
+                    "term_months": 12,
+                    "status": "approved",
+                    "created_at": "2026-01-01T02:00:00+02:00",
+                },
+            ], position={"records": 3})
+
+        source.batches = batches
+        return source
+
+    @pytest.fixture
+    def loaded(self):
+        loaded = []
+
+        async def load(applications):
+            loaded.append(list(applications))
+            return len(applications)
+
+        with patch("src.ingest.main.PostgresBulkLoader") as loader:
+            loader.return_value.load.side_effect = load
+            yield loaded
+
+    def build_job(self, source, processor, tmp_path, **kwargs) -> BulkIngestJob:
+        @asynccontextmanager
+        async def session_factory():
+            yield MagicMock()
+
+        return BulkIngestJob(
+            source=source,
+            processor=processor,
+            checkpoint=Checkpoint(source={"kind": "test"}, started_at=STARTED_AT.isoformat()),
+            checkpoint_path=str(tmp_path / "checkpoint.json"),
+            session_factory=session_factory,
+            batch_size=2,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_processes_loads_and_checkpoints(self, source, processor, loaded, tmp_path):
+        checkpoint = await self.build_job(source, processor, tmp_path).run()
+
+        assert (checkpoint.records, checkpoint.written, checkpoint.skipped) == (4, 2, 2)
+        assert checkpoint.finished
+        assert load_checkpoint(str(tmp_path / "checkpoint.json")).position == {"records": 3}
+        assert loaded[0][0].status == LoanApplicationStatus.APPROVED
+        # Over the approval threshold: the processor re-decides unless told to keep decisions
+        assert loaded[1][0].status == LoanApplicationStatus.REJECTED
+        assert loaded[1][0].created_at == datetime(2026, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidated_per_batch(self, source, processor, loaded, tmp_path):
+        cache = AsyncMock(spec=Cache)
+
+        await self.build_job(source, processor, tmp_path, cache=cache).run()
+
+        assert [call.args[0] for call in cache.delete_many.await_args_list] == [
+            ["loan_application:user_1"],
+            ["loan_application:user_3"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_keep_decided(self, source, processor, loaded, tmp_path):
+        await self.build_job(source, processor, tmp_path, keep_decided=True).run()
+
+        assert loaded[1][0].status == LoanApplicationStatus.APPROVED
+
+    @pytest.mark.asyncio
+    async def test_stop_leaves_resumable_checkpoint(self, source, processor, loaded, tmp_path):
+        job = self.build_job(source, processor, tmp_path)
+        job.stop = MagicMock(wraps=job.stop)
+
+        async def load(applications):
+            job.stop()
+            return len(applications)
+
+        with patch("src.ingest.main.PostgresBulkLoader") as loader:
+            loader.return_value.load.side_effect = load
+            checkpoint = await job.run()
+
+        assert checkpoint.position == {"records": 2}
+        assert not checkpoint.finished
+
+
+class TestPostgresBulkLoader:
+
+    @pytest.mark.asyncio
+    async def test_copies_unique_rows_then_merges(self):
+        driver = AsyncMock()
+        conn = AsyncMock()
+        conn.get_raw_connection.return_value = MagicMock(driver_connection=driver)
+        conn.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=1))
+        session = AsyncMock()
+        session.connection.return_value = conn
+
+        application = LoanApplication(applicant_id="user_1", amount=1000, term_months=12)
+        written = await PostgresBulkLoader(session).load([application, application])
+
+        assert written == 1
+        records = driver.copy_records_to_table.call_args.kwargs["records"]
+        assert len(records) == 1
+        assert records[0][4] == "pending"
+        assert conn.execute.await_count == 2
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rerun_with_a_new_decision_leaves_the_projection_alone(self):
+        # A checkpoint rerun re-decides the batch with its own committed rows as history. The hash matches,
+        # so the merge writes nothing, and the projection is fed only from what the merge wrote
+        driver = AsyncMock()
+        conn = AsyncMock()
+        conn.get_raw_connection.return_value = MagicMock(driver_connection=driver)
+        conn.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=0))
+        session = AsyncMock()
+        session.connection.return_value = conn
+
+        application = LoanApplication(
+            applicant_id="user_1", amount=1000, term_months=12, status=LoanApplicationStatus.REJECTED
+        )
+        written = await PostgresBulkLoader(session).load([application])
+
+        assert written == 0
+        statements = [str(call.args[0]) for call in conn.execute.await_args_list]
+        assert not any("INSERT INTO latest_loan_application" in statement for statement in statements[:-1])
+        projection = statements[-1].split("INSERT INTO latest_loan_application")[1]
+        assert "FROM written" in projection
+        assert "loan_applications_staging" not in projection
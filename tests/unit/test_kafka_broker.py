@@ -0,0 +1,126 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from aiokafka import TopicPartition
+
+from src.infra.messaging.kafka import KafkaMessageBroker, KafkaMessageConsumer
+
+
+def delivered_future() -> asyncio.Future:
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    return future
+
+
+class TestKafkaMessageBroker:
+
+    @pytest.fixture
+    def producer(self) -> AsyncMock:
+        producer = AsyncMock()
+        producer.send.side_effect = lambda *args, **kwargs: delivered_future()
+        return producer
+
+    @pytest.mark.asyncio
+    async def test_wait_mode_blocks_on_ack(self, producer):
+        broker = KafkaMessageBroker(delivery_mode="wait")
+        broker._producer = producer
+
+        await broker.publish("loan-applications", {"id": "1"}, key="user_1")
+
+        producer.send_and_wait.assert_called_once_with("loan-applications", value={"id": "1"}, key="user_1")
+
+    @pytest.mark.asyncio
+    async def test_background_mode_does_not_wait(self, producer):
+        broker = KafkaMessageBroker(delivery_mode="background")
+        broker._producer = producer
+
+        await broker.publish("loan-applications", {"id": "1"}, key="user_1")
+
+        producer.send.assert_called_once()
+        producer.send_and_wait.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publish_many_sends_before_waiting(self, producer):
+        broker = KafkaMessageBroker(delivery_mode="wait")
+        broker._producer = producer
+
+        await broker.publish_many("loan-applications", [("user_1", {"id": "1"}), ("user_2", {"id": "2"})])
+
+        assert producer.send.call_count == 2
+        producer.send_and_wait.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_background_failures_are_released(self, producer):
+        failed = asyncio.get_running_loop().create_future()
+        producer.send.side_effect = None
+        producer.send.return_value = failed
+        broker = KafkaMessageBroker(delivery_mode="background")
+        broker._producer = producer
+
+        await broker.publish("loan-applications", {"id": "1"})
+        failed.set_exception(RuntimeError("broker down"))
+        await asyncio.sleep(0)
+
+        assert not broker._pending
+
+
+class FakeClient:
+
+    # Tracks the fetch position the way AIOKafkaConsumer does: getmany() moves it past everything it returns
+    def __init__(self, count: int):
+        self.tp = TopicPartition("loan-applications", 0)
+        self.position = 0
+        self._count = count
+
+    async def getmany(self, timeout_ms: int, max_records: int | None = None) -> dict:
+        end = self._count if max_records is None else min(self.position + max_records, self._count)
+        records = [
+            SimpleNamespace(topic=self.tp.topic, partition=self.tp.partition, offset=offset, key=None, value={"offset": offset})
+            for offset in range(self.position, end)
+        ]
+        self.position = end
+        return {self.tp: records} if records else {}
+
+    def seek(self, tp: TopicPartition, offset: int) -> None:
+        self.position = offset
+
+    def highwater(self, tp: TopicPartition) -> int:
+        return self._count
+
+
+class TestKafkaMessageConsumer:
+
+    @pytest.mark.parametrize("enable_auto_commit", [True, False])
+    @pytest.mark.asyncio
+    async def test_position_never_passes_the_last_yielded_record(self, enable_auto_commit):
+        consumer = KafkaMessageConsumer(enable_auto_commit=enable_auto_commit)
+        client = FakeClient(count=10)
+        consumer._consumer = client
+        consumer._running = True
+
+        yielded = []
+        async for record in consumer.records():
+            yielded.append(record.offset)
+            if enable_auto_commit:
+                # What a periodic auto-commit would cover right now
+                assert client.position == record.offset + 1
+            if len(yielded) == 3:
+                consumer.interrupt()
+
+        assert yielded == [0, 1, 2]
+        assert client.position == 3
+
+    @pytest.mark.asyncio
+    async def test_lag_is_measured_from_the_end_of_each_fetch(self):
+        consumer = KafkaMessageConsumer(enable_auto_commit=False)
+        client = FakeClient(count=10)
+        consumer._consumer = client
+        consumer._running = True
+
+        async for _ in consumer.records():
+            consumer.interrupt()
+
+        gauge = consumer._lag_gauges[client.tp]
+        assert gauge._value.get() == 0
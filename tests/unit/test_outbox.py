@@ -0,0 +1,84 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infra.db.outbox.broker import OutboxMessageBroker
+from src.infra.db.outbox.repository import OutboxMessage
+from src.infra.serialization.codecs import decode, get_codec
+from src.relay import main as relay_main
+from src.relay.main import OutboxRelay
+
+
+def session_factory(session: AsyncMock):
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
+class TestOutboxMessageBroker:
+
+    @pytest.mark.asyncio
+    async def test_publish_inserts_encoded_payload(self, sample_application, monkeypatch):
+        session = AsyncMock()
+        repository = AsyncMock()
+        monkeypatch.setattr("src.infra.db.outbox.broker.PostgresOutboxRepository", MagicMock(return_value=repository))
+        broker = OutboxMessageBroker(session_factory(session), codec=get_codec("msgpack"))
+
+        await broker.publish("loan-applications", sample_application, key=sample_application.applicant_id)
+
+        topic, rows = repository.add_many.call_args.args
+        assert topic == "loan-applications"
+        assert rows[0][0] == sample_application.applicant_id
+        assert decode(rows[0][1])["id"] == sample_application.id
+        session.commit.assert_awaited_once()
+
+
+class TestOutboxRelay:
+
+    @pytest.fixture
+    def repository(self, monkeypatch) -> AsyncMock:
+        repository = AsyncMock()
+        repository.claim_unsent.return_value = [
+            OutboxMessage(id=1, topic="loan-applications", key="user_1", payload=b"a"),
+            OutboxMessage(id=2, topic="loan-applications-retry", key="user_2", payload=b"b"),
+            OutboxMessage(id=3, topic="loan-applications", key="user_1", payload=b"c"),
+        ]
+        monkeypatch.setattr(relay_main, "PostgresOutboxRepository", MagicMock(return_value=repository))
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_publishes_per_topic_then_marks_sent(self, repository):
+        session = AsyncMock()
+        broker = AsyncMock()
+        relay = OutboxRelay(broker, session_factory=session_factory(session), batch_size=10)
+
+        assert await relay.relay_once() == 3
+
+        broker.publish_many.assert_any_await("loan-applications", [("user_1", b"a"), ("user_1", b"c")])
+        broker.publish_many.assert_any_await("loan-applications-retry", [("user_2", b"b")])
+        repository.mark_sent.assert_awaited_once_with([1, 2, 3])
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_publish_leaves_rows_unsent(self, repository):
+        session = AsyncMock()
+        broker = AsyncMock()
+        broker.publish_many.side_effect = RuntimeError("broker down")
+        relay = OutboxRelay(broker, session_factory=session_factory(session), batch_size=10)
+
+        with pytest.raises(RuntimeError):
+            await relay.relay_once()
+
+        repository.mark_sent.assert_not_awaited()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_outbox(self, repository):
+        repository.claim_unsent.return_value = []
+        broker = AsyncMock()
+        relay = OutboxRelay(broker, session_factory=session_factory(AsyncMock()), batch_size=10)
+
+        assert await relay.relay_once() == 0
+        broker.publish_many.assert_not_awaited()
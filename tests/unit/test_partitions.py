@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from src.infra.db.partitions import Partition, add_months, parse_bounds, plan_expired, plan_missing
+
+
+NOW = datetime(2026, 10, 18, 12, 30)
+
+
+def monthly(year: int, month: int) -> Partition:
+    lower = datetime(year, month, 1)
+    return Partition(name=f"loan_applications_p{year}_{month:02d}", lower=lower, upper=add_months(lower, 1))
+
+
+class TestPartitionPlanning:
+
+    def test_add_months_crosses_years(self):
+        assert add_months(datetime(2026, 11, 1), 3) == datetime(2027, 2, 1)
+        assert add_months(datetime(2026, 1, 1), -1) == datetime(2025, 12, 1)
+
+    def test_parse_bounds(self):
+        partition = parse_bounds(
+            "loan_applications_p2026_10",
+            "FOR VALUES FROM ('2026-10-01 00:00:00') TO ('2026-11-01 00:00:00')",
+        )
+        legacy = parse_bounds("loan_applications_legacy", "FOR VALUES FROM (MINVALUE) TO ('2026-11-01 00:00:00')")
+
+        assert (partition.lower, partition.upper) == (datetime(2026, 10, 1), datetime(2026, 11, 1))
+        assert legacy.lower is None
+
+    def test_plans_current_and_future_months(self):
+        planned = plan_missing([monthly(2026, 10)], NOW, months_ahead=2)
+
+        assert [partition.name for partition in planned] == ["loan_applications_p2026_11", "loan_applications_p2026_12"]
+
+    def test_skips_months_covered_by_legacy_partition(self):
+        legacy = Partition(name="loan_applications_legacy", lower=None, upper=datetime(2026, 11, 1))
+
+        planned = plan_missing([legacy], NOW, months_ahead=1)
+
+        assert [partition.name for partition in planned] == ["loan_applications_p2026_11"]
+
+    def test_expires_whole_months_past_retention(self):
+        legacy = Partition(name="loan_applications_legacy", lower=None, upper=datetime(2026, 5, 1))
+        existing = [legacy, monthly(2026, 5), monthly(2026, 6), monthly(2026, 10)]
+
+        expired = plan_expired(existing, NOW, retention_months=4)
+
+        assert [partition.name for partition in expired] == ["loan_applications_legacy", "loan_applications_p2026_05"]
+        assert plan_expired(existing, NOW, retention_months=0) == []
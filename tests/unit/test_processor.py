@@ -98,3 +98,33 @@ class TestLoanApplicationProcessor:
 
         assert result.status == LoanApplicationStatus.REJECTED
         assert result.rejection_reason is not None
+
+    def test_process_batch_matches_scalar_path(self, processor):
+        amounts = [-1, 0, 0.01, 10000, 50000, 50000.01, 1_000_000, 1_000_000.5, float("nan")]
+        terms = [0, 1, 12, 60, 61]
+        applicant_ids = ["user_123", "", "   "]
+        cases = [(a, t, i) for a in amounts for t in terms for i in applicant_ids]
+
+        decision = processor.process_batch(
+            amounts=[amount for amount, _, _ in cases],
+            term_months=[term for _, term, _ in cases],
+            applicant_ids=[applicant_id for _, _, applicant_id in cases],
+        )
+
+        for (amount, term, applicant_id), status, reason in zip(cases, decision.statuses, decision.rejection_reasons):
+            expected = processor.process(
+                LoanApplication(applicant_id=applicant_id, amount=amount, term_months=term)
+            )
+            assert (status, reason) == (expected.status, expected.rejection_reason)
+
+    def test_process_many_applies_decisions(self, processor):
+        approved = LoanApplication(applicant_id="user_1", amount=10000, term_months=12)
+        rejected = LoanApplication(applicant_id="user_2", amount=100000, term_months=12)
+
+        processor.process_many([approved, rejected])
+
+        assert approved.status == LoanApplicationStatus.APPROVED
+        assert approved.rejection_reason is None
+        assert rejected.status == LoanApplicationStatus.REJECTED
+        assert rejected.rejection_reason == "Amount exceeds approval threshold of 50000"
+        assert approved.processed_at is not None
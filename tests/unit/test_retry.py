@@ -0,0 +1,121 @@
+import time
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.consumer.main import ApplicationConsumerService
+from src.consumer.retry import FailureRouter, RetryTierWorker, retry_topic
+from src.domain.exceptions import ValidationError
+from src.domain.ports import ConsumedMessage, MessageBroker, MessageConsumer
+
+
+MESSAGE = {"id": "4b4c1f0e-8a43-4b8e-9d0b-6f3a7f1c2d11", "applicant_id": "user_1", "amount": 10000, "term_months": 12, "created_at": "2026-10-18T00:00:00"}
+
+
+@asynccontextmanager
+async def fake_session():
+    yield MagicMock()
+
+
+class TestFailureRouter:
+
+    @pytest.fixture
+    def broker(self) -> AsyncMock:
+        return AsyncMock(spec=MessageBroker)
+
+    @pytest.fixture
+    def router(self, broker) -> FailureRouter:
+        return FailureRouter(broker, "loan-applications", [5, 30], "loan-applications.dlq")
+
+    @pytest.mark.asyncio
+    async def test_transient_error_goes_to_next_tier(self, router, broker):
+        await router.route(MESSAGE, ConnectionError("db down"), attempt=1)
+
+        topic, envelope = broker.publish.call_args.args
+        assert topic == retry_topic("loan-applications", 30) == "loan-applications.retry.30s"
+        assert envelope["attempt"] == 2
+        assert envelope["application"] == MESSAGE
+        assert envelope["error"] == {"type": "ConnectionError", "message": "db down"}
+        assert broker.publish.call_args.kwargs["key"] == "user_1"
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_are_dead_lettered(self, router, broker):
+        await router.route(MESSAGE, ConnectionError("db down"), attempt=2)
+
+        assert broker.publish.call_args.args[0] == "loan-applications.dlq"
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_skips_retries(self, router, broker):
+        await router.route(MESSAGE, ValidationError("Amount must be positive"))
+
+        topic, envelope = broker.publish.call_args.args
+        assert topic == "loan-applications.dlq"
+        assert "retry_at" not in envelope
+
+
+class TestRetryTierWorker:
+
+    @pytest.mark.asyncio
+    async def test_due_record_is_handled_then_committed(self):
+        record = ConsumedMessage(
+            topic="loan-applications.retry.5s",
+            partition=0,
+            offset=7,
+            key="user_1",
+            value={"application": MESSAGE, "attempt": 1, "retry_at": time.time() - 1},
+        )
+
+        async def records():
+            yield record
+
+        consumer = AsyncMock(spec=MessageConsumer)
+        consumer.records = records
+        handler = AsyncMock()
+
+        await RetryTierWorker(consumer, handler).run()
+
+        handler.assert_awaited_once_with(record.value)
+        consumer.commit.assert_awaited_once_with({("loan-applications.retry.5s", 0): 8})
+        consumer.stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_retried_in_place(self):
+        record = ConsumedMessage(
+            topic="loan-applications.retry.5s",
+            partition=0,
+            offset=7,
+            key="user_1",
+            value={"application": MESSAGE, "attempt": 1},
+        )
+
+        async def records():
+            yield record
+
+        consumer = AsyncMock(spec=MessageConsumer)
+        consumer.records = records
+        consumer.commit.side_effect = [ConnectionError("kafka down"), None]
+        handler = AsyncMock(side_effect=[ConnectionError("kafka down"), None])
+
+        with patch("src.consumer.retry.asyncio.sleep") as sleep:
+            await RetryTierWorker(consumer, handler).run()
+
+        assert handler.await_count == 2
+        assert consumer.commit.await_count == 2
+        assert [call.args[0] for call in sleep.await_args_list] == [1.0, 2.0]
+
+
+class TestConsumerRouting:
+
+    @pytest.mark.asyncio
+    async def test_failed_retry_is_routed_with_its_attempt(self, mock_cache, mock_repository):
+        service = ApplicationConsumerService(AsyncMock(spec=MessageConsumer))
+        service._cache = mock_cache
+        service._failure_router = AsyncMock(spec=FailureRouter)
+        error = ConnectionError("db down")
+        mock_repository.save.side_effect = error
+
+        with patch("src.consumer.main.async_session", fake_session), \
+             patch("src.consumer.main.create_repository", return_value=mock_repository):
+            await service.process_retry({"application": MESSAGE, "attempt": 1})
+
+        service._failure_router.route.assert_awaited_once_with(MESSAGE, error, 1)
@@ -0,0 +1,127 @@
+import json
+import os
+import pytest
+
+from src.domain.exceptions import RuleDefinitionError
+from src.domain.applications.loan.entity import LoanApplication
+from src.domain.applications.loan.processor import LoanApplicationProcessor
+from src.domain.applications.loan.rules import CompiledRuleSet
+from src.domain.applications.loan.value_objects import LoanApplicationStatus
+from src.infra.rules.loader import RuleSetReloader, load_rule_set
+
+
+DEFINITION = {
+    "rules": [
+        {
+            "name": "over_threshold",
+            "when": {"amount": {"gt": 50000}},
+            "then": {"status": "rejected", "reason": "Amount exceeds approval threshold of 50000"},
+        },
+        {
+            "name": "recently_rejected",
+            "when": {"previous_status": {"eq": "rejected"}, "amount": {"gt": 25000}},
+            "then": {"status": "rejected", "reason": "Previous application was rejected"},
+        },
+    ],
+    "default": {"status": "approved"},
+}
+
+
+class TestCompiledRuleSet:
+
+    @pytest.fixture
+    def rule_set(self) -> CompiledRuleSet:
+        return CompiledRuleSet.compile(DEFINITION)
+
+    def test_first_matching_rule_decides(self, rule_set):
+        outcome = rule_set.decide(LoanApplication(applicant_id="user_1", amount=60000, term_months=12))
+
+        assert outcome.status == LoanApplicationStatus.REJECTED
+        assert outcome.rule == "over_threshold"
+
+    def test_default_outcome(self, rule_set):
+        outcome = rule_set.decide(LoanApplication(applicant_id="user_1", amount=30000, term_months=12))
+
+        assert outcome.status == LoanApplicationStatus.APPROVED
+        assert outcome.reason is None
+
+    def test_history_predicate(self, rule_set):
+        previous = LoanApplication(
+            applicant_id="user_1",
+            amount=10000,
+            term_months=12,
+            status=LoanApplicationStatus.REJECTED,
+        )
+
+        outcome = rule_set.decide(LoanApplication(applicant_id="user_1", amount=30000, term_months=12), previous)
+
+        assert outcome.rule == "recently_rejected"
+        assert rule_set.needs_history
+
+    @pytest.mark.parametrize("definition", [
+        {"rules": [{"when": {"income": {"gt": 1}}, "then": {"status": "approved"}}]},
+        {"rules": [{"when": {"amount": {"between": 1}}, "then": {"status": "approved"}}]},
+        {"rules": [{"when": {"amount": {"gt": "__import__('os')"}}, "then": {"status": "approved"}}]},
+        {"rules": [{"when": {"amount": {"gt": 1}}, "then": {"status": "rejected"}}]},
+        {"rules": [{"when": {"previous_status": {"eq": "unknown"}}, "then": {"status": "approved"}}]},
+    ])
+    def test_invalid_definitions(self, definition):
+        with pytest.raises(RuleDefinitionError):
+            CompiledRuleSet.compile(definition)
+
+    def test_batch_matches_scalar_path(self, processing_rules):
+        processor = LoanApplicationProcessor(processing_rules, decision_rules=CompiledRuleSet.compile(DEFINITION))
+        rejected = LoanApplication(
+            applicant_id="user_1",
+            amount=1000,
+            term_months=12,
+            status=LoanApplicationStatus.REJECTED,
+        )
+        applications = [
+            LoanApplication(applicant_id=f"user_{index % 2}", amount=amount, term_months=12)
+            for index, amount in enumerate([-1, 1000, 30000, 30000, 60000, 2_000_000])
+        ]
+
+        batch = [LoanApplication.from_dict(application.to_dict()) for application in applications]
+        processor.process_many(batch, {"user_1": rejected})
+
+        for application, processed in zip(applications, batch):
+            previous = rejected if application.applicant_id == "user_1" else None
+            expected = processor.process(application, previous)
+            assert (processed.status, processed.rejection_reason) == (expected.status, expected.rejection_reason)
+
+
+class TestRuleSetReloader:
+
+    @pytest.fixture
+    def rules_file(self, tmp_path) -> str:
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps(DEFINITION))
+        return str(path)
+
+    def test_load_json(self, rules_file):
+        assert len(load_rule_set(rules_file).outcomes) == 3
+
+    def test_reloads_on_change(self, rules_file):
+        reloaded = []
+        reloader = RuleSetReloader(rules_file, on_reload=reloaded.append, interval_seconds=1)
+
+        assert not reloader.reload_if_changed()
+
+        with open(rules_file, "w") as f:
+            json.dump({"rules": [], "default": {"status": "approved"}}, f)
+        os.utime(rules_file, ns=(0, os.stat(rules_file).st_mtime_ns + 1))
+
+        assert reloader.reload_if_changed()
+        assert len(reloaded[0].outcomes) == 1
+
+    def test_keeps_last_good_rules_on_error(self, rules_file):
+        reloaded = []
+        reloader = RuleSetReloader(rules_file, on_reload=reloaded.append, interval_seconds=1)
+
+        with open(rules_file, "w") as f:
+            f.write("{not json")
+        os.utime(rules_file, ns=(0, os.stat(rules_file).st_mtime_ns + 1))
+
+        assert not reloader.reload_if_changed()
+        assert reloaded == []
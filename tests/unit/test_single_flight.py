@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+
+from src.domain.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_followers_share_leader_result(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(single_flight.do("key", load) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert len(single_flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_followers(self):
+        single_flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(*(single_flight.do("key", load) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(single_flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_do_not_share(self):
+        single_flight = SingleFlight()
+
+        async def load(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            single_flight.do("a", lambda: load("a")),
+            single_flight.do("b", lambda: load("b")),
+        )
+
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_fail_followers(self):
+        single_flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(single_flight.do("key", load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do("key", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "value"
+        assert leader.cancelled()
+        assert len(single_flight) == 0
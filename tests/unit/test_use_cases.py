@@ -9,7 +9,9 @@ from src.domain.applications.loan.use_cases import (
     GetApplicationStatusUseCase,
     ProcessApplicationUseCase,
 )
+from src.domain.applications.loan.idempotency import idempotency_key
 from src.domain.exceptions import ValidationError
+from src.domain.ports import DedupeStore
 
 
 class TestSubmitApplicationUseCase:
@@ -84,6 +86,7 @@ class TestProcessApplicationUseCase:
             "amount": 10000,
             "term_months": 12,
             "status": "pending",
+            "created_at": "2026-10-18T00:00:00",
         }
 
         mock_repository.save.return_value = LoanApplication(
@@ -97,3 +100,81 @@ class TestProcessApplicationUseCase:
 
         mock_repository.save.assert_called_once()
         assert result.status == LoanApplicationStatus.APPROVED
+
+    @pytest.mark.asyncio
+    async def test_process_many_applications(self, use_case, mock_repository):
+        applications_data = [
+            {"applicant_id": "user_1", "amount": 10000, "term_months": 12, "created_at": "2026-10-18T00:00:00"},
+            {"applicant_id": "user_2", "amount": 100000, "term_months": 12, "created_at": "2026-10-18T00:00:00"},
+        ]
+        mock_repository.save_many.side_effect = lambda applications: applications
+
+        result = await use_case.execute_many(applications_data)
+
+        mock_repository.save_many.assert_called_once()
+        mock_repository.save.assert_not_called()
+        assert [app.status for app in result] == [LoanApplicationStatus.APPROVED, LoanApplicationStatus.REJECTED]
+
+    @pytest.mark.asyncio
+    async def test_message_without_created_at_is_rejected(self, use_case, mock_repository):
+        with pytest.raises(ValidationError):
+            await use_case.execute({"applicant_id": "user_1", "amount": 10000, "term_months": 12})
+
+        mock_repository.save.assert_not_called()
+
+
+class TestIdempotentProcessing:
+
+    APPLICATION = {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "applicant_id": "user_123",
+        "amount": 10000,
+        "term_months": 12,
+        "created_at": "2024-01-02T03:04:05",
+    }
+
+    @pytest.fixture
+    def dedupe_store(self) -> AsyncMock:
+        store = AsyncMock(spec=DedupeStore)
+        store.seen_many.return_value = set()
+        return store
+
+    @pytest.fixture
+    def use_case(self, mock_repository, processor, dedupe_store):
+        return ProcessApplicationUseCase(mock_repository, processor, dedupe_store)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_skips_database(self, use_case, mock_repository, dedupe_store):
+        dedupe_store.seen_many.return_value = {idempotency_key(LoanApplication.from_dict(self.APPLICATION))}
+
+        result = await use_case.execute(self.APPLICATION)
+
+        assert result is None
+        mock_repository.save.assert_not_called()
+        dedupe_store.mark_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_marked_after_save(self, use_case, mock_repository, dedupe_store):
+        mock_repository.save.side_effect = lambda application: application
+
+        await use_case.execute(self.APPLICATION)
+
+        mock_repository.save.assert_called_once()
+        dedupe_store.mark_many.assert_called_once_with([idempotency_key(LoanApplication.from_dict(self.APPLICATION))])
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_seen_and_repeated(self, use_case, mock_repository, dedupe_store):
+        seen = {**self.APPLICATION, "id": "550e8400-e29b-41d4-a716-446655440001"}
+        dedupe_store.seen_many.return_value = {idempotency_key(LoanApplication.from_dict(seen))}
+        mock_repository.save_many.side_effect = lambda applications: applications
+
+        result = await use_case.execute_many([self.APPLICATION, self.APPLICATION, seen])
+
+        assert [str(application.id) for application in result] == [self.APPLICATION["id"]]
+
+    def test_key_changes_with_content(self):
+        application = LoanApplication.from_dict(self.APPLICATION)
+        changed = LoanApplication.from_dict({**self.APPLICATION, "amount": 20000})
+
+        assert idempotency_key(application) == idempotency_key(LoanApplication.from_dict(self.APPLICATION))
+        assert idempotency_key(application) != idempotency_key(changed)